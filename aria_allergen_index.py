@@ -0,0 +1,166 @@
+"""ARIA Ingredient Allergen Index
+
+This module resolves recipe ingredients to allergen and diet classes (e.g. "ghee" -> milk,
+"peanut butter" -> peanuts, "bacon" -> meat, pork) and checks them against the active dietary
+restrictions and the conditions of every household member in one pass.
+
+The index is compiled from two reference datasets (see aria_data_store):
+
+    * ingredient_classes - {"ingredient": <term>, "classes": [<class>, ...]}
+    * restriction_classes - {"restriction": <restriction or condition>, "forbids": [<class>, ...]}
+
+Ingredient terms are matched longest-first through the hashed token trie of aria_keyword_matcher,
+so "peanut butter" resolves to peanuts rather than milk, and the cost of a lookup does not grow
+with the size of the ingredient vocabulary. A restriction that is itself a class name (e.g.
+"peanuts", "eggs") forbids that class. Medications are restrictions too: every drug with a food
+interaction forbids the classes given by aria_drug_interactions (e.g. "simvastatin" -> grapefruit).
+
+An ingredient line can exclude classes itself: "gluten-free pasta", "dairy-free cheese", "vegan
+butter" or "sauce without cream" do not violate the restriction their modifier satisfies (see
+aria_input_guard.excluded_terms).
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * IngredientIndex - compiled ingredient -> class index with restriction resolution
+    * get_ingredient_index - process-wide IngredientIndex, rebuilt when a dataset is swapped
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from aria_data_store import get_dataset
+from aria_drug_interactions import get_interaction_index
+from aria_input_guard import excluded_terms
+from aria_keyword_matcher import KeywordMatcher
+
+
+class IngredientIndex:
+    """Ingredient -> allergen/diet class index.
+
+    Parameters
+    ----------
+    ingredient_classes : iterable of dict
+        Records with an "ingredient" term and its "classes".
+    restriction_classes : iterable of dict
+        Records with a "restriction" (or condition) and the classes it "forbids"; an optional
+        "kind" of "interaction" marks medication records.
+    allergens : iterable of str, optional
+        Class names reported as allergies rather than diet restrictions.
+    """
+
+    def __init__(self, ingredient_classes: Iterable[dict], restriction_classes: Iterable[dict],
+                 allergens: Optional[Iterable[str]] = None):
+        self._ingredients = KeywordMatcher()
+        self.classes: Set[str] = set()
+        for record in ingredient_classes:
+            for class_name in record['classes']:
+                self._ingredients.add(record['ingredient'], class_name)
+                self.classes.add(class_name)
+        self._forbids: Dict[str, List[str]] = {}
+        self._interactions: Set[str] = set()
+        self._restrictions = KeywordMatcher()
+        for record in restriction_classes:
+            name = record['restriction'].strip().lower()
+            self._forbids[name] = list(record['forbids'])
+            self._restrictions.add(name, name)
+            if record.get('kind') == 'interaction':
+                self._interactions.add(name)
+        for class_name in self.classes:
+            self._forbids.setdefault(class_name, [class_name])
+            self._restrictions.add(class_name, class_name)
+        self.allergens: Set[str] = set(allergens or [])
+
+    def __len__(self) -> int:
+        return len(self._ingredients)
+
+    def classify(self, ingredient: str) -> List[Tuple[str, List[str]]]:
+        """Returns the (matched term, classes) pairs found in one ingredient line."""
+        return [(term, categories) for term, categories, _, _
+                in self._ingredients.finditer(ingredient, longest_only=True)]
+
+    def forbidden_classes(self, restriction: str) -> List[str]:
+        """Returns the classes forbidden by a free-text restriction such as "no dairy or peanuts"."""
+        return [class_name for class_name, _ in self._forbidden_by_term(restriction)]
+
+    def classes_excluded_by(self, terms: Iterable[str]) -> Set[str]:
+        """Returns the classes excluded by modifier terms such as ["gluten"] or ["vegan"]: those they forbid and their own."""
+        text = ' '.join(terms)
+        if not text:
+            return set()
+        excluded = set(self.forbidden_classes(text))
+        excluded.update(class_name for _, classes in self.classify(text) for class_name in classes)
+        return excluded
+
+    def _forbidden_by_term(self, restriction: str) -> List[Tuple[str, str]]:
+        # (forbidden class, restriction term that forbids it), first term wins
+        forbidden: Dict[str, str] = {}
+        for term, _, _, _ in self._restrictions.finditer(restriction, longest_only=True):
+            for class_name in self._forbids.get(term, []):
+                forbidden.setdefault(class_name, term)
+        return list(forbidden.items())
+
+    def find_violations(self, ingredients: Iterable[str],
+                        restrictions: Iterable[Tuple[str, str]]) -> List[str]:
+        """Checks ingredients against every active restriction in one pass over the ingredients.
+
+        Parameters
+        ----------
+        ingredients : iterable of str
+            Extracted ingredient lines.
+        restrictions : iterable of (str, str)
+            (label, restriction) pairs, e.g. ("", "vegan") for the session or
+            ("Ann", "celiac disease") for a member condition.
+
+        Returns
+        -------
+        list of str
+            one human readable violation per (label, restriction, class), in ingredient order
+        """
+        # class -> restrictions forbidding it, built once for all members
+        forbidden_by: Dict[str, List[Tuple[str, str, str]]] = {}
+        for label, restriction in restrictions:
+            for class_name, term in self._forbidden_by_term(restriction):
+                forbidden_by.setdefault(class_name, []).append((label, restriction, term))
+        if not forbidden_by:
+            return []
+        violations: List[str] = []
+        for ingredient in ingredients:
+            # "gluten-free pasta" is still pasta, but not wheat
+            excluded = self.classes_excluded_by(excluded_terms(ingredient))
+            for term, classes in self.classify(ingredient):
+                for class_name in classes:
+                    if class_name in excluded:
+                        continue
+                    for label, restriction, restriction_term in forbidden_by.get(class_name, []):
+                        prefix = f"{label}: " if label else ""
+                        if restriction_term in self._interactions:
+                            violation = f"{prefix}{restriction} interaction ({class_name}: {term})"
+                        elif restriction_term == class_name and class_name in self.allergens:
+                            violation = f"{prefix}{restriction} allergy ({term})"
+                        else:
+                            violation = f"{prefix}{restriction} restriction ({class_name}: {term})"
+                        if violation not in violations:
+                            violations.append(violation)
+        return violations
+
+_index: Optional[IngredientIndex] = None
+_index_generations: Optional[Tuple[int, ...]] = None
+_index_interactions = None
+_index_lock = threading.Lock()
+
+def get_ingredient_index() -> IngredientIndex:
+    """Returns the shared IngredientIndex, rebuilt only when one of its datasets (or the interaction index) changes."""
+    global _index, _index_generations, _index_interactions
+    datasets = [get_dataset(name) for name in ('ingredient_classes', 'restriction_classes', 'allergens')]
+    generations = tuple(dataset.generation for dataset in datasets)
+    interactions = get_interaction_index()
+    if _index is None or generations != _index_generations or interactions is not _index_interactions:
+        with _index_lock:
+            if _index is None or generations != _index_generations or interactions is not _index_interactions:
+                ingredient_classes, restriction_classes, allergens = datasets
+                _index = IngredientIndex(ingredient_classes.values(),
+                                         list(restriction_classes.values()) + interactions.restriction_records(),
+                                         allergens.keys())
+                _index_generations = generations
+                _index_interactions = interactions
+    return _index
@@ -0,0 +1,136 @@
+"""ARIA Session Command Parser
+
+This module parses the structured MealPlanner session commands in a single pass over the user
+message. One scanner finds every command header; each command body is then tokenized into
+``key=value`` fields, so member fields may come in any order, may be omitted, and several members
+can be added in one message.
+
+Supported commands (case-insensitive, anywhere in the message)::
+
+    add dietary restriction: <restriction>
+    add preference: <preference>
+    add taste preference: likes <a, b>; dislikes <c>
+    add member: name=<name>, age=<n>, weight=<n>, calories=<n>, medications=<a, b>, illnesses=<..>, treatments=<..>
+    add members: name=<name>, age=<n>; name=<name>, calories=<n>
+
+Members are separated by ``;`` or by a repeated ``name=`` field.
+
+This file can be imported as a module and contains the following function(s):
+
+    * parse_session_commands - returns the commands found in a message, in order
+    * parse_member_fields - tokenizes a member command body into member dictionaries
+"""
+import re
+from typing import Dict, List, Tuple
+
+_COMMAND_HEADER = re.compile(
+    r"\badd\s+(dietary\s+restriction|taste\s+preference|preference|members?)\s*:", re.IGNORECASE)
+_FIELD = re.compile(r"(?<![^\s,;])([a-z_]+)\s*=", re.IGNORECASE)
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+# accepted field spellings -> member dictionary key
+MEMBER_FIELDS: Dict[str, str] = {
+    'name': 'name',
+    'age': 'age',
+    'weight': 'weight',
+    'calories': 'calorie_requirement',
+    'calorie': 'calorie_requirement',
+    'calorie_requirement': 'calorie_requirement',
+    'kcal': 'calorie_requirement',
+    'medications': 'medications',
+    'medication': 'medications',
+    'illnesses': 'illnesses',
+    'illness': 'illnesses',
+    'treatments': 'treatments',
+    'treatment': 'treatments',
+}
+_NUMERIC_FIELDS = ('age', 'weight', 'calorie_requirement')
+_LIST_FIELDS = ('medications', 'illnesses', 'treatments')
+_COMMAND_NAMES = {
+    'dietary restriction': 'dietary_restriction',
+    'taste preference': 'taste_preference',
+    'preference': 'preference',
+    'member': 'member',
+    'members': 'member',
+}
+
+def _to_number(value: str):
+    match = _NUMBER.search(value)
+    if not match:
+        return None
+    number = float(match.group())
+    return int(number) if number.is_integer() else number
+
+def parse_member_fields(body: str) -> List[Dict[str, object]]:
+    """Tokenizes a member command body into one dictionary per member.
+
+    Only the fields present in the body are set; unknown keys are ignored and members without a
+    name are dropped.
+
+    Parameters
+    ----------
+    body : str
+        The text following ``add member:``.
+
+    Returns
+    -------
+    list of dict
+        members keyed as in MealPlanner.session_data['members_for_meal']
+    """
+    members: List[Dict[str, object]] = []
+    current: Dict[str, object] = {}
+    fields = list(_FIELD.finditer(body))
+    for index, field in enumerate(fields):
+        end = fields[index + 1].start() if index + 1 < len(fields) else len(body)
+        raw_value = body[field.end():end]
+        # a ';' inside the value closes the current member
+        value, separator, _ = raw_value.partition(';')
+        # free text on the following lines is not part of the field
+        value = value.split('\n', 1)[0].strip().strip(',').strip()
+        key = MEMBER_FIELDS.get(field.group(1).lower())
+        if key == 'name' and 'name' in current:
+            members.append(current)
+            current = {}
+        if key in _NUMERIC_FIELDS:
+            number = _to_number(value)
+            if number is not None:
+                current[key] = number
+        elif key in _LIST_FIELDS:
+            current[key] = [item.strip().lower() for item in value.split(',') if item.strip()]
+        elif key == 'name' and value:
+            current[key] = value
+        if separator and current:
+            members.append(current)
+            current = {}
+    if current:
+        members.append(current)
+    return [member for member in members if member.get('name')]
+
+def parse_session_commands(text: str) -> List[Tuple[str, object]]:
+    """Returns the session commands found in `text`, in the order they appear.
+
+    Parameters
+    ----------
+    text : str
+        The user message.
+
+    Returns
+    -------
+    list of (str, object)
+        ('dietary_restriction' | 'preference' | 'taste_preference', lowercased value) or
+        ('member', member dictionary) tuples
+    """
+    commands: List[Tuple[str, object]] = []
+    headers = list(_COMMAND_HEADER.finditer(text))
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        body = text[header.end():end]
+        command = _COMMAND_NAMES[' '.join(header.group(1).lower().split())]
+        if command == 'member':
+            commands.extend(('member', member) for member in parse_member_fields(body))
+            continue
+        # value commands take the rest of their line
+        value = body.split('\n', 1)[0].strip().lower()
+        if value:
+            commands.append((command, value))
+    return commands
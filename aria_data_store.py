@@ -0,0 +1,330 @@
+"""ARIA Reference Data Store
+
+This module compiles the read-only reference datasets used by the scenarios (travel advisories,
+allergens, keyword vocabularies, gazetteers) into a compact binary file that every worker process
+memory-maps read-only. The pages are shared through the OS page cache, so resident memory does not
+grow with the number of workers, and a dataset is swapped by atomically replacing its file.
+
+The JSON sources live in the ``data`` directory next to this file. A source is either a list of
+strings (each string is its own key and value) or a list of records keyed by one of their fields.
+Compiled files are meant to be built with the package (``python aria_data_store.py``); one that is
+missing or older than its source is rebuilt on first use, in the user cache directory (CACHE_DIR)
+when the package directory is read-only.
+
+A worker checks whether the file of a dataset was replaced at most every REFRESH_INTERVAL seconds
+on lookup; `reload_datasets` re-maps every replaced file at once.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * compile_dataset - writes (key, value) entries to a binary dataset file atomically
+    * compile_source - compiles one registered JSON source into its binary dataset file
+    * MappedDataset - a read-only, memory-mapped view over a compiled dataset
+    * get_dataset - returns the process-wide MappedDataset for a registered dataset name
+    * reload_datasets - re-maps every open dataset whose file was replaced
+
+Binary layout (little endian)::
+
+    header   : magic (8s) | entry count (I)
+    entries  : count x (key offset, key length, value offset, value length) (IIII), source order
+    sorted   : count x entry number (I), ordered by the UTF-8 bytes of the casefolded key
+    heap     : UTF-8 keys followed by compact JSON values
+"""
+import os
+import json
+import mmap
+import struct
+import time
+import tempfile
+import threading
+from typing import Optional, Dict, List, Iterable, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+# where datasets are compiled when DATA_DIR cannot be written (read-only installs)
+CACHE_DIR = os.environ.get('ARIA_DATA_CACHE') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'aria')
+COMPILED_SUFFIX = '.ariadb'
+# seconds between two checks of a dataset file for replacement on lookup
+REFRESH_INTERVAL = 2.0
+
+_MAGIC = b'ARIADB01'
+_HEADER = struct.Struct('<8sI')
+_ENTRY = struct.Struct('<IIII')
+_ORDER = struct.Struct('<I')
+
+# dataset name -> key field of each record, or None when the source is a plain list of strings
+DATASET_SOURCES: Dict[str, Optional[str]] = {
+    'travel_advisories': 'country',
+    'allergens': None,
+    'cuisines': None,
+    'restrictions': None,
+    'medications': 'drug',
+    'food_interactions': 'drug_class',
+    'ingredient_classes': 'ingredient',
+    'restriction_classes': 'restriction',
+    'nutrition': 'food',
+    'recipes': 'name',
+    'grocery_prices_us': 'item',
+    'grocery_prices_in': 'item',
+    'topic_examples': 'text',
+    'gazetteer': 'name',
+}
+
+def compile_dataset(path: str, entries: Iterable[Tuple[str, object]]) -> int:
+    """Writes (key, value) entries to a binary dataset file, replacing `path` atomically.
+
+    Parameters
+    ----------
+    path : str
+        Destination file of the compiled dataset.
+    entries : iterable of (str, object)
+        Keys are casefolded before indexing; values must be JSON serializable.
+
+    Returns
+    -------
+    int
+        the number of entries written
+    """
+    keys: List[bytes] = []
+    values: List[bytes] = []
+    for key, value in entries:
+        keys.append(key.strip().casefold().encode('utf-8'))
+        values.append(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    count = len(keys)
+    heap_offset = _HEADER.size + count * (_ENTRY.size + _ORDER.size)
+    table = bytearray()
+    heap = bytearray()
+    for key, value in zip(keys, values):
+        key_offset = heap_offset + len(heap)
+        heap += key
+        value_offset = heap_offset + len(heap)
+        heap += value
+        table += _ENTRY.pack(key_offset, len(key), value_offset, len(value))
+    # stable sort keeps the first occurrence of a duplicate key first
+    order = sorted(range(count), key=lambda i: keys[i])
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', suffix=COMPILED_SUFFIX, dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, count))
+            f.write(table)
+            f.write(b''.join(_ORDER.pack(i) for i in order))
+            f.write(heap)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return count
+
+def _source_path(name: str) -> str:
+    return os.path.join(DATA_DIR, f"{name}.json")
+
+def _compiled_path(name: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or DATA_DIR, f"{name}{COMPILED_SUFFIX}")
+
+def compile_source(name: str, directory: Optional[str] = None) -> str:
+    """Compiles the registered JSON source of dataset `name` and returns the compiled file path.
+
+    The file is written to `directory`, by default DATA_DIR or, if that cannot be written, CACHE_DIR.
+    """
+    if name not in DATASET_SOURCES:
+        raise KeyError(f"Unknown dataset '{name}'")
+    key_field = DATASET_SOURCES[name]
+    with open(_source_path(name), encoding='utf-8') as f:
+        records = json.load(f)
+    if key_field is None:
+        entries = [(record, record) for record in records]
+    else:
+        entries = [(record[key_field], record) for record in records]
+    path = _compiled_path(name, directory)
+    try:
+        count = compile_dataset(path, entries)
+    except OSError as e:
+        if directory is not None:
+            raise
+        print(f"aria_data_store: Cannot write {path} ({e}), compiling into {CACHE_DIR}")
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = _compiled_path(name, CACHE_DIR)
+        count = compile_dataset(path, entries)
+    print(f"aria_data_store: Compiled {count} entries of '{name}' into {path}")
+    return path
+
+class MappedDataset:
+    """Read-only, memory-mapped view over a compiled dataset.
+
+    Lookups binary-search the sorted key table directly in the mapping and only decode the
+    matching value, so no copy of the dataset is materialized on the Python heap. `refresh`
+    re-maps the file when it has been replaced on disk; `refresh_if_due` does the same at most
+    every REFRESH_INTERVAL seconds.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        # the mapping and its entry count are swapped together so concurrent readers see one file
+        self._view = (None, 0)
+        self._stat_key = None
+        self._next_check = time.monotonic() + REFRESH_INTERVAL
+        # incremented on every (re)map so derived indexes know when to rebuild
+        self.generation = 0
+        self._open()
+
+    def _open(self):
+        f = open(self.path, 'rb')
+        try:
+            st = os.fstat(f.fileno())
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            f.close()
+            raise
+        magic, count = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            mapped.close()
+            f.close()
+            raise ValueError(f"{self.path} is not a compiled ARIA dataset")
+        old_file = self._file
+        self._file, self._view = f, (mapped, count)
+        self._stat_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        self.generation += 1
+        # readers holding the old mapping keep working until it is garbage collected
+        if old_file is not None:
+            old_file.close()
+
+    def refresh(self) -> bool:
+        """Re-maps the dataset if its file was replaced. Returns True when a new file was mapped."""
+        self._next_check = time.monotonic() + REFRESH_INTERVAL
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        if (st.st_ino, st.st_mtime_ns, st.st_size) == self._stat_key:
+            return False
+        with self._lock:
+            st = os.stat(self.path)
+            if (st.st_ino, st.st_mtime_ns, st.st_size) != self._stat_key:
+                self._open()
+                print(f"MappedDataset: Reloaded {self.path}")
+                return True
+        return False
+
+    def refresh_if_due(self) -> bool:
+        """Like `refresh`, but only stats the file when REFRESH_INTERVAL has passed since the last check."""
+        if time.monotonic() < self._next_check:
+            return False
+        return self.refresh()
+
+    def __len__(self) -> int:
+        return self._view[1]
+
+    def _entry(self, mapped, index: int) -> Tuple[int, int, int, int]:
+        return _ENTRY.unpack_from(mapped, _HEADER.size + index * _ENTRY.size)
+
+    def _find(self, view, key: bytes) -> int:
+        mapped, count = view
+        order_base = _HEADER.size + count * _ENTRY.size
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (index,) = _ORDER.unpack_from(mapped, order_base + mid * _ORDER.size)
+            key_offset, key_length, _, _ = self._entry(mapped, index)
+            if mapped[key_offset:key_offset + key_length] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < count:
+            (index,) = _ORDER.unpack_from(mapped, order_base + lo * _ORDER.size)
+            key_offset, key_length, _, _ = self._entry(mapped, index)
+            if mapped[key_offset:key_offset + key_length] == key:
+                return index
+        return -1
+
+    def get(self, key: str, default=None):
+        """Returns the value stored under the casefolded `key`, or `default`."""
+        view = self._view
+        index = self._find(view, key.strip().casefold().encode('utf-8'))
+        if index < 0:
+            return default
+        mapped = view[0]
+        _, _, value_offset, value_length = self._entry(mapped, index)
+        return json.loads(mapped[value_offset:value_offset + value_length])
+
+    def __contains__(self, key) -> bool:
+        if not isinstance(key, str):
+            return False
+        return self._find(self._view, key.strip().casefold().encode('utf-8')) >= 0
+
+    def keys(self) -> Iterable[str]:
+        """Yields the casefolded keys in source order."""
+        mapped, count = self._view
+        for index in range(count):
+            key_offset, key_length, _, _ = self._entry(mapped, index)
+            yield mapped[key_offset:key_offset + key_length].decode('utf-8')
+
+    def values(self) -> Iterable[object]:
+        """Yields the decoded values in source order."""
+        mapped, count = self._view
+        for index in range(count):
+            _, _, value_offset, value_length = self._entry(mapped, index)
+            yield json.loads(mapped[value_offset:value_offset + value_length])
+
+    def __iter__(self):
+        return self.values()
+
+    def close(self):
+        mapped = self._view[0]
+        if mapped is not None:
+            mapped.close()
+            self._file.close()
+            self._file, self._view = None, (None, 0)
+
+_datasets: Dict[str, MappedDataset] = {}
+_datasets_lock = threading.Lock()
+
+def _is_fresh(compiled: str, name: str) -> bool:
+    if not os.path.exists(compiled):
+        return False
+    source = _source_path(name)
+    # deployments may ship only the compiled file
+    return not os.path.exists(source) or os.path.getmtime(compiled) >= os.path.getmtime(source)
+
+def get_dataset(name: str) -> MappedDataset:
+    """Returns the process-wide memory-mapped dataset `name`, compiling its source if needed.
+
+    Parameters
+    ----------
+    name : str
+        One of the names registered in DATASET_SOURCES.
+
+    Returns
+    -------
+    MappedDataset
+        the shared dataset, re-mapped first if its file was replaced (checked every REFRESH_INTERVAL seconds)
+    """
+    dataset = _datasets.get(name)
+    if dataset is not None:
+        dataset.refresh_if_due()
+        return dataset
+    with _datasets_lock:
+        dataset = _datasets.get(name)
+        if dataset is None:
+            path = next((path for path in (_compiled_path(name), _compiled_path(name, CACHE_DIR))
+                         if _is_fresh(path, name)), None)
+            dataset = MappedDataset(path or compile_source(name))
+            _datasets[name] = dataset
+    return dataset
+
+def reload_datasets() -> List[str]:
+    """Re-maps every open dataset whose file was replaced, without waiting for REFRESH_INTERVAL; returns their names."""
+    with _datasets_lock:
+        datasets = list(_datasets.items())
+    return [name for name, dataset in datasets if dataset.refresh()]
+
+if __name__ == '__main__':
+    import sys
+    names = sys.argv[1:] or list(DATASET_SOURCES)
+    for dataset_name in names:
+        compile_source(dataset_name)
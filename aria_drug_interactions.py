@@ -0,0 +1,112 @@
+"""ARIA Medication-Food Interaction Index
+
+This module resolves the medications of a session (named in free text or listed for a household
+member) to drug classes and the food constraints that apply to them, e.g. "atorvastatin" ->
+statins -> avoid grapefruit. Only the constraints of the medications actually present are given
+to the model, as one compact line each, and the food classes a constraint forbids are enforced by
+the ingredient guardrails like any other restriction (see aria_allergen_index).
+
+The index is compiled from two reference datasets (see aria_data_store):
+
+    * medications - {"drug": <drug or class name>, "classes": [<drug class>, ...]}
+    * food_interactions - {"drug_class": <class>, "forbids": [<ingredient class>, ...], "advice": <text>}
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * InteractionIndex - drug -> drug class -> food constraint index
+    * get_interaction_index - process-wide InteractionIndex, rebuilt when a dataset is swapped
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aria_data_store import get_dataset
+from aria_keyword_matcher import KeywordMatcher
+
+
+class InteractionIndex:
+    """Medication -> food constraint index.
+
+    Parameters
+    ----------
+    medications : iterable of dict
+        Records with a "drug" (generic, brand or class name) and its drug "classes".
+    interactions : iterable of dict
+        Records with a "drug_class", the ingredient classes it "forbids" and the "advice" for the model.
+    """
+
+    def __init__(self, medications: Iterable[dict], interactions: Iterable[dict]):
+        self._drugs = KeywordMatcher()
+        for record in medications:
+            for drug_class in record['classes']:
+                self._drugs.add(record['drug'], drug_class)
+        self.interactions: Dict[str, dict] = {record['drug_class']: record for record in interactions}
+
+    def __len__(self) -> int:
+        return len(self._drugs)
+
+    def resolve(self, medication: str) -> List[Tuple[str, List[str]]]:
+        """Returns the (matched drug, drug classes) pairs named in `medication`, e.g. "atorvastatin 20 mg"."""
+        return [(term, classes) for term, classes, _, _ in self._drugs.finditer(medication, longest_only=True)]
+
+    def forbidden_classes(self, medication: str) -> List[str]:
+        """Returns the ingredient classes forbidden by the drugs named in `medication`."""
+        forbidden: List[str] = []
+        for _, drug_classes in self.resolve(medication):
+            for drug_class in drug_classes:
+                for class_name in self.interactions.get(drug_class, {}).get('forbids', []):
+                    if class_name not in forbidden:
+                        forbidden.append(class_name)
+        return forbidden
+
+    def restriction_records(self) -> List[dict]:
+        """Returns every drug name as a restriction record of the ingredient index, with its forbidden classes."""
+        records = []
+        for drug in self._drugs.terms():
+            forbids = self.forbidden_classes(drug)
+            if forbids:
+                records.append({'restriction': drug, 'forbids': forbids, 'kind': 'interaction'})
+        return records
+
+    def constraints(self, medications: Iterable[Tuple[str, str]]) -> List[str]:
+        """Renders the food constraints of (label, medication) pairs, one line per drug class and label.
+
+        Medications that are known but have no food interaction are summarized on one line;
+        unknown ones are left out, since nothing can be said about them locally.
+        """
+        lines: List[str] = []
+        seen = set()
+        no_interaction: List[str] = []
+        for label, medication in medications:
+            for drug, drug_classes in self.resolve(medication):
+                for drug_class in drug_classes:
+                    if (label, drug_class) in seen:
+                        continue
+                    seen.add((label, drug_class))
+                    interaction = self.interactions.get(drug_class)
+                    prefix = f"{label}: " if label else ""
+                    if interaction is None:
+                        no_interaction.append(f"{drug} ({label})" if label else drug)
+                        continue
+                    name = drug if drug == drug_class else f"{drug} ({drug_class})"
+                    lines.append(f"- {prefix}{name}: {interaction['advice']}")
+        if no_interaction:
+            lines.append(f"- No known food interactions: {', '.join(no_interaction)}")
+        return lines
+
+_index: Optional[InteractionIndex] = None
+_index_generations: Optional[Tuple[int, ...]] = None
+_index_lock = threading.Lock()
+
+def get_interaction_index() -> InteractionIndex:
+    """Returns the shared InteractionIndex, rebuilt only when one of its datasets is swapped."""
+    global _index, _index_generations
+    datasets = [get_dataset(name) for name in ('medications', 'food_interactions')]
+    generations = tuple(dataset.generation for dataset in datasets)
+    if _index is None or generations != _index_generations:
+        with _index_lock:
+            if _index is None or generations != _index_generations:
+                medications, interactions = datasets
+                _index = InteractionIndex(medications.values(), interactions.values())
+                _index_generations = generations
+    return _index
@@ -0,0 +1,182 @@
+"""ARIA Fuzzy Vocabulary Matcher
+
+This module finds misspelled vocabulary terms ("glutten", "peanutts", "vegitarian", "Frnace")
+with a symmetric-delete index in the style of SymSpell. Every term is indexed once under all the
+strings obtained by deleting up to `max_distance` characters from its prefix. A lookup generates
+the same deletes of the query and probes the index, so its cost depends only on the length of the
+query, not on the size of the vocabulary. Candidates are verified with the optimal string alignment
+(Damerau-Levenshtein) distance.
+
+To keep ordinary words from being "corrected" into vocabulary terms, the allowed distance grows
+with the length of the word (none below 5 characters, 1 below 8, else 2) and the first letter must
+match.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * edit_distance - bounded optimal string alignment distance
+    * SymSpellIndex - symmetric-delete index over a categorized vocabulary
+    * get_fuzzy_index - process-wide index over the scenario vocabularies and country names
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from aria_data_store import get_dataset
+from aria_keyword_matcher import VOCABULARY_DATASETS, tokenize
+
+# category name -> dataset whose keys are added to the fuzzy index, besides VOCABULARY_DATASETS
+FUZZY_DATASETS: Dict[str, str] = dict(VOCABULARY_DATASETS, countries='travel_advisories')
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Returns the optimal string alignment distance of `a` and `b`, or `limit` + 1 if it exceeds `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_previous: Optional[List[int]] = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+def allowed_distance(word: str) -> int:
+    """Returns the edit distance tolerated for a word of this length."""
+    length = len(word.replace(' ', ''))
+    return 0 if length < 5 else 1 if length < 8 else 2
+
+
+class SymSpellIndex:
+    """Symmetric-delete index mapping (possibly misspelled) words to vocabulary terms.
+
+    Parameters
+    ----------
+    vocabularies : dict, optional
+        Mapping of category name to an iterable of terms.
+    max_distance : int
+        Largest edit distance the index supports.
+    prefix_length : int
+        Only this many leading characters are expanded into deletes, which bounds the index size.
+    """
+
+    def __init__(self, vocabularies: Optional[Dict[str, Iterable[str]]] = None, max_distance: int = 2,
+                 prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._terms: List[str] = []
+        self._categories: List[List[str]] = []
+        self._ids: Dict[str, int] = {}
+        self._deletes: Dict[str, List[int]] = {}
+        self.max_words = 1
+        for category, terms in (vocabularies or {}).items():
+            for term in terms:
+                self.add(term, category)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _variants(self, word: str) -> Set[str]:
+        variants = {word}
+        frontier = {word}
+        for _ in range(self.max_distance):
+            frontier = {candidate[:i] + candidate[i + 1:] for candidate in frontier for i in range(len(candidate))}
+            variants |= frontier
+        return variants
+
+    def add(self, term: str, category: str):
+        """Adds `term` under `category`."""
+        term = ' '.join(token for token, _, _ in tokenize(term))
+        if not term:
+            return
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = self._ids[term] = len(self._terms)
+            self._terms.append(term)
+            self._categories.append([])
+            self.max_words = max(self.max_words, term.count(' ') + 1)
+            for variant in self._variants(term[:self.prefix_length]):
+                self._deletes.setdefault(variant, []).append(term_id)
+        if category not in self._categories[term_id]:
+            self._categories[term_id].append(category)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[Tuple[str, int, List[str]]]:
+        """Returns the closest (term, distance, categories) within `max_distance` of `word`, or None.
+
+        The default distance is `allowed_distance(word)`. Ties go to the term added first.
+        """
+        word = ' '.join(token for token, _, _ in tokenize(word))
+        if not word:
+            return None
+        term_id = self._ids.get(word)
+        if term_id is not None:
+            return word, 0, self._categories[term_id]
+        limit = min(self.max_distance, allowed_distance(word) if max_distance is None else max_distance)
+        if limit == 0:
+            return None
+        best: Optional[Tuple[int, int]] = None
+        seen: Set[int] = set()
+        for variant in self._variants(word[:self.prefix_length]):
+            for candidate in self._deletes.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                term = self._terms[candidate]
+                if term[0] != word[0]:
+                    continue
+                distance = edit_distance(word, term, limit)
+                if distance <= limit and (best is None or (distance, candidate) < best):
+                    best = (distance, candidate)
+        if best is None:
+            return None
+        return self._terms[best[1]], best[0], self._categories[best[1]]
+
+    def correct(self, text: str) -> List[Tuple[str, str, int, List[str]]]:
+        """Finds misspelled vocabulary terms in `text`.
+
+        Word n-grams up to the longest term are looked up left to right, longest first; exact
+        matches consume their words without being reported.
+
+        Returns
+        -------
+        list of (str, str, int, list of str)
+            (text as written, corrected term, distance, categories) per correction
+        """
+        tokens = tokenize(text)
+        corrections = []
+        i = 0
+        while i < len(tokens):
+            for size in range(min(self.max_words, len(tokens) - i), 0, -1):
+                span = tokens[i:i + size]
+                if size == 1 and (span[0][0].isdigit() or len(span[0][0]) < 5):
+                    continue
+                found = self.lookup(' '.join(token for token, _, _ in span))
+                if found:
+                    term, distance, categories = found
+                    if distance:
+                        corrections.append((text[span[0][1]:span[-1][2]], term, distance, categories))
+                    i += size
+                    break
+            else:
+                i += 1
+        return corrections
+
+_index: Optional[SymSpellIndex] = None
+_index_generations: Optional[Tuple[int, ...]] = None
+_index_lock = threading.Lock()
+
+def get_fuzzy_index() -> SymSpellIndex:
+    """Returns the shared SymSpellIndex over FUZZY_DATASETS, rebuilt only when a dataset is swapped."""
+    global _index, _index_generations
+    datasets = {category: get_dataset(name) for category, name in FUZZY_DATASETS.items()}
+    generations = tuple(dataset.generation for dataset in datasets.values())
+    if _index is None or generations != _index_generations:
+        with _index_lock:
+            if _index is None or generations != _index_generations:
+                _index = SymSpellIndex({category: dataset.keys() for category, dataset in datasets.items()})
+                _index_generations = generations
+    return _index
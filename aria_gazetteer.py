@@ -0,0 +1,159 @@
+"""ARIA Gazetteer Location Extractor
+
+This module reads the trip locations of PathFinders out of a text with the bundled gazetteer
+(data/gazetteer.json): countries, major cities and their common aliases ("NYC", "L.A.", "Holland",
+"Bombay"). Every name and alias is indexed in one KeywordMatcher, so a text is scanned once, left
+to right, keeping the longest name at each position ("New York City" rather than "New York" or
+"York"). No network and no spaCy are involved; aliases resolve to their canonical name, which is
+what is sent to the geocoder.
+
+Capitalization is used to keep ordinary words out: a one-word name must be capitalized in the text
+("Nice", "Chad", "Turkey"), an acronym alias must be written in capitals ("US" but not "us"), and
+multi-word names match in any case ("new york").
+
+Origin and destination are found in the same pass from the word before each place ("from", "leaving",
+"lives in" for the origin; "to", "visit", "arriving in" for the destination); places without a cue
+fill the origin, then the destination, in order of appearance.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * PlaceMatch - one place found in a text
+    * Gazetteer - longest-match place name extractor
+    * get_gazetteer - process-wide Gazetteer over the gazetteer dataset
+"""
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from aria_data_store import get_dataset
+from aria_keyword_matcher import KeywordMatcher, tokenize
+
+ORIGIN_CUES = {'from', 'leaving', 'departing', 'departure', 'starting', 'origin'}
+DESTINATION_CUES = {'to', 'visit', 'visiting', 'into', 'toward', 'towards', 'reach', 'reaching', 'destination', 'explore'}
+# "<cue> in/at <place>"
+ORIGIN_LOCATIVE_CUES = {'live', 'lives', 'living', 'based', 'start', 'starting', 'currently', 'home'}
+DESTINATION_LOCATIVE_CUES = {'arrive', 'arriving', 'arrival', 'stay', 'staying', 'holiday', 'vacation', 'land', 'landing'}
+
+_WORD = re.compile(r"\w+")
+# characters looked at before a place for its cue words
+_CUE_WINDOW = 32
+
+
+class PlaceMatch(NamedTuple):
+    """A place found in a text: canonical name, kind ('country' or 'city'), country, character span, and role."""
+    name: str
+    kind: str
+    country: str
+    start: int
+    end: int
+    role: Optional[str]
+
+
+class Gazetteer:
+    """Place names, aliases and their countries compiled into one longest-match scanner.
+
+    Parameters
+    ----------
+    places : iterable of dict
+        Gazetteer records with "name", "kind", "country" and "aliases".
+    """
+
+    def __init__(self, places: Iterable[dict]):
+        self._matcher = KeywordMatcher()
+        self._places: Dict[str, dict] = {}
+        # token key -> capitalization required in the text: 'upper', 'title' or None
+        self._case: Dict[Tuple[str, ...], Optional[str]] = {}
+        for place in places:
+            self._places[place['name']] = place
+            for term in [place['name']] + list(place.get('aliases', ())):
+                self._add(term, place['name'])
+
+    def _add(self, term: str, name: str):
+        key = tuple(token for token, _, _ in tokenize(term))
+        if not key:
+            return
+        self._matcher.add(term, name)
+        letters = ''.join(ch for ch in term if ch.isalpha())
+        case = 'upper' if letters.isupper() and len(letters) <= 4 else 'title' if len(key) == 1 else None
+        # a key shared by an acronym and a name keeps the stricter rule
+        if key not in self._case or case == 'upper':
+            self._case[key] = case
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    def _accepts(self, written: str) -> bool:
+        case = self._case.get(tuple(token for token, _, _ in tokenize(written)))
+        if case == 'upper':
+            return written.isupper()
+        if case == 'title':
+            return written[:1].isupper()
+        return True
+
+    @staticmethod
+    def _role(text: str, start: int) -> Optional[str]:
+        words = [word.lower() for word in _WORD.findall(text[max(0, start - _CUE_WINDOW):start])[-2:]]
+        if not words:
+            return None
+        if words[-1] in ORIGIN_CUES:
+            return 'origin'
+        if words[-1] in DESTINATION_CUES:
+            return 'destination'
+        if len(words) == 2 and words[-1] in ('in', 'at'):
+            if words[0] in ORIGIN_LOCATIVE_CUES:
+                return 'origin'
+            if words[0] in DESTINATION_LOCATIVE_CUES:
+                return 'destination'
+        return None
+
+    def find(self, text: str) -> List[PlaceMatch]:
+        """Returns the places of `text`, left to right, keeping the longest name at each position."""
+        found: List[Tuple[str, int, int]] = []
+        # the matcher yields every name at a position from the shortest to the longest
+        for _, names, start, end in self._matcher.finditer(text):
+            if not self._accepts(text[start:end]):
+                continue
+            if found and start < found[-1][2]:
+                if start == found[-1][1] and end > found[-1][2]:
+                    found[-1] = (names[0], start, end)
+                continue
+            found.append((names[0], start, end))
+        places = []
+        for name, start, end in found:
+            place = self._places[name]
+            places.append(PlaceMatch(name, place['kind'], place['country'], start, end, self._role(text, start)))
+        return places
+
+    def find_route(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """Returns the (origin, destination) of a trip described in `text`; either may be None."""
+        places = self.find(text)
+        origin = next((place.name for place in places if place.role == 'origin'), None)
+        destination = next((place.name for place in places if place.role == 'destination' and place.name != origin), None)
+        for place in places:
+            if place.role is None and place.name not in (origin, destination):
+                if origin is None:
+                    origin = place.name
+                elif destination is None:
+                    destination = place.name
+        return origin, destination
+
+    def country_of(self, name: str) -> Optional[str]:
+        """Returns the country of a canonical place name, or None if it is not in the gazetteer."""
+        place = self._places.get(name)
+        return place['country'] if place else None
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_generation: Optional[int] = None
+_gazetteer_lock = threading.Lock()
+
+def get_gazetteer() -> Gazetteer:
+    """Returns the shared Gazetteer over the gazetteer dataset, rebuilt only when the dataset is swapped."""
+    global _gazetteer, _gazetteer_generation
+    dataset = get_dataset('gazetteer')
+    if _gazetteer is None or dataset.generation != _gazetteer_generation:
+        with _gazetteer_lock:
+            if _gazetteer is None or dataset.generation != _gazetteer_generation:
+                _gazetteer = Gazetteer(dataset.values())
+                _gazetteer_generation = dataset.generation
+    return _gazetteer
@@ -0,0 +1,340 @@
+"""ARIA Grocery Plan
+
+This module aggregates the grocery lists of a MealPlanner session into one plan keyed by a
+normalized item name. Quantities are converted to a base unit per dimension (grams, millilitres,
+pieces) and summed, so "2 cups rice" and "1 cup rice" become "rice - 3 cups". Each update is a
+dictionary operation per item, which keeps multi-week plans cheap to maintain.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * parse_quantity - splits an item line into (quantity, unit, normalized name)
+    * normalize_item_name - the aggregation key of an item name
+    * scale_item - rescales the quantity of an item line, converting to a better-sized unit
+    * GroceryItem - one aggregated item with totals per dimension
+    * GroceryPlan - the aggregated, exportable grocery plan
+"""
+import re
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# unit spelling -> (canonical unit, dimension, size in the base unit of the dimension)
+UNITS: Dict[str, Tuple[str, str, float]] = {}
+for _canonical, _dimension, _size, _spellings in [
+    ('g', 'mass', 1.0, ['g', 'gm', 'gms', 'gram', 'grams', 'gramme', 'grammes']),
+    ('kg', 'mass', 1000.0, ['kg', 'kgs', 'kilo', 'kilos', 'kilogram', 'kilograms']),
+    ('mg', 'mass', 0.001, ['mg', 'milligram', 'milligrams']),
+    ('oz', 'mass', 28.3495, ['oz', 'ounce', 'ounces']),
+    ('lb', 'mass', 453.592, ['lb', 'lbs', 'pound', 'pounds']),
+    ('ml', 'volume', 1.0, ['ml', 'millilitre', 'millilitres', 'milliliter', 'milliliters']),
+    ('l', 'volume', 1000.0, ['l', 'litre', 'litres', 'liter', 'liters', 'ltr']),
+    ('tsp', 'volume', 4.92892, ['tsp', 'tsps', 'teaspoon', 'teaspoons']),
+    ('tbsp', 'volume', 14.7868, ['tbsp', 'tbsps', 'tablespoon', 'tablespoons', 'tbs']),
+    ('cup', 'volume', 236.588, ['cup', 'cups']),
+    ('fl oz', 'volume', 29.5735, ['fl oz', 'fluid ounce', 'fluid ounces']),
+    ('pint', 'volume', 473.176, ['pint', 'pints']),
+    ('piece', 'count', 1.0, ['piece', 'pieces', 'pc', 'pcs', 'whole', 'nos', 'no']),
+    ('clove', 'count', 1.0, ['clove', 'cloves']),
+    ('pinch', 'count', 1.0, ['pinch', 'pinches']),
+    ('bunch', 'count', 1.0, ['bunch', 'bunches']),
+    ('can', 'count', 1.0, ['can', 'cans', 'tin', 'tins']),
+    ('packet', 'count', 1.0, ['packet', 'packets', 'pack', 'packs']),
+]:
+    for _spelling in _spellings:
+        UNITS[_spelling] = (_canonical, _dimension, _size)
+
+_UNICODE_FRACTIONS = {'½': '1/2', '⅓': '1/3', '⅔': '2/3', '¼': '1/4', '¾': '3/4', '⅛': '1/8'}
+_QUANTITY = re.compile(
+    r"^\s*(?P<quantity>\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?)(?:\s*(?:-|to)\s*(?P<upper>\d+(?:\.\d+)?))?\s*")
+_UNIT = re.compile(
+    r"^(?P<unit>" + '|'.join(sorted((re.escape(u) for u in UNITS), key=len, reverse=True)) + r")\.?(?![a-z])\s*(?:of\s+)?",
+    re.IGNORECASE)
+_LEADING_BULLET = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+")
+_PARENTHETICAL = re.compile(r"\(.*?\)")
+_NON_WORD = re.compile(r"[^a-z0-9\s-]")
+_TRAILING_NOTE = re.compile(r"\s+(?:to taste|as needed|as required|for garnish(?:ing)?|optional)\b.*$")
+_DESCRIPTORS = {'large', 'medium', 'small', 'fresh', 'ripe', 'chopped', 'sliced', 'diced', 'minced', 'whole'}
+# totals (in base units) at or below this are used up; absorbs the rounding of unit conversions
+_EMPTY_TOTAL = 1e-6
+
+def _parse_number(text: str) -> float:
+    text = text.strip()
+    if ' ' in text:
+        whole, fraction = text.split(None, 1)
+        return float(whole) + _parse_number(fraction)
+    if '/' in text:
+        numerator, denominator = text.split('/', 1)
+        return float(numerator) / float(denominator) if float(denominator) else 0.0
+    return float(text)
+
+_IRREGULAR_SINGULARS = {'leaves': 'leaf', 'halves': 'half', 'loaves': 'loaf', 'olives': 'olive', 'chives': 'chive'}
+
+def _singular(word: str) -> str:
+    if word in _IRREGULAR_SINGULARS:
+        return _IRREGULAR_SINGULARS[word]
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 4 and word.endswith('oes'):
+        return word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+def normalize_item_name(name: str) -> str:
+    """Returns the aggregation key of an item name: lowercased, without notes, last word singular."""
+    name = _PARENTHETICAL.sub('', name.lower())
+    # "onion, finely chopped" -> "onion"
+    name = _TRAILING_NOTE.sub('', name.split(',', 1)[0])
+    words = _NON_WORD.sub(' ', name).split()
+    while len(words) > 1 and words[0] in _DESCRIPTORS:
+        words.pop(0)
+    if not words:
+        return ''
+    words[-1] = _singular(words[-1])
+    return ' '.join(words)
+
+def parse_quantity(item: str) -> Tuple[Optional[float], Optional[str], str]:
+    """Splits an item line such as "1 1/2 cups basmati rice" into (1.5, 'cup', 'basmati rice').
+
+    Ranges ("2-3 tomatoes") use their upper bound. Items without a quantity return (None, None, name).
+    """
+    text = _LEADING_BULLET.sub('', item)
+    for symbol, fraction in _UNICODE_FRACTIONS.items():
+        text = text.replace(symbol, f" {fraction}")
+    quantity = unit = None
+    match = _QUANTITY.match(text)
+    if match:
+        quantity = _parse_number(match.group('upper') or match.group('quantity'))
+        text = text[match.end():]
+        unit_match = _UNIT.match(text)
+        if unit_match:
+            unit = UNITS[unit_match.group('unit').lower()][0]
+            text = text[unit_match.end():]
+        else:
+            unit = 'piece'
+    return quantity, unit, normalize_item_name(text)
+
+# unit ladders used when a scaled amount is better expressed in a neighbouring unit, with the
+# smallest amount (in that unit) for which it is used; rounding step per unit
+_UNIT_LADDERS = [[('cup', 0.25), ('tbsp', 1.0), ('tsp', 0.0)], [('kg', 1.0), ('g', 0.0)],
+                 [('l', 1.0), ('ml', 0.0)], [('lb', 1.0), ('oz', 0.0)]]
+_ROUNDING = {'tsp': 0.25, 'tbsp': 0.25, 'cup': 0.25, 'oz': 0.25, 'lb': 0.25, 'kg': 0.05, 'l': 0.05, 'pint': 0.25}
+_FRACTIONS = {0.25: '1/4', 0.5: '1/2', 0.75: '3/4'}
+
+def _rescaled_unit(base_amount: float, unit: str) -> str:
+    for ladder in _UNIT_LADDERS:
+        if unit in (name for name, _ in ladder):
+            for name, minimum in ladder:
+                if base_amount / UNITS[name][2] >= minimum:
+                    return name
+    return unit
+
+def _round_amount(amount: float, unit: str) -> float:
+    if unit in ('g', 'ml'):
+        step = 1.0 if amount < 20 else 5.0
+    else:
+        step = _ROUNDING.get(unit, 0.5)
+    return max(step, round(amount / step) * step)
+
+def _format_amount(amount: float) -> str:
+    whole, fraction = int(amount), round(amount - int(amount), 2)
+    if fraction in _FRACTIONS:
+        return f"{whole} {_FRACTIONS[fraction]}" if whole else _FRACTIONS[fraction]
+    return _format_number(amount)
+
+def _plural_noun(text: str) -> str:
+    # "onion, chopped" -> "onions, chopped"
+    head, separator, tail = text.partition(',')
+    words = head.split()
+    if not words or words[-1].endswith('s'):
+        return text
+    word = words[-1]
+    if word.endswith(('x', 'ch', 'sh')) or word in ('tomato', 'potato', 'mango'):
+        words[-1] = word + 'es'
+    elif word.endswith('y') and word[-2:-1] not in ('a', 'e', 'o', 'u'):
+        words[-1] = word[:-1] + 'ies'
+    else:
+        words[-1] = word + 's'
+    return ' '.join(words) + (separator + tail if separator else '')
+
+def _singular_noun(text: str) -> str:
+    head, separator, tail = text.partition(',')
+    words = head.split()
+    if not words:
+        return text
+    words[-1] = _singular(words[-1])
+    return ' '.join(words) + (separator + tail if separator else '')
+
+def scale_item(item: str, factor: float) -> str:
+    """Returns `item` with its quantity multiplied by `factor`, e.g. ("2 tbsp ghee", 4) -> "1/2 cup ghee".
+
+    Amounts move along the tsp/tbsp/cup, g/kg, ml/l and oz/lb ladders and are rounded to a
+    practical step; counted items ("3 eggs", "1 can tomatoes") are rounded up to whole pieces.
+    Items without a quantity ("salt to taste") are returned unchanged.
+    """
+    text = _LEADING_BULLET.sub('', item).strip()
+    for symbol, fraction in _UNICODE_FRACTIONS.items():
+        text = text.replace(symbol, f" {fraction}")
+    match = _QUANTITY.match(text)
+    if not match or factor <= 0:
+        return item
+    quantity = _parse_number(match.group('upper') or match.group('quantity'))
+    rest = text[match.end():]
+    unit_match = _UNIT.match(rest)
+    if unit_match:
+        canonical, dimension, size = UNITS[unit_match.group('unit').lower()]
+        base_amount = quantity * factor * size
+        unit = _rescaled_unit(base_amount, canonical)
+        if dimension == 'count':
+            # cans, cloves and bunches too
+            amount = max(1.0, math.ceil(base_amount / UNITS[unit][2] - 1e-9))
+        else:
+            amount = _round_amount(base_amount / UNITS[unit][2], unit)
+        name = rest[unit_match.end():].strip()
+        return f"{_format_amount(amount)} {_plural_unit(unit, amount)} {name}"
+    # eggs, onions and lemons are bought whole
+    amount = max(1.0, math.ceil(quantity * factor - 1e-9))
+    name = rest.strip()
+    if quantity <= 1 < amount:
+        name = _plural_noun(name)
+    elif amount <= 1 < quantity:
+        name = _singular_noun(name)
+    return f"{_format_amount(amount)} {name}"
+
+def _plural_unit(unit: str, amount: float) -> str:
+    if amount <= 1 or unit not in ('cup', 'pint', 'clove', 'pinch', 'bunch', 'can', 'packet'):
+        return unit
+    return unit + ('es' if unit.endswith(('ch', 'sh')) else 's')
+
+def _format_number(value: float) -> str:
+    return f"{value:.2f}".rstrip('0').rstrip('.')
+
+
+class GroceryItem:
+    """One aggregated grocery item.
+
+    Totals are kept per dimension in the base unit (g, ml, piece); `display_units` remembers the
+    first unit seen per dimension so the shopping list speaks the same units as the recipes.
+    Lines without a quantity ("salt to taste") are counted per source (the recipe they came
+    from), so taking one recipe's line back out keeps the item while another recipe needs it.
+    """
+
+    __slots__ = ('name', 'totals', 'display_units', 'unquantified_by')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.totals: Dict[str, float] = {}
+        self.display_units: Dict[str, str] = {}
+        self.unquantified_by: Dict[str, int] = {}
+
+    @property
+    def unquantified(self) -> bool:
+        """Whether some source still lists the item without a quantity."""
+        return bool(self.unquantified_by)
+
+    def add(self, quantity: Optional[float], unit: Optional[str], multiplier: float = 1.0, source: str = ''):
+        if quantity is None or unit is None:
+            # a negative multiplier withdraws one mention of `source`, never another source's
+            count = self.unquantified_by.get(source, 0) + (1 if multiplier > 0 else -1)
+            if count > 0:
+                self.unquantified_by[source] = count
+            else:
+                self.unquantified_by.pop(source, None)
+            return
+        canonical, dimension, size = UNITS[unit]
+        total = self.totals.get(dimension, 0.0) + quantity * size * multiplier
+        if total <= _EMPTY_TOTAL:
+            self.totals.pop(dimension, None)
+            self.display_units.pop(dimension, None)
+            return
+        self.totals[dimension] = total
+        self.display_units.setdefault(dimension, canonical)
+
+    @property
+    def empty(self) -> bool:
+        """Whether nothing of the item is left to buy."""
+        return not self.totals and not self.unquantified
+
+    def quantity_in(self, dimension: str, unit: Optional[str] = None) -> Optional[float]:
+        """Returns the total of `dimension` in `unit` (default: its display unit)."""
+        if dimension not in self.totals:
+            return None
+        unit = unit or self.display_units[dimension]
+        return self.totals[dimension] / UNITS[unit][2]
+
+    def describe(self) -> str:
+        parts = []
+        for dimension, total in self.totals.items():
+            unit = self.display_units[dimension]
+            amount = total / UNITS[unit][2]
+            if unit == 'piece':
+                parts.append(_format_number(amount))
+            else:
+                parts.append(f"{_format_number(amount)} {_plural_unit(unit, amount)}")
+        if not parts:
+            return self.name
+        return f"{self.name} - {' + '.join(parts)}"
+
+
+class GroceryPlan:
+    """Grocery plan aggregated by normalized item name.
+
+    Iterating yields the consolidated shopping list lines, so the plan can stand in for the former
+    ``grocery_plan`` list of strings.
+    """
+
+    def __init__(self, items: Optional[List[str]] = None):
+        self._items: Dict[str, GroceryItem] = {}
+        for item in items or []:
+            self.add(item)
+
+    def add(self, item: str, multiplier: float = 1.0, source: str = '') -> Optional[GroceryItem]:
+        """Adds one item line; its quantity is converted and summed into the matching entry.
+
+        A negative `multiplier` takes the line back out; an entry with nothing left is removed and
+        None is returned. `source` names the recipe the line belongs to.
+        """
+        quantity, unit, name = parse_quantity(item)
+        if not name:
+            return None
+        entry = self._items.get(name)
+        if entry is None:
+            entry = self._items[name] = GroceryItem(name)
+        entry.add(quantity, unit, multiplier, source)
+        if entry.empty:
+            del self._items[name]
+            return None
+        return entry
+
+    def update(self, items, multiplier: float = 1.0, source: str = ''):
+        for item in items:
+            self.add(item, multiplier, source)
+
+    def get(self, item: str) -> Optional[GroceryItem]:
+        return self._items.get(normalize_item_name(item))
+
+    def entries(self) -> List[GroceryItem]:
+        return list(self._items.values())
+
+    def clear(self):
+        self._items.clear()
+
+    def __contains__(self, item) -> bool:
+        return isinstance(item, str) and normalize_item_name(item) in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_shopping_list())
+
+    def to_shopping_list(self) -> List[str]:
+        """Returns one consolidated line per item, e.g. "rice - 3 cups"."""
+        return [entry.describe() for entry in self._items.values()]
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Returns the totals per item and dimension in base units (g, ml, piece)."""
+        return {name: dict(entry.totals) for name, entry in self._items.items()}
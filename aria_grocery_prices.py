@@ -0,0 +1,148 @@
+"""ARIA Grocery Prices
+
+This module prices the aggregated MealPlanner grocery plan locally, so budget figures are
+consistent between turns and are never invented by the model. Prices come from regional price
+tables (``data/grocery_prices_<region>.json``: {"item", "per", "price"}) that are compiled and
+swapped like every other reference dataset. Each table is loaded into NumPy arrays of price per
+base unit (g, ml, piece), and a whole plan is priced with one vectorized pass. Amounts bought in a
+different dimension than they are priced in (cups of rice priced per kg, onions counted but priced
+per kg) are converted with the densities and piece weights of the nutrition table.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * PRICE_REGIONS - region code -> currency of the bundled price tables
+    * PriceTable - per-region price table with a vectorized grocery plan estimator
+    * get_price_table - process-wide PriceTable of a region, rebuilt when its dataset is swapped
+    * format_budget - compact rendering of an estimate for the response
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from aria_data_store import get_dataset
+from aria_grocery_plan import UNITS, GroceryPlan
+from aria_keyword_matcher import KeywordMatcher
+from aria_nutrition import NutritionTable, get_nutrition_table
+
+PRICE_REGIONS: Dict[str, str] = {'us': 'USD', 'in': 'INR'}
+DEFAULT_REGION = 'us'
+CURRENCY_SYMBOLS = {'USD': '$', 'INR': '₹'}
+
+_DIMENSIONS = ('mass', 'volume', 'count')
+
+
+class PriceTable:
+    """Prices per base unit of one region.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Records with "item", "per" (a unit such as kg, l, piece, bunch) and "price".
+    region : str
+        Region code, one of PRICE_REGIONS.
+    nutrition : NutritionTable, optional
+        Source of densities and piece weights for converting between dimensions.
+    """
+
+    def __init__(self, records: Iterable[dict], region: str, nutrition: Optional[NutritionTable] = None):
+        records = list(records)
+        self.region = region
+        self.currency = PRICE_REGIONS.get(region, '')
+        self.nutrition = nutrition
+        self.items: List[str] = [record['item'] for record in records]
+        units = [UNITS[record['per']] for record in records]
+        self.unit_price = np.array([record['price'] / size for record, (_, _, size) in zip(records, units)], dtype=float)
+        self.dimension = np.array([_DIMENSIONS.index(dimension) for _, dimension, _ in units])
+        rows = [nutrition.lookup(item) if nutrition else None for item in self.items]
+        self.g_per_ml = np.array([nutrition.g_per_ml[row] if row is not None else 1.0 for row in rows], dtype=float)
+        self.g_per_piece = np.array([nutrition.g_per_piece[row] if row is not None else np.nan for row in rows],
+                                    dtype=float)
+        self._matcher = KeywordMatcher()
+        for row, item in enumerate(self.items):
+            self._matcher.add(item, str(row))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Returns the row of the longest priced item found in `name`, or None."""
+        best = None
+        for _, rows, start, end in self._matcher.finditer(name, longest_only=True):
+            if best is None or end - start > best[0]:
+                best = (end - start, int(rows[0]))
+        return best[1] if best else None
+
+    def estimate(self, plan: GroceryPlan) -> dict:
+        """Prices every quantified entry of `plan`.
+
+        Returns
+        -------
+        dict
+            'region', 'currency', 'items' (item -> cost), 'total' and 'unpriced' item names
+        """
+        names: List[str] = []
+        rows: List[int] = []
+        amounts: List[float] = []
+        dimensions: List[int] = []
+        unpriced: List[str] = []
+        for entry in plan.entries():
+            row = self.lookup(entry.name)
+            if row is None or not entry.totals:
+                unpriced.append(entry.name)
+                continue
+            for dimension, amount in entry.totals.items():
+                names.append(entry.name)
+                rows.append(row)
+                amounts.append(amount)
+                dimensions.append(_DIMENSIONS.index(dimension))
+        result = {'region': self.region, 'currency': self.currency, 'items': {}, 'total': 0.0, 'unpriced': unpriced}
+        if not rows:
+            return result
+        rows_arr = np.asarray(rows)
+        amounts_arr = np.asarray(amounts, dtype=float)
+        source = np.asarray(dimensions)
+        target = self.dimension[rows_arr]
+        # bought amount in grams, needed whenever the source and priced dimensions differ
+        grams = np.select([source == 0, source == 1, source == 2],
+                          [amounts_arr, amounts_arr * self.g_per_ml[rows_arr], amounts_arr * self.g_per_piece[rows_arr]])
+        priced_amount = np.where(source == target, amounts_arr,
+                                 np.select([target == 0, target == 1, target == 2],
+                                           [grams, grams / self.g_per_ml[rows_arr], grams / self.g_per_piece[rows_arr]]))
+        costs = np.maximum(priced_amount * self.unit_price[rows_arr], 0.0)
+        for name, cost in zip(names, costs):
+            # NaN: counted pieces of an item priced by weight without a known piece weight
+            if not np.isnan(cost):
+                result['items'][name] = round(result['items'].get(name, 0.0) + float(cost), 2)
+        unpriced.extend(name for name in dict.fromkeys(names) if name not in result['items'])
+        result['total'] = round(sum(result['items'].values()), 2)
+        return result
+
+def format_budget(estimate: dict) -> str:
+    """Renders an estimate as a short grocery budget block."""
+    symbol = CURRENCY_SYMBOLS.get(estimate['currency'], estimate['currency'] + ' ')
+    lines = [f"Estimated grocery cost ({estimate['region'].upper()} prices, {estimate['currency']}): "
+             f"{symbol}{estimate['total']:.2f}"]
+    lines.extend(f"- {name}: {symbol}{cost:.2f}" for name, cost in estimate['items'].items())
+    if estimate['unpriced']:
+        lines.append(f"Not priced: {', '.join(estimate['unpriced'])}.")
+    return '\n'.join(lines)
+
+_tables: Dict[str, PriceTable] = {}
+_table_generations: Dict[str, int] = {}
+_tables_lock = threading.Lock()
+
+def get_price_table(region: str = DEFAULT_REGION) -> PriceTable:
+    """Returns the shared PriceTable of `region`, rebuilt only when its price or nutrition dataset is swapped."""
+    region = region if region in PRICE_REGIONS else DEFAULT_REGION
+    dataset = get_dataset(f"grocery_prices_{region}")
+    nutrition = get_nutrition_table()
+    table = _tables.get(region)
+    if table is None or _table_generations.get(region) != dataset.generation or table.nutrition is not nutrition:
+        with _tables_lock:
+            table = _tables.get(region)
+            if table is None or _table_generations.get(region) != dataset.generation or table.nutrition is not nutrition:
+                table = _tables[region] = PriceTable(dataset.values(), region, nutrition)
+                _table_generations[region] = dataset.generation
+    return table
@@ -0,0 +1,206 @@
+"""ARIA Guardrail Rule Engine
+
+This module compiles the keyword and phrase guardrails of the scenarios (prohibited travel content,
+spoiler keywords, non-food items) into one KeywordMatcher per scenario, so a response is checked
+against all the rules of its scenario in a single left-to-right pass, with word-boundary semantics
+("wins" no longer fires inside "Winston"). Every evaluation returns all the matches with their rule
+ids and updates the counters of the rule set: evaluations, cumulative and worst evaluation time,
+and hits per rule. Since the rules of a set share one pass, time is measured per evaluation of the
+whole set.
+
+The rules are defined in versioned rule packs, one JSON file per scenario in ``data/rule_packs``:
+
+    {"name": "tv_spoilers", "version": "1.1", "rules": {"spoiler.dies": ["dies"], ...}}
+
+Each worker watches the files from a background thread. A changed file is compiled off the request
+path and the new rule set replaces the old one in a single assignment, so a rule can be tightened
+during an evaluation window without a redeploy; a turn sees either the old or the new rule set,
+never a mix. An invalid file is reported and the last good version stays active.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * RuleMatch - one rule hit in a text
+    * GuardrailRules - compiled rule set of a scenario with hit and latency counters
+    * compile_rules - compiles and registers a rule set
+    * read_rule_pack - compiles one rule pack file without activating it
+    * load_rule_pack - compiles one rule pack file and activates it
+    * reload_rule_packs - compiles the new or changed rule pack files
+    * get_rules - active rule set of a scenario, starting the rule pack watcher on first use
+    * rule_pack_versions - versions of the active rule sets
+    * rule_stats - counters of the active rule sets
+"""
+import os
+import json
+import time
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from aria_keyword_matcher import KeywordMatcher
+
+
+class RuleMatch(NamedTuple):
+    """One rule hit: the rule id, the term as written in the text, and its character span."""
+    rule_id: str
+    term: str
+    start: int
+    end: int
+
+
+class GuardrailRules:
+    """Rules of one scenario compiled into a single matcher.
+
+    Parameters
+    ----------
+    name : str
+        Name of the rule set, usually the scenario.
+    rules : dict
+        Mapping of rule id to the terms or phrases that trigger it. Terms are matched on whole,
+        casefolded words; punctuation between words is ignored ("Washington D.C." = "washington d c").
+    version : str, optional
+        Version of the rule pack the rules come from.
+    """
+
+    def __init__(self, name: str, rules: Dict[str, Iterable[str]], version: str = ''):
+        self.name = name
+        self.version = version
+        self.rules: Dict[str, List[str]] = {rule_id: list(terms) for rule_id, terms in rules.items()}
+        self._matcher = KeywordMatcher(self.rules)
+        self._lock = threading.Lock()
+        self.evaluations = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+        self.hits: Dict[str, int] = {rule_id: 0 for rule_id in self.rules}
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def evaluate(self, text: str) -> List[RuleMatch]:
+        """Returns every rule hit in `text`, left to right, and counts the evaluation."""
+        start = time.perf_counter()
+        matches = [RuleMatch(rule_id, text[begin:end], begin, end)
+                   for _, rule_ids, begin, end in self._matcher.finditer(text) for rule_id in rule_ids]
+        elapsed = (time.perf_counter() - start) * 1e6
+        with self._lock:
+            self.evaluations += 1
+            self.total_us += elapsed
+            self.max_us = max(self.max_us, elapsed)
+            for rule_id in dict.fromkeys(match.rule_id for match in matches):
+                self.hits[rule_id] += 1
+        return matches
+
+    def stats(self) -> dict:
+        """Returns the counters of the rule set: evaluations, mean and max evaluation time, and hits per rule."""
+        with self._lock:
+            return {'version': self.version, 'rules': len(self.rules), 'evaluations': self.evaluations,
+                    'mean_us': round(self.total_us / self.evaluations, 1) if self.evaluations else 0.0,
+                    'max_us': round(self.max_us, 1), 'hits': {rule_id: hits for rule_id, hits in self.hits.items() if hits}}
+
+RULE_PACK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'rule_packs')
+# seconds between two checks of the rule pack files by the watcher thread
+RELOAD_INTERVAL = 2.0
+
+_rule_sets: Dict[str, GuardrailRules] = {}
+_pack_stats: Dict[str, Tuple[int, int, int]] = {}
+_watcher: Optional[threading.Thread] = None
+_watcher_lock = threading.Lock()
+
+def compile_rules(name: str, rules: Dict[str, Iterable[str]], version: str = '') -> GuardrailRules:
+    """Compiles `rules` and registers the rule set under `name`, replacing the previous one in one assignment."""
+    rule_set = GuardrailRules(name, rules, version)
+    _rule_sets[name] = rule_set
+    return rule_set
+
+def read_rule_pack(path: str) -> GuardrailRules:
+    """Compiles the rule pack file at `path` without activating it.
+
+    A rule pack is a JSON object with "name", "version" and "rules" (rule id -> terms).
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid rule pack.
+    """
+    with open(path, encoding='utf-8') as f:
+        try:
+            pack = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: {e}") from e
+    if not isinstance(pack, dict) or not isinstance(pack.get('rules'), dict) or 'version' not in pack:
+        raise ValueError(f"{path}: a rule pack needs a 'version' and a 'rules' object")
+    if not all(isinstance(terms, list) and all(isinstance(term, str) for term in terms) for terms in pack['rules'].values()):
+        raise ValueError(f"{path}: every rule must be a list of terms")
+    name = pack.get('name') or os.path.splitext(os.path.basename(path))[0]
+    return GuardrailRules(name, pack['rules'], str(pack['version']))
+
+def load_rule_pack(path: str) -> GuardrailRules:
+    """Compiles the rule pack file at `path` and makes it the active rule set of its name.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid rule pack; the active rule set is then left unchanged.
+    """
+    st = os.stat(path)
+    rule_set = read_rule_pack(path)
+    _rule_sets[rule_set.name] = rule_set
+    _pack_stats[path] = (st.st_ino, st.st_mtime_ns, st.st_size)
+    return rule_set
+
+def reload_rule_packs() -> List[str]:
+    """Compiles every new or changed rule pack file in RULE_PACK_DIR. Returns the names of the swapped rule sets."""
+    swapped = []
+    try:
+        paths = sorted(os.path.join(RULE_PACK_DIR, name) for name in os.listdir(RULE_PACK_DIR) if name.endswith('.json'))
+    except OSError:
+        return swapped
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if _pack_stats.get(path) == (st.st_ino, st.st_mtime_ns, st.st_size):
+            continue
+        try:
+            rule_set = load_rule_pack(path)
+        except (OSError, ValueError) as e:
+            # keep serving the last good version; the file is retried once it changes again
+            _pack_stats[path] = (st.st_ino, st.st_mtime_ns, st.st_size)
+            print(f"aria_guardrail_rules: Ignored invalid rule pack {e}")
+            continue
+        print(f"aria_guardrail_rules: Loaded rule pack '{rule_set.name}' version {rule_set.version} ({len(rule_set)} rules)")
+        swapped.append(rule_set.name)
+    return swapped
+
+def _watch():
+    while True:
+        time.sleep(RELOAD_INTERVAL)
+        reload_rule_packs()
+
+def get_rules(name: str) -> GuardrailRules:
+    """Returns the active rule set `name`, loading the rule packs and starting their watcher on first use.
+
+    The watcher is a daemon thread that checks the rule pack files every RELOAD_INTERVAL seconds and
+    compiles changed files off the request path; callers pick up the new rule set on their next call.
+
+    Raises
+    ------
+    KeyError
+        If no rule pack defines `name`.
+    """
+    global _watcher
+    if _watcher is None:
+        with _watcher_lock:
+            if _watcher is None:
+                reload_rule_packs()
+                _watcher = threading.Thread(target=_watch, name='aria-rule-pack-watcher', daemon=True)
+                _watcher.start()
+    return _rule_sets[name]
+
+def rule_pack_versions() -> Dict[str, str]:
+    """Returns the version of every active rule set, by name."""
+    return {name: rule_set.version for name, rule_set in _rule_sets.items()}
+
+def rule_stats() -> Dict[str, dict]:
+    """Returns the counters of every active rule set, by name."""
+    return {name: rule_set.stats() for name, rule_set in _rule_sets.items()}
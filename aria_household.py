@@ -0,0 +1,135 @@
+"""ARIA Household Store
+
+This module keeps the MealPlanner household (the members a meal is planned for) indexed by
+casefolded name, together with the prompt fragment rendered for each member. A fragment is only
+re-rendered when its member changes, and the joined name list and member block used in every
+prompt are cached until the household changes, so long sessions and large households add no
+per-turn rendering cost. Members given an age and weight but no calorie requirement get a locally
+computed estimate (see aria_nutrition) in their fragment. Medications with known food interactions
+are not repeated in the fragment; their constraints are given to the model separately (see
+aria_drug_interactions), and only medications unknown to the interaction table are listed.
+
+This file can be imported as a module and contains the following class:
+
+    * HouseholdStore - ordered, name-indexed member store with cached prompt fragments
+"""
+from typing import Dict, Iterator, List, Optional
+
+from aria_drug_interactions import get_interaction_index
+from aria_nutrition import estimate_calorie_requirement
+
+
+class HouseholdStore:
+    """Ordered collection of household members keyed by casefolded name.
+
+    Iterating yields the member dictionaries in insertion order, so the store can stand in for the
+    former ``members_for_meal`` list. Members must be changed through `upsert` so the cached
+    fragments stay valid.
+    """
+
+    def __init__(self, members: Optional[List[dict]] = None):
+        self._members: Dict[str, dict] = {}
+        self._fragments: Dict[str, str] = {}
+        self._names: Optional[str] = None
+        self._block: Optional[str] = None
+        # incremented on every change, for callers that derive their own caches from the household
+        self.version = 0
+        for member in members or []:
+            self.upsert(member)
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.strip().casefold()
+
+    @staticmethod
+    def render_member(member: dict) -> str:
+        """Renders the prompt line of one member."""
+        if member.get('calorie_requirement') is not None:
+            calories = f"{member['calorie_requirement']} kcal/day"
+        elif member.get('estimated_calorie_requirement') is not None:
+            calories = f"{member['estimated_calorie_requirement']} kcal/day (verified estimate from age and weight)"
+        else:
+            calories = "N/A kcal/day"
+        medications = member.get('medications') or []
+        interactions = get_interaction_index()
+        unknown = [medication for medication in medications if not interactions.resolve(medication)]
+        medication_text = ', '.join(unknown) if unknown else 'None'
+        if len(unknown) < len(medications):
+            medication_text += " (others covered by the medication food constraints)"
+        return (
+            f"- Name: {member.get('name', 'N/A')}, Age: {member.get('age', 'N/A')}, "
+            f"Weight: {member.get('weight', 'N/A')} kg, "
+            f"Calorie Requirement: {calories}, "
+            f"Medications: {medication_text}, "
+            f"Illnesses: {', '.join(member.get('illnesses', [])) if member.get('illnesses') else 'None'}, "
+            f"Treatments: {', '.join(member.get('treatments', [])) if member.get('treatments') else 'None'}\n"
+        )
+
+    def upsert(self, member: dict) -> dict:
+        """Adds `member`, or updates the given fields of the existing member with the same name.
+
+        Returns
+        -------
+        dict
+            the stored member
+        """
+        key = self._key(member['name'])
+        stored = self._members.get(key)
+        if stored is None:
+            stored = dict(member)
+            self._members[key] = stored
+            self._names = None
+        else:
+            if member['name'] != stored['name']:
+                self._names = None
+            stored.update(member)
+        if stored.get('age') is not None and stored.get('weight') is not None:
+            stored['estimated_calorie_requirement'] = estimate_calorie_requirement(stored['age'], stored['weight'])
+        self._fragments[key] = self.render_member(stored)
+        self._block = None
+        self.version += 1
+        return stored
+
+    def remove(self, name: str) -> bool:
+        """Removes the member called `name`. Returns True if a member was removed."""
+        key = self._key(name)
+        if key not in self._members:
+            return False
+        del self._members[key]
+        del self._fragments[key]
+        self._names = self._block = None
+        self.version += 1
+        return True
+
+    def get(self, name: str) -> Optional[dict]:
+        return self._members.get(self._key(name))
+
+    def __contains__(self, name) -> bool:
+        return isinstance(name, str) and self._key(name) in self._members
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(list(self._members.values()))
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __bool__(self) -> bool:
+        return bool(self._members)
+
+    def clear(self):
+        self._members.clear()
+        self._fragments.clear()
+        self._names = self._block = None
+        self.version += 1
+
+    def names(self) -> str:
+        """Returns the comma-separated member names, cached until a member is added or removed."""
+        if self._names is None:
+            self._names = ', '.join(member['name'] for member in self._members.values())
+        return self._names
+
+    def prompt_block(self) -> str:
+        """Returns the concatenated member fragments, cached until any member changes."""
+        if self._block is None:
+            self._block = ''.join(self._fragments.values())
+        return self._block
@@ -0,0 +1,200 @@
+"""ARIA Input Guard
+
+The output guardrails of every scenario only run after a full generation, so a request that can
+only produce a rejected answer ("recipe for peanut curry" with a peanut allergy on file, "train
+from San Diego to Honolulu", "who dies in the finale") still costs a generation. This module holds
+the shared parts of the input-side guard each scenario runs before building its prompt:
+
+    * MealPlanner - the dish requested, checked against the declared restrictions by the ingredient index
+    * PathFinders - the prohibited travel patterns
+    * TVSpoilers - questions asking how a show ends or what happens to a character
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * DishRequest - the dish of a recipe request with the ingredients it excludes
+    * requested_dish - the dish a recipe request names, with its "X-free" / "without X" modifiers
+    * excluded_terms - what the "X-free", "without X" and "vegan" modifiers of a dish or ingredient exclude
+    * avoided_terms - the vocabulary terms a text asks to avoid ("allergic to peanuts", "gluten-free")
+    * SPOILER_REQUEST - regex of the spoiler questions of SPOILER_QUESTIONS
+    * is_spoiler_request - the spoiler question asked in a text, unless it asks to stay spoiler-free
+    * record_generation_saved - counts a turn answered by the input guard
+    * generations_saved - process-wide count of turns answered by the input guard
+"""
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+# the dish named by a recipe request: "give me a recipe for <dish>", "I want to cook <dish>", "<...> curry"
+_DISH_REQUEST = re.compile(
+    r"\b(?:recipes? (?:for|of)|(?:want|like|going|how) to (?:cook|make|bake|prepare)|"
+    r"(?:cook|make|bake|prepare) (?:me |us )?|how (?:do|can|should) (?:i|we|you) (?:cook|make|bake|prepare))\s+"
+    r"(?:an? |some |the )?([^.,;:!?]+)",
+    re.IGNORECASE)
+_DISH_WORD = re.compile(r"((?:[\w-]+ ){0,3}(?:curry|stew|roast|biryani))\b", re.IGNORECASE)
+# where the dish phrase ends: "... for 4 people", "... for dinner", "... that my kids like"
+_DISH_END = re.compile(
+    r"\s+(?:for (?!one\b)(?:\d|two|three|four|five|six|my|our|the|us|me|a |an |dinner|lunch|breakfast|tonight|today|tomorrow)|"
+    r"tonight|today|tomorrow|please|that|which|because|so|since|and (?:i|we|my|also)|but)\b.*$",
+    re.IGNORECASE)
+# modifiers of the dish that exclude an ingredient: "gluten-free bread", "curry without dairy or nuts"
+_FREE_FROM = re.compile(r"\b([\w]+)[- ]free\b", re.IGNORECASE)
+_WITHOUT = re.compile(r"\b(?:without|with no|no|minus|excluding|except)\s+(.*)$", re.IGNORECASE)
+# "vegan butter", "plant-based cheese": everything a vegan diet forbids is excluded
+_PLANT_BASED = re.compile(r"\b(?:vegan|plant[- ]based)\b", re.IGNORECASE)
+
+
+class DishRequest(NamedTuple):
+    """The dish named by a recipe request, and the ingredients its modifiers exclude ("gluten" for "gluten-free bread")."""
+    dish: str
+    excluded: List[str]
+
+# cue before a list of foods to avoid: "allergic to peanuts and sesame", "can't eat shellfish", "low in salt"
+_AVOID_BEFORE = re.compile(
+    r"\b(?:allerg(?:ic|y|ies) to|intoleran(?:t|ce) (?:to|of)|sensitive to|without|avoid(?:s|ing)?|excluding|"
+    r"free (?:of|from)|(?:can't|cannot|can not|don't|do not|doesn't|does not|shouldn't|should not|must not) "
+    r"(?:eat|have|tolerate)|stay away from|cut(?:ting)? out|low[- ]in)\b",
+    re.IGNORECASE)
+# "no" and "low" only ask to avoid when the list ends with a request: "no onions please", "low sodium diet"
+# ("I have no peanut allergy", "cook on low heat" do not)
+_AVOID_IF_ASKED = re.compile(r"\b(?:no|low)\b", re.IGNORECASE)
+_ASKED = re.compile(
+    r"\s*,?\s*(?:please|pls|for (?:me|us|him|her|them|the kids)|in (?:it|the (?:recipe|dish|meal|food))|at all|"
+    r"diet|thanks|thank you)\b",
+    re.IGNORECASE)
+# cue right after a food: "peanut allergy", "gluten-free", "soy intolerance"
+_AVOID_AFTER = re.compile(r"[- ]?(?:free|allerg(?:y|ies|ic)|intoleran(?:t|ce))\b", re.IGNORECASE)
+# "no peanut allergy", "not lactose intolerant", "don't have a soy allergy": the allergy itself is denied
+_NEGATED = re.compile(
+    r"\b(?:no|not|never|(?:don't|do not|doesn't|does not) have)\s+(?:an?\s+|any\s+)?(?:[\w-]+\s+)?$",
+    re.IGNORECASE)
+_LIST_STOP = re.compile(r"[.;:!?()]")
+_LIST_FILLERS = {'and', 'or', 'nor', 'any', 'all', 'also', 'both', 'either', 'the', 'other', 'of', 'to', 'from'}
+_WORD = re.compile(r"[\w']+")
+
+# "no spoilers", "don't tell me the ending": asking *not* to be spoiled
+_SPOILER_FREE = re.compile(
+    r"\b(?:no|without|avoid(?:ing)?) spoilers?\b|\bspoiler[- ]free\b|\b(?:don't|do not|never) "
+    r"(?:tell|reveal|spoil|give away)\b|\bwithout (?:revealing|giving away|telling)\b",
+    re.IGNORECASE)
+
+# what a spoiler question is about: a show or a character named in capitals, a pronoun, or "the dog"
+_NAME = r"(?-i:[A-Z][\w'’-]*)(?:\s+(?-i:[A-Z][\w'’-]*)){0,3}"
+_SHOW = r"(?:" + _NAME + r"|the (?:show|series|season|movie|film|episode|finale|book|story)|it|this one)"
+_CHARACTER = r"(?:" + _NAME + r"|he|she|they|the \w+)"
+# spoiler questions: an outcome asked about a show or a character; genre and recommendation questions
+# ("good murder mystery shows") name no outcome and pass
+SPOILER_QUESTIONS = [
+    r"who (?:dies|died|gets killed|got killed|is killed|was killed|survives|survived|wins|won) (?:in|on|at the end of) " + _SHOW,
+    r"who (?:killed|betrays|betrayed|ends up with) " + _CHARACTER,
+    r"who (?:is|was|'s) (?:the )?(?:real )?(?:killer|murderer|traitor|mole)",
+    r"how (?:does|did|will) " + _SHOW + r" end",
+    r"how (?:does|did|will) " + _CHARACTER + r" (?:die|get killed)",
+    r"(?:does|did|will) " + _CHARACTER + r" (?:die|survive|get killed|come back|end up with)",
+    r"(?:is|was) " + _CHARACTER + r" (?:the (?:real )?(?:killer|murderer|traitor|mole)|dead|alive)",
+    r"what happens (?:to " + _CHARACTER + r"|in the (?:finale|last episode)|(?:at|in) the end(?:ing)? of " + _SHOW + r")",
+    r"(?:tell|reveal|spoil|give away) (?:me )?(?:the |how |who )?(?:ending|twist|plot twist|finale)",
+    r"what(?:'s| is| was) the (?:ending|twist|plot twist|big reveal)",
+]
+SPOILER_REQUEST = re.compile(r"\b(?:" + '|'.join(SPOILER_QUESTIONS) + r")\b", re.IGNORECASE)
+
+_saved: Dict[str, int] = {}
+_saved_lock = threading.Lock()
+
+def requested_dish(text: str) -> Optional[DishRequest]:
+    """Returns the dish a recipe request asks for, or None if `text` names none.
+
+    Only the noun phrase after the request ("recipe for ...", "I want to cook ...") is taken, so foods
+    mentioned elsewhere in the message are not part of it; "X-free" and "without X" modifiers are
+    removed from the dish and returned as excluded.
+    """
+    match = _DISH_REQUEST.search(text) or _DISH_WORD.search(text)
+    if not match:
+        return None
+    dish = _DISH_END.sub('', match.group(1)).strip()
+    excluded = excluded_terms(dish)
+    without = _WITHOUT.search(dish)
+    if without:
+        dish = dish[:without.start()]
+    dish = _FREE_FROM.sub(' ', dish).strip()
+    return DishRequest(dish, excluded) if dish else None
+
+def excluded_terms(text: str) -> List[str]:
+    """Returns what the modifiers of a dish or ingredient line exclude: "gluten" for "gluten-free pasta",
+    "dairy or nuts" for "curry without dairy or nuts", "vegan" for "vegan butter"."""
+    excluded = [term.lower() for term in _FREE_FROM.findall(text)]
+    if _PLANT_BASED.search(text):
+        excluded.append('vegan')
+    without = _WITHOUT.search(text)
+    if without:
+        excluded.append(without.group(1).strip().lower())
+    return excluded
+
+def _continues_list(gap: str) -> bool:
+    # "peanuts, tree nuts and sesame", "pork or shellfish": only connectors, or a few unknown items
+    # each followed by one, separate the items of the list
+    if _LIST_STOP.search(gap):
+        return False
+    words = [word for word in _WORD.findall(gap.lower()) if word not in _LIST_FILLERS]
+    if not words:
+        return True
+    tail = gap.rstrip().lower()
+    return len(words) <= 3 and (tail.endswith(',') or tail.rsplit(None, 1)[-1] in ('and', 'or', 'nor'))
+
+def avoided_terms(text: str, terms: Iterable[Tuple[str, int, int]]) -> List[str]:
+    """Returns the terms found in `text` that it asks to avoid, in order of first appearance.
+
+    Only the list of items right after an avoid or allergy cue ("allergic to peanuts and sesame",
+    "without dairy") or right before one ("peanut allergy", "gluten-free") counts; a term merely
+    mentioned elsewhere in the text does not. "no" and "low" only count when the list ends with a
+    request ("no eggs please", "low sodium diet"), and a denied allergy ("no peanut allergy") never does.
+
+    Parameters
+    ----------
+    text : str
+        The user message.
+    terms : iterable of (str, int, int)
+        Vocabulary terms found in `text` with their character span.
+    """
+    terms = sorted(terms, key=lambda term: term[1])
+    avoided = []
+    for cue in _AVOID_BEFORE.finditer(text):
+        avoided.extend(_listed_after(text, cue.end(), terms)[0])
+    for cue in _AVOID_IF_ASKED.finditer(text):
+        listed, end = _listed_after(text, cue.end(), terms)
+        # a reply that is only the list ("No eggs.") asks too
+        if listed and (_ASKED.match(text, end) or (not text[:cue.start()].strip() and not text[end:].strip(' .!'))):
+            avoided.extend(listed)
+    avoided.extend(term for term, start, end in terms
+                   if _AVOID_AFTER.match(text, end) and not _NEGATED.search(text, 0, start))
+    return list(dict.fromkeys(avoided))
+
+def _listed_after(text: str, position: int, terms: List[Tuple[str, int, int]]) -> Tuple[List[str], int]:
+    # the terms of the list starting at `position`, and where the list ends
+    listed = []
+    for term, start, end in terms:
+        if start < position:
+            continue
+        if not _continues_list(text[position:start]):
+            break
+        listed.append(term)
+        position = end
+    return listed, position
+
+def is_spoiler_request(text: str, pattern: Pattern = SPOILER_REQUEST) -> Optional[str]:
+    """Returns the spoiler question matched by `pattern` in `text`, unless the text asks to stay spoiler-free."""
+    if _SPOILER_FREE.search(text):
+        return None
+    match = pattern.search(text)
+    return match.group(0) if match else None
+
+def record_generation_saved(scenario: str) -> int:
+    """Counts one turn of `scenario` answered by the input guard and returns the scenario's total."""
+    with _saved_lock:
+        _saved[scenario] = _saved.get(scenario, 0) + 1
+        return _saved[scenario]
+
+def generations_saved(scenario: Optional[str] = None) -> int:
+    """Returns the number of generations the input guard saved in this process, for one or all scenarios."""
+    with _saved_lock:
+        return _saved.get(scenario, 0) if scenario else sum(_saved.values())
@@ -0,0 +1,132 @@
+"""ARIA Keyword Matcher
+
+This module provides a multi-pattern keyword matcher that finds every vocabulary term in a text in
+a single left-to-right scan. Terms are indexed as tuples of casefolded word tokens in a hashed
+prefix trie, so the work per turn depends on the length of the text and the longest term, not on
+the size of the vocabulary. Word-boundary semantics match the ``\\bterm\\b`` regexes it replaces.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * KeywordMatcher - compiled matcher mapping terms to one or more categories
+    * get_vocabulary_matcher - process-wide matcher over the MealPlanner vocabulary datasets
+"""
+import re
+import json
+import threading
+from typing import Dict, List, Iterable, Iterator, Optional, Tuple
+
+from aria_data_store import get_dataset
+
+_TOKEN = re.compile(r"\w+")
+
+# category name -> dataset name of the vocabularies matched in every MealPlanner turn
+VOCABULARY_DATASETS: Dict[str, str] = {
+    'cuisines': 'cuisines',
+    'restrictions': 'restrictions',
+    'medications': 'medications',
+    'allergens': 'allergens',
+}
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """Splits `text` into casefolded word tokens with their character offsets."""
+    return [(m.group().casefold(), m.start(), m.end()) for m in _TOKEN.finditer(text)]
+
+class KeywordMatcher:
+    """Matches all terms of a categorized vocabulary in one pass over the input.
+
+    Parameters
+    ----------
+    vocabularies : dict, optional
+        Mapping of category name to an iterable of terms. A term may belong to several categories.
+    """
+
+    def __init__(self, vocabularies: Optional[Dict[str, Iterable[str]]] = None):
+        self._terms: Dict[Tuple[str, ...], Tuple[str, List[str]]] = {}
+        self._prefixes = set()
+        if vocabularies:
+            for category, terms in vocabularies.items():
+                for term in terms:
+                    self.add(term, category)
+
+    @classmethod
+    def from_json(cls, path: str) -> 'KeywordMatcher':
+        """Builds a matcher from a JSON file of the form {"category": ["term", ...], ...}."""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def add(self, term: str, category: str):
+        """Adds `term` under `category`."""
+        key = tuple(token for token, _, _ in tokenize(term))
+        if not key:
+            return
+        canonical, categories = self._terms.setdefault(key, (term.strip().lower(), []))
+        if category not in categories:
+            categories.append(category)
+        for size in range(1, len(key) + 1):
+            self._prefixes.add(key[:size])
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def terms(self) -> List[str]:
+        """Returns the indexed terms (lowercased, as first added) in insertion order."""
+        return [term for term, _ in self._terms.values()]
+
+    def finditer(self, text: str, longest_only: bool = False) -> Iterator[Tuple[str, List[str], int, int]]:
+        """Yields (term, categories, start, end) for each term found in `text`, left to right.
+
+        Overlapping terms are all reported (e.g. "crustacean shellfish" and "shellfish") unless
+        `longest_only` is set, in which case only the longest term starting at each position is
+        reported and the scan resumes after it.
+        """
+        tokens = tokenize(text)
+        count = len(tokens)
+        i = 0
+        while i < count:
+            key: Tuple[str, ...] = ()
+            longest = None
+            j = i
+            while j < count:
+                key = key + (tokens[j][0],)
+                if key not in self._prefixes:
+                    break
+                entry = self._terms.get(key)
+                if entry is not None:
+                    if not longest_only:
+                        yield entry[0], entry[1], tokens[i][1], tokens[j][2]
+                    longest = (entry, j)
+                j += 1
+            if longest_only and longest is not None:
+                (term, categories), end = longest
+                yield term, categories, tokens[i][1], tokens[end][2]
+                i = end + 1
+            else:
+                i += 1
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """Returns the unique terms found in `text` per category, in order of first appearance."""
+        found: Dict[str, List[str]] = {}
+        for term, categories, _, _ in self.finditer(text):
+            for category in categories:
+                terms = found.setdefault(category, [])
+                if term not in terms:
+                    terms.append(term)
+        return found
+
+_vocabulary_matcher: Optional[KeywordMatcher] = None
+_vocabulary_generations: Optional[Tuple[int, ...]] = None
+_vocabulary_lock = threading.Lock()
+
+def get_vocabulary_matcher() -> KeywordMatcher:
+    """Returns the shared matcher over VOCABULARY_DATASETS, rebuilt only when a dataset is swapped."""
+    global _vocabulary_matcher, _vocabulary_generations
+    datasets = {category: get_dataset(name) for category, name in VOCABULARY_DATASETS.items()}
+    generations = tuple(dataset.generation for dataset in datasets.values())
+    if _vocabulary_matcher is None or generations != _vocabulary_generations:
+        with _vocabulary_lock:
+            if _vocabulary_matcher is None or generations != _vocabulary_generations:
+                _vocabulary_matcher = KeywordMatcher(
+                    {category: dataset.keys() for category, dataset in datasets.items()})
+                _vocabulary_generations = generations
+    return _vocabulary_matcher
@@ -0,0 +1,223 @@
+"""ARIA Dialog Log Re-scoring
+
+This script re-applies the guardrail rules of a scenario to the dialog turns recorded by
+aria_logging_api.log_dialog_turn, so an updated or candidate rule pack can be checked against
+everything the model has already said. Log files are streamed line by line in chunks, the chunks
+are scored by a pool of worker processes (each compiles the rule packs once) and only per-chunk
+aggregates come back, with a bounded number of chunks in flight, so memory stays bounded whatever
+the size of the logs.
+
+For every scored turn the active rule pack of the scenario decides whether the text would be
+blocked; with a candidate pack, the candidate decides too and the turns where the two decisions
+differ are reported (and written to a JSON lines file with --changes). The summary has the hits
+per rule of each pack and the throughput in turns per second.
+
+The response of a blocked turn is the refusal, not what the model said, so responses are scored from
+the model_response turn metric the scenarios record before their guardrails. Turns without one (older
+logs) fall back to the logged response, except refusals and turns answered without the model, which
+are skipped and counted.
+
+Run from the repository root:
+
+    python aria_log_rescore.py --scenario tv_spoilers /tmp/foo.json
+    python aria_log_rescore.py --scenario path_finders --candidate my_rules.json --changes changes.jsonl logs/*.json
+
+This file can also be imported as a module and contains the following function(s):
+
+    * iter_dialog_turns - dialog turn records of log lines
+    * score_chunk - scores one chunk of log lines (run in the worker processes)
+    * rescore - scores log files with a process pool and returns the merged statistics
+"""
+import os
+import ast
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from aria_guardrail_rules import RULE_PACK_DIR, GuardrailRules, read_rule_pack
+
+CHUNK_LINES = 2000
+# beginnings of the answers the scenarios give instead of a blocked model response
+REFUSALS = ("Sorry, I cannot reveal that information",
+            "Sorry, I can only provide accurate and factual travel-related information",
+            "I cannot recommend if it violates",
+            "Hmm, it seems like the recipe includes some non-food items")
+
+_rules: Dict[str, GuardrailRules] = {}
+
+def iter_dialog_turns(lines: Iterable[str]) -> Iterator[dict]:
+    """Yields the metadata of every log_dialog_turn record in `lines`; other records and broken lines are skipped."""
+    for line in lines:
+        # cheap filter before parsing: most lines of a busy log are other records
+        if "'log_dialog_turn'" not in line:
+            continue
+        try:
+            record = ast.literal_eval(json.loads(line)['message'])
+        except (ValueError, SyntaxError, KeyError, TypeError):
+            continue
+        if isinstance(record, dict) and record.get('logging_record_type') == 'log_dialog_turn':
+            yield record
+
+def _text(record: dict, field: str) -> Optional[str]:
+    if field == 'response' and isinstance(record.get('model_response'), str):
+        return record['model_response']
+    value = record.get(field)
+    # the repl logs the whole GetResponse result
+    if isinstance(value, dict):
+        value = value.get('response')
+    return value if isinstance(value, str) else None
+
+def _init_worker(active_path: str, candidate_path: Optional[str]):
+    _rules['active'] = read_rule_pack(active_path)
+    if candidate_path:
+        _rules['candidate'] = read_rule_pack(candidate_path)
+
+def score_chunk(lines: List[str], field: str = 'response', max_changes: int = 100) -> dict:
+    """Scores the dialog turns of `lines` with the rule packs of the worker and returns the chunk aggregates."""
+    active = _rules['active']
+    candidate = _rules.get('candidate')
+    result = {'lines': len(lines), 'turns': 0, 'skipped': 0, 'active_blocked': 0, 'candidate_blocked': 0,
+              'changed': 0, 'active_hits': {}, 'candidate_hits': {}, 'changes': []}
+    for record in iter_dialog_turns(lines):
+        text = _text(record, field)
+        if text is None:
+            continue
+        if field == 'response' and 'model_response' not in record and (
+                record.get('generation_skipped') or text.startswith(REFUSALS)):
+            # no model output was logged for this turn
+            result['skipped'] += 1
+            continue
+        result['turns'] += 1
+        active_rules = sorted({match.rule_id for match in active.evaluate(text)})
+        for rule in active_rules:
+            result['active_hits'][rule] = result['active_hits'].get(rule, 0) + 1
+        result['active_blocked'] += bool(active_rules)
+        if candidate is None:
+            continue
+        candidate_rules = sorted({match.rule_id for match in candidate.evaluate(text)})
+        for rule in candidate_rules:
+            result['candidate_hits'][rule] = result['candidate_hits'].get(rule, 0) + 1
+        result['candidate_blocked'] += bool(candidate_rules)
+        if bool(active_rules) != bool(candidate_rules):
+            result['changed'] += 1
+            if len(result['changes']) < max_changes:
+                result['changes'].append({key: record.get(key) for key in ('experiment_id', 'session_num', 'adjpair_num')}
+                                         | {'text': text, 'active_rules': active_rules, 'candidate_rules': candidate_rules})
+    return result
+
+def _chunks(paths: Iterable[str]) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for path in paths:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                chunk.append(line)
+                if len(chunk) >= CHUNK_LINES:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+def _merge(total: dict, part: dict):
+    for key in ('lines', 'turns', 'skipped', 'active_blocked', 'candidate_blocked', 'changed'):
+        total[key] += part[key]
+    for key in ('active_hits', 'candidate_hits'):
+        for rule, hits in part[key].items():
+            total[key][rule] = total[key].get(rule, 0) + hits
+
+def rescore(paths: List[str], active_path: str, candidate_path: Optional[str] = None, field: str = 'response',
+            workers: Optional[int] = None, changes_path: Optional[str] = None) -> dict:
+    """Scores the dialog turns of the log files `paths` in a process pool.
+
+    Parameters
+    ----------
+    paths : list of str
+        Log files written by aria_logging_api.
+    active_path, candidate_path : str
+        Rule pack files; the candidate is optional.
+    field : str
+        'response' to score the model responses (output guardrails) or 'query' to score the requests (input guards).
+    workers : int, optional
+        Worker processes, all cores by default.
+    changes_path : str, optional
+        JSON lines file receiving the turns whose decision changed (up to 100 per chunk).
+
+    Returns
+    -------
+    dict
+        totals, hits per rule of each pack, and 'turns_per_second'; 'skipped' counts the turns
+        without a model response
+    """
+    workers = workers or os.cpu_count() or 1
+    total = {'lines': 0, 'turns': 0, 'skipped': 0, 'active_blocked': 0, 'candidate_blocked': 0, 'changed': 0,
+             'active_hits': {}, 'candidate_hits': {}}
+    changes = open(changes_path, 'w', encoding='utf-8') if changes_path else None
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(active_path, candidate_path)) as pool:
+            pending = set()
+            for chunk in _chunks(paths):
+                # bounded number of chunks in flight keeps memory flat on multi-GB logs
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _collect(future.result(), total, changes)
+                pending.add(pool.submit(score_chunk, chunk, field))
+            for future in pending:
+                _collect(future.result(), total, changes)
+    finally:
+        if changes:
+            changes.close()
+    elapsed = time.perf_counter() - start
+    total['seconds'] = round(elapsed, 3)
+    total['turns_per_second'] = round(total['turns'] / elapsed, 1) if elapsed else 0.0
+    return total
+
+def _collect(part: dict, total: dict, changes):
+    _merge(total, part)
+    if changes:
+        for change in part['changes']:
+            changes.write(json.dumps(change) + '\n')
+
+def _print_hits(title: str, hits: Dict[str, int]):
+    print(title)
+    for rule, count in sorted(hits.items(), key=lambda item: -item[1]):
+        print(f"    {rule:<60} {count:>8}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Re-apply guardrail rule packs to dialog logs.")
+    parser.add_argument('logs', nargs='+', help="log files written by aria_logging_api")
+    parser.add_argument('--scenario', required=True, help="scenario whose active rule pack is applied")
+    parser.add_argument('--rules', help="rule pack to use instead of the active one of the scenario")
+    parser.add_argument('--candidate', help="candidate rule pack to compare (default: the scenario's candidate, if any)")
+    parser.add_argument('--field', choices=('response', 'query'), default='response',
+                        help="score the responses (output guardrails) or the queries (input guards)")
+    parser.add_argument('--workers', type=int, help="worker processes (default: all cores)")
+    parser.add_argument('--changes', help="write the turns whose decision changed to this JSON lines file")
+    parser.add_argument('--json', dest='json_path', help="also write the statistics to this file")
+    args = parser.parse_args()
+    active_pack = args.rules or os.path.join(RULE_PACK_DIR, f"{args.scenario}.json")
+    candidate_pack = args.candidate
+    if candidate_pack is None and os.path.exists(os.path.join(RULE_PACK_DIR, 'candidates', f"{args.scenario}.json")):
+        candidate_pack = os.path.join(RULE_PACK_DIR, 'candidates', f"{args.scenario}.json")
+    try:
+        stats = rescore(args.logs, active_pack, candidate_pack, args.field, args.workers, args.changes)
+    except (OSError, ValueError) as e:
+        print(f"aria_log_rescore: ERROR: {e}")
+        sys.exit(1)
+    print(f"Scored {stats['turns']} turns ({stats['lines']} log lines) in {stats['seconds']} s: "
+          f"{stats['turns_per_second']} turns/s")
+    if stats['skipped']:
+        print(f"Skipped {stats['skipped']} turns logged without a model response (refusals and local answers)")
+    print(f"Blocked by {os.path.basename(active_pack)}: {stats['active_blocked']}")
+    _print_hits("Hits per rule:", stats['active_hits'])
+    if candidate_pack:
+        print(f"Blocked by candidate {os.path.basename(candidate_pack)}: {stats['candidate_blocked']}, "
+              f"changed decisions: {stats['changed']}")
+        _print_hits("Candidate hits per rule:", stats['candidate_hits'])
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(stats, f, indent=4)
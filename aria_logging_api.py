@@ -13,6 +13,7 @@ functions:
 """
 import logging, sys
 from utils import JsonFormatter
+from aria_guardrail_rules import rule_pack_versions
 
 #TODO: replace hardcoded filepath with environment variable
 log_filepath = "/tmp/foo.json"
@@ -101,6 +102,7 @@ def log_dialog_turn(experiment_id, session_num, adjpair_num, query, response,
         metadata_dict = {}
     metadata_dict['experiment_id'] = experiment_id
     metadata_dict['logging_record_type'] = 'log_dialog_turn'
+    metadata_dict['rule_pack_versions'] = rule_pack_versions()
     metadata_dict['session_num'] = session_num
     metadata_dict['adjpair_num'] = adjpair_num
     metadata_dict['query'] = query
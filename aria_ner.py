@@ -0,0 +1,94 @@
+"""ARIA Named Entity Extraction
+
+This module provides the optional spaCy NER mode of PathFinders and TVSpoilers. The scenarios
+used to load their own spaCy pipeline in __init__ and run every component of it on every call,
+which is why spaCy had been disabled for latency. Here one pipeline is shared by the whole process,
+loaded on first use only, with the components NER does not need (tagger, parser, attribute ruler,
+lemmatizer) disabled, and texts are processed in batches through ``nlp.pipe``. The scenarios reach
+it through the worker processes of aria_ner_service.
+
+spaCy is an optional dependency (see requirements.txt). When it or its model is not installed,
+extraction falls back to the capitalized-word heuristic the scenarios use by default.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * capitalized_words - the regex heuristic: every capitalized word of a text
+    * spacy_available - whether spaCy can be imported
+    * get_nlp - process-wide spaCy pipeline, loaded on first use (None if unavailable)
+    * extract_entities - entities of the given labels in a batch of texts
+"""
+import re
+import threading
+import importlib.util
+from typing import Iterable, List, Sequence
+
+SPACY_MODEL = 'en_core_web_sm'
+PLACE_LABELS = ('GPE', 'LOC')
+NAME_LABELS = ('PERSON', 'ORG', 'GPE')
+BATCH_SIZE = 32
+_UNUSED_COMPONENTS = ('tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter', 'morphologizer')
+
+_CAPITALIZED = re.compile(r"\b[A-Z][a-z]+\b")
+
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+def capitalized_words(text: str) -> List[str]:
+    """Returns every capitalized word of `text`, the heuristic used when NER is off or unavailable."""
+    return _CAPITALIZED.findall(text)
+
+def spacy_available() -> bool:
+    """Returns True if spaCy is installed."""
+    return importlib.util.find_spec('spacy') is not None
+
+def get_nlp():
+    """Returns the shared spaCy pipeline with only the components NER needs, or None if spaCy or its model is missing.
+
+    The pipeline is loaded once per process, on first use; a failed load is not retried.
+    """
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                if spacy_available():
+                    import spacy
+                    try:
+                        nlp = spacy.load(SPACY_MODEL)
+                        for name in _UNUSED_COMPONENTS:
+                            if name in nlp.pipe_names:
+                                nlp.disable_pipe(name)
+                        _nlp = nlp
+                        print(f"aria_ner: Loaded spaCy model '{SPACY_MODEL}' with components {nlp.pipe_names}")
+                    except OSError as e:
+                        print(f"aria_ner: spaCy model '{SPACY_MODEL}' unavailable, using the regex heuristic: {e}")
+                else:
+                    print("aria_ner: spaCy is not installed, using the regex heuristic.")
+                _nlp_loaded = True
+    return _nlp
+
+def extract_entities(texts: Iterable[str], labels: Sequence[str] = PLACE_LABELS,
+                     batch_size: int = BATCH_SIZE, nlp=None) -> List[List[str]]:
+    """Returns the entities of `labels` found in each text, in order, processing the texts in batches.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        Documents to process.
+    labels : sequence of str
+        spaCy entity labels to keep, e.g. PLACE_LABELS.
+    batch_size : int
+        Documents per ``nlp.pipe`` batch.
+    nlp : optional
+        Pipeline to use instead of the shared one.
+
+    Returns
+    -------
+    list of list of str
+        per text, the entity texts; the capitalized words when spaCy is unavailable
+    """
+    nlp = nlp or get_nlp()
+    if nlp is None:
+        return [capitalized_words(text) for text in texts]
+    return [[ent.text for ent in doc.ents if ent.label_ in labels] for doc in nlp.pipe(texts, batch_size=batch_size)]
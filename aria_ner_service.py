@@ -0,0 +1,211 @@
+"""ARIA NER Service
+
+spaCy NER is CPU-bound and holds the GIL while it runs, so in a threaded server one long model
+response being tagged stalls the I/O of every other session. This module runs the NER of the
+scenarios (see aria_ner) in a small pool of worker processes instead; each worker loads the shared
+pipeline once, as soon as the pool is started (scenarios start it when they open a connection in NER
+mode), so the model is loaded before the first turn rather than during it. A call that arrives while
+the workers are still loading waits for them, at most WARMUP_TIMEOUT, and only then submits its text
+and waits at most the per-call timeout for the entities:
+
+    * the number of texts waiting for or being processed by the workers is bounded; when the pool is
+      saturated a text is not queued at all
+    * a text that is not answered within the timeout is cancelled if it has not started yet
+    * in both cases, and when spaCy or its model is not installed, the capitalized-word heuristic
+      answers instead, so once the workers are ready a turn is never slower than the timeout
+
+Every call returns its latency, whether NER or the heuristic answered, and why the heuristic was
+used; the service keeps process-wide counters of the same.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * NERResult - entities of one text with the latency and source of the answer
+    * NERService - process pool running the NER, with bounded queue, timeout and fallback
+    * get_ner_service - process-wide NERService
+"""
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from aria_ner import PLACE_LABELS, capitalized_words, extract_entities, get_nlp, spacy_available
+
+NER_WORKERS = 2
+QUEUE_SIZE = 16
+# seconds a request thread waits for the workers before answering with the heuristic
+TIMEOUT = 0.5
+# seconds a call waits for the workers to load the pipeline, on top of the per-call timeout
+WARMUP_TIMEOUT = 30.0
+
+
+class NERResult(NamedTuple):
+    """Entities found in one text, the time the call took, and 'spacy' or 'regex' with the fallback reason if any."""
+    entities: List[str]
+    latency_us: float
+    source: str
+    fallback: Optional[str] = None
+
+    def metrics(self) -> dict:
+        """Returns the per-call metrics recorded in the turn metrics of the scenarios."""
+        return {'latency_us': round(self.latency_us, 1), 'source': self.source, 'fallback': self.fallback}
+
+def _load_worker():
+    get_nlp()
+
+def _warm_up() -> bool:
+    return get_nlp() is not None
+
+def _extract_in_worker(text: str, labels: Tuple[str, ...]) -> Tuple[List[str], bool]:
+    return extract_entities([text], labels)[0], get_nlp() is not None
+
+
+class NERService:
+    """Runs NER in worker processes for the request threads.
+
+    Parameters
+    ----------
+    workers : int
+        Worker processes, each holding its own spaCy pipeline.
+    queue_size : int
+        Largest number of texts submitted and not yet answered; further texts get the heuristic.
+    timeout : float
+        Seconds a call waits for its entities before answering with the heuristic; the time the
+        workers take to load the pipeline is not part of it.
+
+    Attributes
+    ----------
+    calls, total_us, max_us : int, float
+        Process-wide number of calls and their cumulative and worst latency.
+    fallbacks : dict
+        Calls answered by the heuristic, by reason ('queue_full', 'timeout', 'error', 'unavailable',
+        'warming_up').
+    """
+
+    def __init__(self, workers: int = NER_WORKERS, queue_size: int = QUEUE_SIZE, timeout: float = TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # set once every worker of the current pool has loaded the pipeline
+        self._ready = threading.Event()
+        self.calls = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+        self.fallbacks: Dict[str, int] = {}
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawned rather than forked: the parent is a threaded server
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_load_worker,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+                    self._warm_up(self._pool)
+                    print(f"NERService: Started {self.workers} NER worker processes.")
+        return self._pool
+
+    def _warm_up(self, pool: ProcessPoolExecutor):
+        # one task per worker makes the pool spawn all of them; each loads the pipeline in its initializer
+        self._ready.clear()
+        remaining = [self.workers]
+        # not self._lock: a callback may run right away, in the thread holding it
+        counter_lock = threading.Lock()
+
+        def loaded(_):
+            with counter_lock:
+                remaining[0] -= 1
+                done = remaining[0] == 0
+            if done and self._pool is pool:
+                self._ready.set()
+        for _ in range(self.workers):
+            pool.submit(_warm_up).add_done_callback(loaded)
+
+    def start(self, wait: bool = False) -> bool:
+        """Starts the worker processes and their pipeline load if spaCy is installed.
+
+        Returns whether the workers are ready; with `wait`, after waiting at most WARMUP_TIMEOUT.
+        """
+        if not spacy_available():
+            return False
+        self._executor()
+        return self._ready.wait(WARMUP_TIMEOUT) if wait else self._ready.is_set()
+
+    def extract(self, text: str, labels: Sequence[str] = PLACE_LABELS) -> NERResult:
+        """Returns the entities of `labels` in `text`, from the workers or, failing them, from the heuristic."""
+        start = time.perf_counter()
+        entities, fallback = None, None
+        if not spacy_available():
+            fallback = 'unavailable'
+        elif not self.start(wait=True):
+            fallback = 'warming_up'
+        elif not self._slots.acquire(blocking=False):
+            fallback = 'queue_full'
+        else:
+            try:
+                future = self._executor().submit(_extract_in_worker, text, tuple(labels))
+            except (BrokenProcessPool, RuntimeError) as e:
+                self._slots.release()
+                self._reset(e)
+                fallback = 'error'
+            else:
+                # the slot is freed when the worker is done, not when the caller stops waiting
+                future.add_done_callback(lambda _: self._slots.release())
+                try:
+                    entities, loaded = future.result(timeout=self.timeout)
+                    if not loaded:
+                        entities, fallback = None, 'unavailable'
+                except TimeoutError:
+                    future.cancel()
+                    fallback = 'timeout'
+                except BrokenProcessPool as e:
+                    self._reset(e)
+                    fallback = 'error'
+        if entities is None:
+            entities = capitalized_words(text)
+        latency_us = (time.perf_counter() - start) * 1e6
+        with self._lock:
+            self.calls += 1
+            self.total_us += latency_us
+            self.max_us = max(self.max_us, latency_us)
+            if fallback:
+                self.fallbacks[fallback] = self.fallbacks.get(fallback, 0) + 1
+        return NERResult(entities, latency_us, 'regex' if fallback else 'spacy', fallback)
+
+    def _reset(self, error: Exception):
+        # a crashed worker breaks the whole pool; the next call starts a new one
+        print(f"NERService: ERROR: NER worker pool failed, restarting on next call: {error}")
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._ready.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Stops the worker processes; the next call starts new ones."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._ready.clear()
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """Returns the number of calls, their mean and max latency, and the fallbacks by reason."""
+        with self._lock:
+            return {'calls': self.calls, 'mean_us': round(self.total_us / self.calls, 1) if self.calls else 0.0,
+                    'max_us': round(self.max_us, 1), 'fallbacks': dict(self.fallbacks)}
+
+_service: Optional[NERService] = None
+_service_lock = threading.Lock()
+
+def get_ner_service() -> NERService:
+    """Returns the process-wide NERService; its workers are started on the first call that needs them."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = NERService()
+    return _service
@@ -0,0 +1,148 @@
+"""ARIA Nutrition
+
+This module computes calories outside the LLM. A bundled nutrition table (energy and macros per
+100 g, plus densities and piece weights for volume and count units) is loaded into NumPy arrays;
+the ingredients of a parsed recipe are resolved to table rows, converted to grams and totalled
+with one vectorized product. Member calorie requirements are estimated from age and weight with
+the WHO/FAO/UNU (Schofield) BMR equations, averaged over sex, times a light activity factor.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * NutritionTable - per-100 g nutrition table with a vectorized recipe calculator
+    * get_nutrition_table - process-wide NutritionTable, rebuilt when the dataset is swapped
+    * estimate_calorie_requirements - vectorized daily kcal estimate from ages and weights
+    * format_recipe_nutrition - compact one-line rendering of a recipe calculation
+"""
+import threading
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from aria_data_store import get_dataset
+from aria_grocery_plan import UNITS, parse_quantity
+from aria_keyword_matcher import KeywordMatcher
+
+NUTRIENTS = ('kcal', 'protein_g', 'fat_g', 'carbs_g')
+PHYSICAL_ACTIVITY_LEVEL = 1.55
+
+# lower age bound of each band -> (slope, intercept) of BMR (kcal/day) on weight (kg), male and female averaged
+_SCHOFIELD_BANDS = np.array([0, 3, 10, 18, 30, 60], dtype=float)
+_SCHOFIELD_SLOPE = np.array([60.95, 22.6, 14.85, 15.0, 10.15, 12.0])
+_SCHOFIELD_INTERCEPT = np.array([-52.5, 497.0, 698.5, 587.5, 854.0, 541.5])
+
+def estimate_calorie_requirements(ages: Iterable[float], weights: Iterable[float]) -> np.ndarray:
+    """Returns the estimated daily energy requirement (kcal) for each (age, weight) pair."""
+    ages = np.asarray(list(ages), dtype=float)
+    weights = np.asarray(list(weights), dtype=float)
+    band = np.searchsorted(_SCHOFIELD_BANDS, ages, side='right') - 1
+    band = np.clip(band, 0, len(_SCHOFIELD_BANDS) - 1)
+    bmr = _SCHOFIELD_SLOPE[band] * weights + _SCHOFIELD_INTERCEPT[band]
+    return np.round(bmr * PHYSICAL_ACTIVITY_LEVEL, -1)
+
+def estimate_calorie_requirement(age: float, weight: float) -> int:
+    """Returns the estimated daily energy requirement (kcal) of one person."""
+    return int(estimate_calorie_requirements([age], [weight])[0])
+
+
+class NutritionTable:
+    """Nutrition values per 100 g indexed by food name.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Records with "food", the NUTRIENTS per 100 g, and optional "g_per_ml" / "g_per_piece".
+    """
+
+    def __init__(self, records: Iterable[dict]):
+        records = list(records)
+        self.foods: List[str] = [record['food'] for record in records]
+        self.values = np.array([[record.get(n) or 0.0 for n in NUTRIENTS] for record in records], dtype=float)
+        self.g_per_ml = np.array([record.get('g_per_ml') or 1.0 for record in records], dtype=float)
+        self.g_per_piece = np.array([record.get('g_per_piece') or np.nan for record in records], dtype=float)
+        self._matcher = KeywordMatcher()
+        for row, food in enumerate(self.foods):
+            self._matcher.add(food, str(row))
+
+    def __len__(self) -> int:
+        return len(self.foods)
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Returns the table row of the longest food name found in `name`, or None."""
+        best = None
+        for term, rows, start, end in self._matcher.finditer(name, longest_only=True):
+            if best is None or end - start > best[0]:
+                best = (end - start, int(rows[0]))
+        return best[1] if best else None
+
+    def recipe_nutrition(self, ingredients: Iterable[str], servings: Optional[int] = None) -> dict:
+        """Totals the nutrition of ingredient lines such as "2 cups rice" or "200 g paneer".
+
+        Lines without a quantity, with an unknown food, or counted in pieces of a food without a
+        known piece weight are reported in `unresolved` and left out of the totals.
+
+        Returns
+        -------
+        dict
+            'total' and (with `servings`) 'per_serving' nutrient dictionaries, 'resolved' and
+            'unresolved' ingredient lines
+        """
+        rows: List[int] = []
+        amounts: List[float] = []
+        kinds: List[int] = []  # 0 grams, 1 millilitres, 2 pieces
+        resolved: List[str] = []
+        unresolved: List[str] = []
+        for ingredient in ingredients:
+            quantity, unit, name = parse_quantity(ingredient)
+            row = self.lookup(name) if name else None
+            if quantity is None or row is None:
+                unresolved.append(ingredient)
+                continue
+            _, dimension, size = UNITS[unit]
+            rows.append(row)
+            amounts.append(quantity * size)
+            kinds.append({'mass': 0, 'volume': 1, 'count': 2}[dimension])
+            resolved.append(ingredient)
+        result = {'total': dict.fromkeys(NUTRIENTS, 0.0), 'resolved': resolved, 'unresolved': unresolved}
+        if rows:
+            rows_arr = np.asarray(rows)
+            amounts_arr = np.asarray(amounts)
+            kinds_arr = np.asarray(kinds)
+            grams = np.where(kinds_arr == 0, amounts_arr,
+                             np.where(kinds_arr == 1, amounts_arr * self.g_per_ml[rows_arr],
+                                      amounts_arr * self.g_per_piece[rows_arr]))
+            known = ~np.isnan(grams)
+            for index in np.flatnonzero(~known):
+                unresolved.append(resolved[index])
+            result['resolved'] = [line for line, ok in zip(resolved, known) if ok]
+            totals = (grams[known] / 100.0) @ self.values[rows_arr[known]]
+            result['total'] = {n: round(float(v), 1) for n, v in zip(NUTRIENTS, totals)}
+        if servings:
+            result['servings'] = servings
+            result['per_serving'] = {n: round(v / servings, 1) for n, v in result['total'].items()}
+        return result
+
+def format_recipe_nutrition(nutrition: dict) -> str:
+    """Renders a recipe_nutrition result as one line for the response."""
+    values = nutrition.get('per_serving') or nutrition['total']
+    scope = f"per serving (serves {nutrition['servings']})" if 'per_serving' in nutrition else "for the whole recipe"
+    line = (f"Verified nutrition {scope}: {values['kcal']:.0f} kcal, protein {values['protein_g']:.0f} g, "
+            f"fat {values['fat_g']:.0f} g, carbohydrates {values['carbs_g']:.0f} g")
+    if nutrition['unresolved']:
+        line += f" (not counted: {', '.join(nutrition['unresolved'])})"
+    return line + "."
+
+_table: Optional[NutritionTable] = None
+_table_generation: Optional[int] = None
+_table_lock = threading.Lock()
+
+def get_nutrition_table() -> NutritionTable:
+    """Returns the shared NutritionTable, rebuilt only when the nutrition dataset is swapped."""
+    global _table, _table_generation
+    dataset = get_dataset('nutrition')
+    if _table is None or dataset.generation != _table_generation:
+        with _table_lock:
+            if _table is None or dataset.generation != _table_generation:
+                _table = NutritionTable(dataset.values())
+                _table_generation = dataset.generation
+    return _table
@@ -0,0 +1,164 @@
+"""ARIA Recipe Corpus
+
+This module serves real recipes without the LLM. A bundled recipe corpus is indexed once into
+inverted postings (ingredient, allergen/diet class, cuisine and tag -> recipes), each posting a
+bitset over the corpus. Excluding everything the session's restrictions and allergies forbid is a
+few bitwise operations, and ranking touches only the postings of the terms found in the request,
+so MealPlanner can answer with a compliant recipe in well under a millisecond whenever the model
+is unavailable.
+
+Ingredient classes come from the same IngredientIndex that checks model responses (see
+aria_allergen_index), so a recipe served here passes the same violation check.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * RecipeCorpus - inverted index over the recipe corpus with restriction filtering
+    * render_recipe - markdown rendering of a corpus recipe in the MealPlanner section layout
+    * get_recipe_corpus - process-wide RecipeCorpus, rebuilt when a dataset is swapped
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from aria_allergen_index import IngredientIndex, get_ingredient_index
+from aria_data_store import get_dataset
+from aria_grocery_plan import parse_quantity
+from aria_keyword_matcher import KeywordMatcher
+
+# score of a recipe per term found in one of its postings, times QUERY_WEIGHT for the request itself
+TERM_WEIGHTS = {'cuisine': 3, 'tag': 2, 'ingredient': 1}
+QUERY_WEIGHT = 3
+DISLIKE_PENALTY = 4
+
+
+class RecipeCorpus:
+    """Inverted index over corpus recipes.
+
+    Parameters
+    ----------
+    recipes : iterable of dict
+        Records with "name", "cuisine", "tags", "servings", "ingredients" and "steps".
+    ingredient_index : IngredientIndex
+        Resolves ingredient lines to allergen and diet classes.
+    """
+
+    def __init__(self, recipes: Iterable[dict], ingredient_index: IngredientIndex):
+        self.recipes: List[dict] = list(recipes)
+        self.ingredient_index = ingredient_index
+        self._all = (1 << len(self.recipes)) - 1
+        # "kind:term" -> bitset of the recipes holding it
+        self._postings: Dict[str, int] = {}
+        self._terms = KeywordMatcher()
+        for position, recipe in enumerate(self.recipes):
+            bit = 1 << position
+            self._post('cuisine', recipe.get('cuisine', ''), bit)
+            for tag in recipe.get('tags', []):
+                self._post('tag', tag, bit)
+            for line in recipe['ingredients']:
+                self._post('ingredient', parse_quantity(line)[2], bit)
+                for _, classes in ingredient_index.classify(line):
+                    for class_name in classes:
+                        self._postings[f"class:{class_name}"] = self._postings.get(f"class:{class_name}", 0) | bit
+
+    def _post(self, kind: str, term: str, bit: int):
+        term = term.strip().lower()
+        if not term:
+            return
+        key = f"{kind}:{term}"
+        if key not in self._postings:
+            # ingredient names are stored singular; requests usually say "chickpeas", "tomatoes"
+            for surface in {term, _plural(term)} if kind == 'ingredient' else {term}:
+                self._terms.add(surface, key)
+        self._postings[key] = self._postings.get(key, 0) | bit
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+    def allowed(self, restrictions: Iterable[str]) -> int:
+        """Returns the bitset of recipes containing no class forbidden by any of `restrictions`."""
+        allowed = self._all
+        for restriction in restrictions:
+            for class_name in self.ingredient_index.forbidden_classes(restriction):
+                allowed &= ~self._postings.get(f"class:{class_name}", 0)
+        return allowed
+
+    def search(self, query: str = '', restrictions: Iterable[str] = (), preferences: Iterable[str] = (),
+               dislikes: Iterable[str] = (), limit: int = 1) -> List[dict]:
+        """Returns up to `limit` compliant recipes, best match first.
+
+        Parameters
+        ----------
+        query : str
+            The request; its cuisines, tags and ingredients raise a recipe the most.
+        restrictions : iterable of str
+            Restrictions, allergies and conditions; recipes with a forbidden class are excluded.
+        preferences : iterable of str
+            Standing preferences and liked foods, weighted below the request.
+        dislikes : iterable of str
+            Disliked foods, which lower a recipe's score.
+
+        Returns
+        -------
+        list of dict
+            corpus records; ties keep corpus order
+        """
+        allowed = self.allowed(restrictions)
+        if not allowed:
+            return []
+        scores: Dict[int, int] = {}
+        self._score(query, allowed, scores, QUERY_WEIGHT)
+        self._score(' ; '.join(preferences), allowed, scores, 1)
+        self._score(' ; '.join(dislikes), allowed, scores, -DISLIKE_PENALTY)
+        ranked = sorted(_positions(allowed), key=lambda position: -scores.get(position, 0))
+        return [self.recipes[position] for position in ranked[:limit]]
+
+    def _score(self, text: str, allowed: int, scores: Dict[int, int], weight: int):
+        if not text.strip():
+            return
+        seen = set()
+        for _, keys, _, _ in self._terms.finditer(text.lower(), longest_only=True):
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+                points = weight * TERM_WEIGHTS[key.split(':', 1)[0]]
+                for position in _positions(self._postings[key] & allowed):
+                    scores[position] = scores.get(position, 0) + points
+
+def _plural(term: str) -> str:
+    if term.endswith(('o', 's', 'ch', 'sh')):
+        return term + 'es'
+    if term.endswith('y') and term[-2:-1] not in ('a', 'e', 'o', 'u'):
+        return term[:-1] + 'ies'
+    return term + 's'
+
+def _positions(bits: int) -> Iterable[int]:
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+def render_recipe(recipe: dict) -> str:
+    """Renders a corpus recipe with the Ingredients / Preparation Steps / Grocery List sections."""
+    ingredients = '\n'.join(f"- {line}" for line in recipe['ingredients'])
+    steps = '\n'.join(f"{number}. {step}" for number, step in enumerate(recipe['steps'], 1))
+    return (f"## {recipe['name']} (serves {recipe['servings']})\n\n"
+            f"**Ingredients:**\n{ingredients}\n\n"
+            f"**Preparation Steps:**\n{steps}\n\n"
+            f"**Grocery List:**\n{ingredients}")
+
+_corpus: Optional[RecipeCorpus] = None
+_corpus_generation: Optional[int] = None
+_corpus_lock = threading.Lock()
+
+def get_recipe_corpus() -> RecipeCorpus:
+    """Returns the shared RecipeCorpus, rebuilt when the recipes or the ingredient index change."""
+    global _corpus, _corpus_generation
+    dataset = get_dataset('recipes')
+    index = get_ingredient_index()
+    if _corpus is None or dataset.generation != _corpus_generation or _corpus.ingredient_index is not index:
+        with _corpus_lock:
+            if _corpus is None or dataset.generation != _corpus_generation or _corpus.ingredient_index is not index:
+                _corpus = RecipeCorpus(dataset.values(), index)
+                _corpus_generation = dataset.generation
+    return _corpus
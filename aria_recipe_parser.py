@@ -0,0 +1,288 @@
+"""ARIA Recipe Parser
+
+This module segments a MealPlanner response into a structured recipe in a single pass over its
+lines. Markdown headings (``## Ingredients``), bold headings (``**Preparation Steps:**``) and plain
+``Grocery List:`` lines open a section; bullet items, numbered steps and inline comma lists fill it.
+Multi-line markdown lists are therefore kept whole, where the previous per-section regexes stopped
+at the first newline.
+
+Parsing is memoized per response text, so the guardrails, the grocery plan update and the turn
+log all share one parse of the same response.
+
+In structured output mode the model answers with JSON constrained by RECIPE_SCHEMA instead.
+parse_structured_response validates it, renders the markdown shown to the user and registers the
+recipe for that markdown, so parse_recipe returns the model's own fields for it without scanning
+any text. Recipes rescaled locally for a new headcount (rescale_recipe) are rendered and
+registered the same way.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * ParsedRecipe - the sections, ingredients, preparation steps and grocery list of a response
+    * parse_recipe - parses (memoized) a response into a ParsedRecipe
+    * RECIPE_SCHEMA - JSON schema of a structured MealPlanner response
+    * parse_structured_response - validates a structured response and renders its markdown
+    * render_recipe_markdown - renders a ParsedRecipe in the section layout and registers it
+    * rescale_recipe - scales the ingredient and grocery quantities of a ParsedRecipe
+"""
+import re
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from aria_grocery_plan import scale_item
+
+# heading text (casefolded, without trailing colon) -> canonical section name
+SECTION_ALIASES: Dict[str, str] = {
+    'ingredient': 'ingredients',
+    'ingredients': 'ingredients',
+    'preparation': 'preparation',
+    'preparation steps': 'preparation',
+    'preparation method': 'preparation',
+    'instructions': 'preparation',
+    'cooking instructions': 'preparation',
+    'method': 'preparation',
+    'directions': 'preparation',
+    'steps': 'preparation',
+    'grocery list': 'grocery_list',
+    'grocery lis': 'grocery_list',
+    'groceries': 'grocery_list',
+    'shopping list': 'grocery_list',
+}
+
+_BULLET = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+(?P<item>.*)$")
+_MARKDOWN_EMPHASIS = re.compile(r"(\*\*|__|`)")
+_PARENTHETICAL = re.compile(r"\(.*?\)")
+_SERVINGS = re.compile(
+    r"\b(?:serves|servings?\s*:|yield\s*:)\s*(\d+)|\bfor\s+(\d+)\s+(?:people|persons|servings|adults|members)\b",
+    re.IGNORECASE)
+
+
+class ParsedRecipe:
+    """Structured view of one response.
+
+    Attributes
+    ----------
+    title : str
+        The first markdown heading that is not a known section, if any.
+    sections : dict
+        Every heading in order (canonical name for known sections, casefolded text otherwise)
+        mapped to its items.
+    ingredients, preparation_steps, grocery_list : tuple of str
+        Lowercased items of the known sections.
+    servings : int or None
+        The first "serves N" / "for N people" found in the response.
+    """
+
+    def __init__(self, title: str = '', sections: Optional[Dict[str, List[str]]] = None,
+                 servings: Optional[int] = None):
+        self.title = title
+        self.servings = servings
+        self.sections: Dict[str, Tuple[str, ...]] = {
+            name: tuple(items) for name, items in (sections or {}).items()}
+        self.ingredients = tuple(item.lower() for item in self.sections.get('ingredients', ()))
+        self.preparation_steps = tuple(item.lower() for item in self.sections.get('preparation', ()))
+        self.grocery_list = tuple(item.lower() for item in self.sections.get('grocery_list', ()))
+
+    @property
+    def preparation(self) -> str:
+        """The preparation steps as one lowercased text."""
+        return '\n'.join(self.preparation_steps)
+
+    @property
+    def is_recipe(self) -> bool:
+        return bool(self.ingredients or self.preparation_steps)
+
+    def summary(self) -> dict:
+        """Compact description for the turn log."""
+        return {
+            'title': self.title,
+            'sections': list(self.sections),
+            'ingredients': len(self.ingredients),
+            'preparation_steps': len(self.preparation_steps),
+            'grocery_items': len(self.grocery_list),
+            'servings': self.servings,
+        }
+
+def _clean(text: str) -> str:
+    return _MARKDOWN_EMPHASIS.sub('', text).strip().strip(',').strip()
+
+def _heading(line: str) -> Optional[Tuple[str, str, bool]]:
+    """Returns (name, inline rest, is_known_section) if `line` opens a section."""
+    stripped = line.strip()
+    if _BULLET.match(stripped):
+        return None
+    is_markdown = stripped.startswith('#')
+    text = stripped.lstrip('#').strip()
+    is_bold = text.startswith(('**', '__'))
+    head, colon, rest = text.partition(':')
+    # "Ingredients (serves 4):" names the ingredients section
+    name = ' '.join(_PARENTHETICAL.sub('', _clean(head)).casefold().split())
+    known = SECTION_ALIASES.get(name)
+    if known and (colon or is_markdown or is_bold):
+        return known, rest, True
+    # other headings count when they are markdown, or short bold / "Notes:" lines with nothing after them
+    short_label = not _clean(rest) and 0 < len(name.split()) <= 6 and (is_bold or (colon and text.endswith(':')))
+    if is_markdown or short_label:
+        return ' '.join(_clean(text).rstrip(':').casefold().split()), '', False
+    return None
+
+# markdown rendered from a known recipe (structured response, rescaled recipe) -> that recipe
+_RENDERED_CACHE_SIZE = 256
+_rendered: 'OrderedDict[str, ParsedRecipe]' = OrderedDict()
+# sessions render and parse concurrently; the eviction order must not change under a reader
+_rendered_lock = threading.Lock()
+
+def parse_recipe(response: str) -> ParsedRecipe:
+    """Returns the recipe of `response`: the registered recipe of rendered markdown, else the markdown parse."""
+    with _rendered_lock:
+        recipe = _rendered.get(response)
+    if recipe is not None:
+        return recipe
+    return parse_markdown_recipe(response)
+
+@lru_cache(maxsize=256)
+def parse_markdown_recipe(response: str) -> ParsedRecipe:
+    """Parses `response` into a ParsedRecipe in one pass over its lines (memoized per text).
+
+    Parameters
+    ----------
+    response : str
+        The model response, usually markdown.
+
+    Returns
+    -------
+    ParsedRecipe
+        the shared parse of this response; treat it as read-only
+    """
+    title = ''
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    # once a section holds list items, a line of prose ends it
+    listed = False
+    servings = None
+    for line in response.splitlines():
+        if not line.strip():
+            continue
+        if servings is None:
+            servings_match = _SERVINGS.search(line)
+            if servings_match:
+                servings = int(servings_match.group(1) or servings_match.group(2)) or None
+        heading = _heading(line)
+        if heading:
+            name, rest, known = heading
+            if not known and not title and line.lstrip().startswith('#'):
+                title = _clean(line.strip().lstrip('#'))
+            current = sections.setdefault(name, [])
+            rest = _clean(rest)
+            listed = bool(rest)
+            if rest:
+                # inline content, e.g. "Ingredients: rice, dal, ghee"
+                parts = [rest] if name == 'preparation' else rest.split(',')
+                current.extend(part.strip() for part in parts if part.strip())
+            continue
+        if current is None:
+            continue
+        bullet = _BULLET.match(line)
+        if not bullet and listed:
+            current = None
+            continue
+        listed = listed or bool(bullet)
+        item = _clean(bullet.group('item') if bullet else line)
+        if item:
+            current.append(item)
+    return ParsedRecipe(title, sections, servings)
+
+RECIPE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'reply': {'type': 'string'},
+        'title': {'type': 'string'},
+        'servings': {'type': 'integer'},
+        'ingredients': {'type': 'array', 'items': {'type': 'string'}},
+        'preparation_steps': {'type': 'array', 'items': {'type': 'string'}},
+        'grocery_list': {'type': 'array', 'items': {'type': 'string'}},
+    },
+    'required': ['reply', 'ingredients', 'preparation_steps', 'grocery_list'],
+}
+
+def _string_list(data: dict, field: str) -> List[str]:
+    value = data.get(field, [])
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"structured response field '{field}' must be a list of strings")
+    return [item.strip() for item in value if item.strip()]
+
+def parse_structured_response(text: str) -> Tuple[str, ParsedRecipe]:
+    """Validates a JSON response against RECIPE_SCHEMA and renders it as markdown.
+
+    Parameters
+    ----------
+    text : str
+        The JSON document returned by the model in structured output mode.
+
+    Returns
+    -------
+    tuple of (str, ParsedRecipe)
+        the markdown for the user and the recipe taken directly from the fields; parse_recipe
+        returns the same recipe for that markdown
+
+    Raises
+    ------
+    ValueError
+        if `text` is not JSON or does not match the schema
+    """
+    data = json.loads(text)
+    if not isinstance(data, dict) or not isinstance(data.get('reply'), str):
+        raise ValueError("structured response must be an object with a 'reply' string")
+    title = data.get('title') if isinstance(data.get('title'), str) else ''
+    servings = data.get('servings') if isinstance(data.get('servings'), int) and data.get('servings') > 0 else None
+    sections = {name: _string_list(data, field) for name, field in
+                (('ingredients', 'ingredients'), ('preparation', 'preparation_steps'), ('grocery_list', 'grocery_list'))}
+    recipe = ParsedRecipe(title.strip(), {name: items for name, items in sections.items() if items}, servings)
+    return render_recipe_markdown(recipe, data['reply']), recipe
+
+_SECTION_LABELS = {'ingredients': 'Ingredients', 'preparation': 'Preparation Steps', 'grocery_list': 'Grocery List'}
+_SERVES_SUFFIX = re.compile(r"\s*\((?:serves|for)\b[^)]*\)\s*$", re.IGNORECASE)
+
+def render_recipe_markdown(recipe: ParsedRecipe, reply: str = '') -> str:
+    """Renders `reply` and the known sections of `recipe` as markdown; parse_recipe returns `recipe` for it."""
+    parts = [reply.strip()] if reply.strip() else []
+    sections = {name: recipe.sections[name] for name in _SECTION_LABELS if recipe.sections.get(name)}
+    if sections:
+        heading = _SERVES_SUFFIX.sub('', recipe.title) or 'Recipe'
+        parts.append(f"## {heading} (serves {recipe.servings})" if recipe.servings else f"## {heading}")
+        for name, items in sections.items():
+            if name == 'preparation':
+                lines = '\n'.join(f"{number}. {item}" for number, item in enumerate(items, 1))
+            else:
+                lines = '\n'.join(f"- {item}" for item in items)
+            parts.append(f"**{_SECTION_LABELS[name]}:**\n{lines}")
+    markdown = '\n\n'.join(parts)
+    with _rendered_lock:
+        _rendered[markdown] = recipe
+        _rendered.move_to_end(markdown)
+        while len(_rendered) > _RENDERED_CACHE_SIZE:
+            _rendered.popitem(last=False)
+    return markdown
+
+def rescale_recipe(recipe: ParsedRecipe, servings: int, from_servings: Optional[int] = None) -> ParsedRecipe:
+    """Returns `recipe` with ingredient and grocery quantities scaled to `servings`.
+
+    Parameters
+    ----------
+    recipe : ParsedRecipe
+        The recipe to scale; it is not modified.
+    servings : int
+        The new number of servings.
+    from_servings : int, optional
+        The servings `recipe` was written for, when it does not state them itself.
+    """
+    from_servings = recipe.servings or from_servings
+    if not from_servings or servings <= 0:
+        raise ValueError("cannot rescale a recipe without a known number of servings")
+    factor = servings / from_servings
+    sections = {name: [scale_item(item, factor) for item in items] if name in ('ingredients', 'grocery_list') else list(items)
+                for name, items in recipe.sections.items()}
+    return ParsedRecipe(_SERVES_SUFFIX.sub('', recipe.title), sections, servings)
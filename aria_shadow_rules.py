@@ -0,0 +1,206 @@
+"""ARIA Shadow Guardrail Evaluation
+
+This module runs candidate guardrail rule packs in shadow mode: every text the active rules of a
+scenario evaluate (requests in the input guards, responses in the output guardrails) is also
+queued for the candidate rule pack of that scenario, if there is one. A background worker
+evaluates the candidate off the request path and writes one record per evaluation to the
+experiment log: whether the two rule sets disagree on blocking the text, the rule ids only one of
+them matched, and the evaluation time of each. Answers are always decided by the active rules,
+so a stricter rule can be measured on live traffic before it is promoted.
+
+Candidate packs use the rule pack format (see aria_guardrail_rules) and live in
+``data/rule_packs/candidates/<scenario>.json``; adding, editing or removing a file starts, updates
+or stops the shadow evaluation of that scenario. Promoting a candidate means copying it over the
+active pack, which is then hot-reloaded. When the queue is full, texts are dropped rather than
+slowing down a turn; the drops are counted.
+
+The experiment, session and turn of the records are those set with set_log_context by the caller
+of GetResponse in the same thread.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * set_log_context - experiment, session and turn the next shadow records of this thread belong to
+    * ShadowEvaluator - bounded queue and background worker evaluating the candidate rule packs
+    * get_shadow_evaluator - process-wide ShadowEvaluator
+    * evaluate_with_shadow - evaluates the active rules of a scenario and queues the shadow evaluation
+"""
+import os
+import time
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from aria_guardrail_rules import RULE_PACK_DIR, GuardrailRules, RuleMatch, get_rules, read_rule_pack
+
+CANDIDATE_DIR = os.path.join(RULE_PACK_DIR, 'candidates')
+QUEUE_SIZE = 1024
+
+_context = threading.local()
+
+def set_log_context(experiment_id, session_num, adjpair_num):
+    """Sets the experiment, session and turn of the shadow records queued next by the calling thread."""
+    _context.value = (experiment_id, session_num, adjpair_num)
+
+def _log_shadow_record(context: Tuple, record: dict):
+    # imported on first record: the logging module opens its log file when imported
+    from aria_logging_api import log_event
+    experiment_id, session_num, adjpair_num = context
+    log_event(experiment_id, session_num, adjpair_num, record)
+
+
+class ShadowEvaluator:
+    """Evaluates candidate rule packs in a background worker.
+
+    Parameters
+    ----------
+    candidate_dir : str
+        Directory of the candidate rule packs, one ``<scenario>.json`` per scenario.
+    sink : callable, optional
+        Called by the worker with (log context, record) for every shadow evaluation; writes a
+        log_event to the experiment log by default.
+    queue_size : int
+        Largest number of texts waiting for evaluation; further texts are dropped.
+
+    Attributes
+    ----------
+    submitted, dropped, evaluated, diverged : int
+        Process-wide counters of the shadow evaluations.
+    """
+
+    def __init__(self, candidate_dir: str = CANDIDATE_DIR, sink: Optional[Callable[[Tuple, dict], None]] = None,
+                 queue_size: int = QUEUE_SIZE):
+        self.candidate_dir = candidate_dir
+        self._sink = sink or _log_shadow_record
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        # scenario -> (file stat, compiled candidate), only touched by the worker
+        self._candidates: Dict[str, Tuple[Tuple[int, int, int], Optional[GuardrailRules]]] = {}
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.dropped = 0
+        self.evaluated = 0
+        self.diverged = 0
+
+    def _path(self, scenario: str) -> str:
+        return os.path.join(self.candidate_dir, f"{scenario}.json")
+
+    def submit(self, scenario: str, stage: str, text: str, active: GuardrailRules, matches: List[RuleMatch],
+               active_us: float) -> bool:
+        """Queues `text` for the candidate of `scenario`, with the result of the active rules.
+
+        Returns False, without blocking, when the scenario has no candidate or the queue is full.
+        """
+        if not os.path.exists(self._path(scenario)):
+            return False
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._run, name='aria-shadow-rules', daemon=True)
+                    self._worker.start()
+        context = getattr(_context, 'value', (None, None, None))
+        try:
+            self._queue.put_nowait((context, scenario, stage, text, active.version, matches, active_us))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        with self._lock:
+            self.submitted += 1
+        return True
+
+    def _candidate(self, scenario: str) -> Optional[GuardrailRules]:
+        path = self._path(scenario)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._candidates.pop(scenario, None)
+            return None
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._candidates.get(scenario)
+        if cached is None or cached[0] != key:
+            try:
+                candidate = read_rule_pack(path)
+                print(f"ShadowEvaluator: Loaded candidate rule pack '{scenario}' version {candidate.version}")
+            except (OSError, ValueError) as e:
+                print(f"ShadowEvaluator: Ignored invalid candidate rule pack {e}")
+                candidate = None
+            cached = self._candidates[scenario] = (key, candidate)
+        return cached[1]
+
+    def evaluate(self, scenario: str, stage: str, text: str, active_version: str, matches: List[RuleMatch],
+                 active_us: float) -> Optional[dict]:
+        """Evaluates the candidate of `scenario` on `text` and returns the shadow record, or None without a candidate."""
+        candidate = self._candidate(scenario)
+        if candidate is None:
+            return None
+        start = time.perf_counter()
+        candidate_matches = candidate.evaluate(text)
+        candidate_us = (time.perf_counter() - start) * 1e6
+        active_rules = {match.rule_id for match in matches}
+        candidate_rules = {match.rule_id for match in candidate_matches}
+        diverged = bool(active_rules) != bool(candidate_rules)
+        return {'event': 'shadow_guardrails', 'scenario': scenario, 'stage': stage,
+                'active_version': active_version, 'candidate_version': candidate.version,
+                'active_blocked': bool(active_rules), 'candidate_blocked': bool(candidate_rules), 'diverged': diverged,
+                'candidate_only_rules': sorted(candidate_rules - active_rules),
+                'active_only_rules': sorted(active_rules - candidate_rules),
+                'active_us': round(active_us, 1), 'candidate_us': round(candidate_us, 1)}
+
+    def _run(self):
+        while True:
+            context, scenario, stage, text, active_version, matches, active_us = self._queue.get()
+            try:
+                record = self.evaluate(scenario, stage, text, active_version, matches, active_us)
+                if record is not None:
+                    with self._lock:
+                        self.evaluated += 1
+                        self.diverged += record['diverged']
+                    self._sink(context, record)
+            except Exception as e:
+                # the worker must outlive a failing record
+                print(f"ShadowEvaluator: ERROR: Shadow evaluation failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def join(self):
+        """Waits until every queued text has been evaluated."""
+        self._queue.join()
+
+    def stats(self) -> dict:
+        """Returns the counters and the divergence rate of the shadow evaluations so far."""
+        with self._lock:
+            return {'submitted': self.submitted, 'dropped': self.dropped, 'evaluated': self.evaluated,
+                    'diverged': self.diverged,
+                    'divergence_rate': round(self.diverged / self.evaluated, 3) if self.evaluated else 0.0}
+
+_evaluator: Optional[ShadowEvaluator] = None
+_evaluator_lock = threading.Lock()
+
+def get_shadow_evaluator() -> ShadowEvaluator:
+    """Returns the process-wide ShadowEvaluator over CANDIDATE_DIR."""
+    global _evaluator
+    if _evaluator is None:
+        with _evaluator_lock:
+            if _evaluator is None:
+                _evaluator = ShadowEvaluator()
+    return _evaluator
+
+def evaluate_with_shadow(scenario: str, text: str, stage: str = 'output') -> List[RuleMatch]:
+    """Returns the matches of the active rules of `scenario` in `text`, and queues the candidate evaluation.
+
+    Parameters
+    ----------
+    scenario : str
+        Name of the rule set.
+    text : str
+        The request ('input' stage) or response ('output' stage) being checked.
+    stage : str
+        Which guardrail is evaluating, recorded with the shadow result.
+    """
+    rules = get_rules(scenario)
+    start = time.perf_counter()
+    matches = rules.evaluate(text)
+    active_us = (time.perf_counter() - start) * 1e6
+    get_shadow_evaluator().submit(scenario, stage, text, rules, matches, active_us)
+    return matches
@@ -0,0 +1,147 @@
+"""ARIA Meal Slot Filling
+
+This module decides, before any generation, whether a MealPlanner recipe or meal plan request
+has the information the prompt requires: the dietary restrictions or preferences, and the number
+of people. A missing slot is asked for with a fixed question, so those turns are answered locally
+instead of by a full generation that the guardrails would discard.
+
+The state machine has one state per slot it is waiting for:
+
+    idle --recipe request, slot missing--> awaiting <slot> --slot filled--> next missing slot / idle
+
+A slot is also closed when the user declines it ("no restrictions", "none") or after it has been
+asked MAX_PROMPTS times, so a user is never trapped in a loop of questions.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * parse_headcount - number of people stated in a message ("2 adults and a child" -> 3)
+    * MealSlotFilling - per-session slot state machine
+"""
+import re
+from typing import Dict, List, Optional
+
+# requests that need the slots: the recipe requests of MealPlanner plus meal plans
+SLOT_REQUEST_PATTERN = re.compile(
+    r"\b(I want to cook|give me a recipe|provide a recipe|recipe for|meal plan|curry|stew|roast|biryani)\b",
+    re.IGNORECASE)
+
+SLOT_QUESTIONS: Dict[str, str] = {
+    'restrictions': ("I'm here to help you with delicious recipes! However, to ensure I provide a recipe that's perfect for you, "
+                     "could you please share your dietary preferences or any restrictions you might have? "
+                     "This way, I can tailor the recipe to your needs safely."),
+    'household': ("How many people is this meal for? Please tell me the number of adults and children "
+                  "(or add members with their age and weight), so I can size the quantities and calories correctly."),
+}
+MAX_PROMPTS = 2
+
+_NUMBER_WORDS = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6,
+                 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10, 'eleven': 11, 'twelve': 12}
+_NUMBER = r"\b(\d+|" + '|'.join(_NUMBER_WORDS) + r")"
+_PERSON_NOUNS = r"(?:people|persons|person|adults?|kids?|children|child|members?|guests?|grown-?ups?|teens?|teenagers?|babies|baby)\b"
+_PEOPLE = re.compile(_NUMBER + r"\s+" + _PERSON_NOUNS, re.IGNORECASE)
+# "a"/"an" only counts in an explicit enumeration or headcount: "2 adults and a child", "for a person"
+_ONE_MORE = re.compile(r"\b(?:and|plus|for|just|only)\s+(?:an?)\s+" + _PERSON_NOUNS, re.IGNORECASE)
+_FAMILY_OF = re.compile(r"\b(?:family|household|party|group)\s+of\s+" + _NUMBER + r"\b", re.IGNORECASE)
+# a headcount without a person noun: "we are 6 now", "there will be 4 of us", "we're 5 tonight"
+_WE_ARE = re.compile(
+    r"\b(?:we\s+are|we're|we\s+will\s+be|we'll\s+be|there\s+(?:are|will\s+be))\s+(?:now\s+)?" + _NUMBER +
+    r"(?=\s*(?:$|[.,;!?)]|now\b|of\s+us\b|in\s+total\b|altogether\b|tonight\b|today\b|tomorrow\b|at\s+the\s+table\b))",
+    re.IGNORECASE)
+_OF_US = re.compile(_NUMBER + r"\s+of\s+us\b", re.IGNORECASE)
+_ONLY_ME = re.compile(r"\b(?:just|only)\s+(?:me|myself)\b|\bfor\s+myself\b|\bfor\s+one\b", re.IGNORECASE)
+_BARE_NUMBER = re.compile(r"^\s*" + _NUMBER + r"\s*\.?\s*$", re.IGNORECASE)
+# declining the restrictions slot anywhere in a message: "I have no restrictions, 2 people"
+_NO_RESTRICTIONS = re.compile(
+    r"\b(?:no|without any|(?:don't|do not) have any)\s+(?:dietary\s+|food\s+)?(?:restrictions?|allerg(?:y|ies))\b",
+    re.IGNORECASE)
+_DECLINE = re.compile(
+    r"^\s*(?:no|none|nothing|nope|nah|not really|any|anything|no (?:dietary )?(?:restrictions?|preferences?|allerg(?:y|ies)))\b",
+    re.IGNORECASE)
+
+def _number(token: str) -> int:
+    token = token.lower()
+    return int(token) if token.isdigit() else _NUMBER_WORDS[token]
+
+def parse_headcount(text: str, bare_number: bool = False) -> Optional[int]:
+    """Returns the number of people stated in `text`, or None.
+
+    "2 adults and a child" -> 3, "family of 4" -> 4, "we are 6 now" -> 6, "4 of us" -> 4, "just me" -> 1.
+    "a"/"an" only counts after "and", "plus", "for", "just" or "only", so "I am a person with diabetes"
+    states no headcount. With `bare_number`, a reply that is only a number ("4") counts too, as when
+    answering the headcount question or replying to a recipe.
+    """
+    family = _FAMILY_OF.search(text) or _OF_US.search(text)
+    if family:
+        return _number(family.group(1)) or None
+    counts = [_number(match.group(1)) for match in _PEOPLE.finditer(text)]
+    counts += [1 for _ in _ONE_MORE.finditer(text)]
+    if counts:
+        return sum(counts) or None
+    stated = _WE_ARE.search(text)
+    if stated:
+        return _number(stated.group(1)) or None
+    if _ONLY_ME.search(text):
+        return 1
+    if bare_number:
+        bare = _BARE_NUMBER.match(text)
+        if bare:
+            return _number(bare.group(1)) or None
+    return None
+
+
+class MealSlotFilling:
+    """Slot state machine of one MealPlanner session.
+
+    Attributes
+    ----------
+    state : str
+        'idle' or 'awaiting_<slot>'.
+    headcount : int or None
+        The number of people stated by the user, if any.
+    """
+
+    SLOTS = ('restrictions', 'household')
+
+    def __init__(self):
+        self.state = 'idle'
+        self.headcount: Optional[int] = None
+        self.declined: List[str] = []
+        self.prompts: Dict[str, int] = {}
+
+    def missing_slots(self, session_data: dict) -> List[str]:
+        missing = []
+        if not (session_data.get('dietary_restrictions') or session_data.get('user_preferences')
+                or 'restrictions' in self.declined):
+            missing.append('restrictions')
+        if not (self.headcount or session_data.get('members_for_meal') or 'household' in self.declined):
+            missing.append('household')
+        return missing
+
+    def step(self, text: str, session_data: dict) -> Optional[str]:
+        """Advances the machine with one user message (after the session has been updated from it).
+
+        Returns
+        -------
+        str or None
+            the question to answer locally, or None when the turn should go to the model
+        """
+        awaiting = self.state[len('awaiting_'):] if self.state != 'idle' else None
+        # a bare number answers the headcount question, or resizes the recipe just served
+        headcount = parse_headcount(text, bare_number=awaiting == 'household' or bool(session_data.get('last_recipe')))
+        if headcount:
+            self.headcount = headcount
+        if awaiting and awaiting in self.missing_slots(session_data) and _DECLINE.match(text):
+            self.declined.append(awaiting)
+        elif 'restrictions' not in self.declined and _NO_RESTRICTIONS.search(text):
+            self.declined.append('restrictions')
+        if not awaiting and not SLOT_REQUEST_PATTERN.search(text):
+            return None
+        for slot in self.missing_slots(session_data):
+            if self.prompts.get(slot, 0) >= MAX_PROMPTS:
+                continue
+            self.prompts[slot] = self.prompts.get(slot, 0) + 1
+            self.state = f'awaiting_{slot}'
+            return SLOT_QUESTIONS[slot]
+        self.state = 'idle'
+        return None
@@ -0,0 +1,198 @@
+"""ARIA Topic Classifier
+
+This module decides, before any generation, whether a user turn is clearly outside the topic of a
+scenario (general knowledge questions, coding help, jailbreak probes, another scenario's domain).
+Such turns only ever get a "let's get back to ..." answer from the model, so a turn the classifier
+is confident about is answered locally with the scenario's redirect instead.
+
+Each scenario has its own logistic regression over hashed features (word unigrams and bigrams and
+character trigrams of each word, which tolerate misspellings), trained in well under a second from
+the bundled labelled dataset ``topic_examples`` ({"text", "on_topic": [<scenario>, ...]}); a
+text is an off-topic example for every scenario it does not list. Classifying a turn hashes a few
+dozen features and sums their weights.
+
+A turn is only redirected when its off-topic probability reaches the threshold and it has at
+least MIN_TOKENS words, since short follow-ups ("yes please", "4") carry too little evidence. While
+the session has something to follow up on (a recipe, a route), an elliptical turn of up to
+FOLLOW_UP_TOKENS words ("and for the kids?", "what about dessert") is not redirected either, unless
+its off-topic probability reaches CONFIDENT_OFF_TOPIC.
+
+The threshold is calibrated rather than fixed: every HELD_OUT_EVERY-th example (by text hash) is
+held out of training, and the threshold is raised from OFF_TOPIC_THRESHOLD until at most
+TARGET_FALSE_REDIRECT_RATE of the held-out on-topic examples would be redirected. The calibration
+(held-out false-redirect rate, share of held-out off-topic examples still redirected) is recorded
+in the turn metrics of every classified turn.
+
+This file can be imported as a module and contains the following
+classes and function(s):
+
+    * hashed_features - hashed feature indices of a text
+    * TopicClassifier - per-scenario off-topic classifier with bypass counters
+    * get_topic_classifier - process-wide classifier of a scenario, retrained when the dataset is swapped
+"""
+import zlib
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from aria_data_store import get_dataset
+from aria_keyword_matcher import tokenize
+
+N_FEATURES = 2 ** 16
+OFF_TOPIC_THRESHOLD = 0.9
+TARGET_FALSE_REDIRECT_RATE = 0.01
+HELD_OUT_EVERY = 5
+MIN_TOKENS = 3
+FOLLOW_UP_TOKENS = 4
+# a follow-up this likely to be off-topic is redirected all the same
+CONFIDENT_OFF_TOPIC = 0.98
+
+def hashed_features(text: str) -> np.ndarray:
+    """Returns the sorted, unique feature indices of `text` (CRC32-hashed, so stable across processes)."""
+    words = [token for token, _, _ in tokenize(text)]
+    features = [f"w:{word}" for word in words]
+    features.extend(f"b:{first} {second}" for first, second in zip(words, words[1:]))
+    for word in words:
+        padded = f"<{word}>"
+        features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+    return np.unique(np.fromiter((zlib.crc32(feature.encode('utf-8')) % N_FEATURES for feature in features),
+                                 dtype=np.int64, count=len(features)))
+
+
+class TopicClassifier:
+    """Off-topic classifier of one scenario.
+
+    Parameters
+    ----------
+    scenario : str
+        Scenario name as used in the "on_topic" lists of the examples.
+    examples : iterable of dict
+        Labelled records with "text" and "on_topic".
+    threshold : float
+        Lowest off-topic probability from which a turn is redirected; raised on the held-out
+        examples until their false-redirect rate is within `target_false_redirect_rate`.
+    target_false_redirect_rate : float
+        Largest share of held-out on-topic examples that may be redirected.
+
+    Attributes
+    ----------
+    false_redirect_rate : float
+        Share of the held-out on-topic examples redirected at the calibrated threshold.
+    held_out_redirect_rate : float
+        Share of the held-out off-topic examples redirected at the calibrated threshold.
+    calibration : dict
+        Training and held-out sizes, training accuracy and both held-out rates.
+    checked : int
+        Turns classified so far in this process.
+    bypassed : int
+        Turns redirected without a generation.
+    """
+
+    def __init__(self, scenario: str, examples: Iterable[dict], threshold: float = OFF_TOPIC_THRESHOLD,
+                 target_false_redirect_rate: float = TARGET_FALSE_REDIRECT_RATE,
+                 epochs: int = 300, learning_rate: float = 0.5, l2: float = 1e-4):
+        self.scenario = scenario
+        self.checked = 0
+        self.bypassed = 0
+        self._lock = threading.Lock()
+        train, held_out = [], []
+        for example in examples:
+            # split by text hash, so the same examples are held out in every process
+            (held_out if zlib.crc32(example['text'].encode('utf-8')) % HELD_OUT_EVERY == 0 else train).append(example)
+        rows = [hashed_features(example['text']) for example in train]
+        labels = np.array([0.0 if scenario in example['on_topic'] else 1.0 for example in train])
+        self.weights = np.zeros(N_FEATURES)
+        self.bias = 0.0
+        if rows:
+            self._fit(rows, labels, epochs, learning_rate, l2)
+        predictions = np.array([self.probability_of(row) >= 0.5 for row in rows], dtype=float)
+        self.training_accuracy = float(np.mean(predictions == labels)) if rows else 0.0
+        self.threshold = self._calibrate(held_out, threshold, target_false_redirect_rate)
+        self.calibration = {'trained_on': len(rows), 'held_out': len(held_out),
+                            'training_accuracy': round(self.training_accuracy, 3),
+                            'false_redirect_rate': round(self.false_redirect_rate, 3),
+                            'target_false_redirect_rate': target_false_redirect_rate,
+                            'held_out_redirect_rate': round(self.held_out_redirect_rate, 3)}
+
+    def _calibrate(self, held_out: List[dict], floor: float, target: float) -> float:
+        # only turns long enough to be redirected at all count
+        scored = [(self.probability(example['text']), self.scenario in example['on_topic'])
+                  for example in held_out if len(tokenize(example['text'])) >= MIN_TOKENS]
+        on_topic = sorted((probability for probability, on in scored if on), reverse=True)
+        # the threshold must lie above the on-topic probability that would exceed the allowed false redirects
+        allowed = int(target * len(on_topic))
+        threshold = floor
+        if allowed < len(on_topic) and on_topic[allowed] >= floor:
+            threshold = min(1.0, round(on_topic[allowed], 3) + 0.001)
+        off_topic = [probability for probability, on in scored if not on]
+        self.false_redirect_rate = sum(p >= threshold for p in on_topic) / len(on_topic) if on_topic else 0.0
+        self.held_out_redirect_rate = sum(p >= threshold for p in off_topic) / len(off_topic) if off_topic else 0.0
+        return threshold
+
+    def _fit(self, rows, labels: np.ndarray, epochs: int, learning_rate: float, l2: float):
+        # full-batch gradient descent on the sparse binary design matrix, kept as flat index arrays
+        indices = np.concatenate(rows)
+        owners = np.repeat(np.arange(len(rows)), [len(row) for row in rows])
+        for _ in range(epochs):
+            scores = np.bincount(owners, weights=self.weights[indices], minlength=len(rows)) + self.bias
+            errors = 1.0 / (1.0 + np.exp(-scores)) - labels
+            gradient = np.bincount(indices, weights=errors[owners], minlength=N_FEATURES) / len(rows)
+            self.weights -= learning_rate * (gradient + l2 * self.weights)
+            self.bias -= learning_rate * float(errors.mean())
+
+    def probability_of(self, features: np.ndarray) -> float:
+        score = float(self.weights[features].sum()) + self.bias
+        return float(1.0 / (1.0 + np.exp(-score)))
+
+    def probability(self, text: str) -> float:
+        """Returns the probability that `text` is off-topic for the scenario."""
+        return self.probability_of(hashed_features(text))
+
+    def check(self, text: str, in_context: bool = False) -> dict:
+        """Classifies one turn and counts it.
+
+        Parameters
+        ----------
+        text : str
+            The user turn.
+        in_context : bool
+            Whether the session has something the turn may follow up on (a recipe, a route); short
+            turns are then only redirected from CONFIDENT_OFF_TOPIC.
+
+        Returns
+        -------
+        dict
+            'off_topic_probability', 'threshold', 'follow_up', 'bypass' (whether to redirect locally),
+            the process-wide 'bypass_rate' and the 'calibration' of the threshold
+        """
+        probability = self.probability(text)
+        tokens = len(tokenize(text))
+        follow_up = in_context and tokens <= FOLLOW_UP_TOKENS and probability < CONFIDENT_OFF_TOPIC
+        bypass = probability >= self.threshold and tokens >= MIN_TOKENS and not follow_up
+        with self._lock:
+            self.checked += 1
+            self.bypassed += bypass
+        return {'off_topic_probability': round(probability, 3), 'threshold': self.threshold, 'follow_up': follow_up,
+                'bypass': bypass, 'bypass_rate': round(self.bypass_rate, 3), 'calibration': dict(self.calibration)}
+
+    @property
+    def bypass_rate(self) -> float:
+        """Share of the classified turns that were redirected."""
+        return self.bypassed / self.checked if self.checked else 0.0
+
+_classifiers: Dict[str, TopicClassifier] = {}
+_classifier_generations: Dict[str, int] = {}
+_classifiers_lock = threading.Lock()
+
+def get_topic_classifier(scenario: str) -> TopicClassifier:
+    """Returns the shared TopicClassifier of `scenario`, retrained only when the example dataset is swapped."""
+    dataset = get_dataset('topic_examples')
+    classifier: Optional[TopicClassifier] = _classifiers.get(scenario)
+    if classifier is None or _classifier_generations.get(scenario) != dataset.generation:
+        with _classifiers_lock:
+            classifier = _classifiers.get(scenario)
+            if classifier is None or _classifier_generations.get(scenario) != dataset.generation:
+                classifier = _classifiers[scenario] = TopicClassifier(scenario, dataset.values())
+                _classifier_generations[scenario] = dataset.generation
+    return classifier
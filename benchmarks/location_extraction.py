@@ -0,0 +1,169 @@
+"""ARIA Location Extraction Benchmark
+
+Compares the ways PathFinders can read the origin and destination of a trip out of a request:
+
+    * regex - the capitalized-word heuristic the scenario used before the gazetteer
+    * gazetteer - the longest-match gazetteer extractor of aria_gazetteer, the scenario default
+    * spacy - one spaCy NER call per text (needs spaCy and its model)
+    * spacy_batched - the same texts through nlp.pipe in batches of aria_ner.BATCH_SIZE
+    * spacy_service - one call per text to the NER worker processes of aria_ner_service, as in NER mode
+
+Two corpora are scored:
+
+    * generated - requests generated from templates over the names and aliases of the bundled
+      gazetteer, with the two places as ground truth; multi-word names ("North Macedonia", "Rio de
+      Janeiro"), acronyms ("NYC") and capitalized sentence starts are part of it on purpose. Since it
+      is drawn from the gazetteer, the gazetteer finds every place by construction, so this corpus
+      only measures speed and the role cues.
+    * held_out - hand-written requests (HELD_OUT_REQUESTS) in free phrasing, lowercase names, the
+      destination named first, and places the gazetteer does not list ("Hallstatt", "Moab"); the
+      subset with at least one unlisted place is also reported on its own (held_out_unlisted).
+
+The regex and NER extractors take their first two places as origin and destination, as the scenario
+did; a place counts as found when it is written as in the request or as its canonical name. For each
+corpus and extractor the benchmark reports the mean extraction time per text and the origin and
+destination accuracy.
+
+Run from the repository root:
+
+    python -m benchmarks.location_extraction
+    python -m benchmarks.location_extraction --texts 1000 --json location_extraction.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEMPLATES = [
+    "I want to travel from {origin} to {destination} next month.",
+    "Plan a trip from {origin} to {destination} for two people.",
+    "Book me a flight from {origin} to {destination}, please.",
+    "We are flying from {origin} to {destination} in June.",
+    "What is the cheapest way to get from {origin} to {destination}?",
+    "Leaving {origin} on Monday, arriving in {destination} on Friday.",
+    "My family lives in {origin} and we would like to visit {destination}.",
+    "Can you suggest an itinerary from {origin} to {destination}?",
+]
+
+Route = Tuple[Optional[str], Optional[str]]
+LabelledRequest = Tuple[str, Tuple[str, str], Tuple[str, str]]
+
+# (text, (origin as written, canonical), (destination as written, canonical)); never generated from the gazetteer
+HELD_OUT_REQUESTS: List[LabelledRequest] = [
+    ("We're flying out of Oslo and want to end up in Bergen for the fjords.", ('Oslo', 'Oslo'), ('Bergen', 'Bergen')),
+    ("Heading to Hallstatt from Vienna by train, any tips?", ('Vienna', 'Vienna'), ('Hallstatt', 'Hallstatt')),
+    ("how do i get from paris to rome cheaply", ('paris', 'Paris'), ('rome', 'Rome')),
+    ("On Monday I leave Lima, and on Friday I need to be in Cusco.", ('Lima', 'Lima'), ('Cusco', 'Cusco')),
+    ("Drive from Moab to Sedona, how long?", ('Moab', 'Moab'), ('Sedona', 'Sedona')),
+    ("To Kyoto from Tokyo, is the bullet train worth it?", ('Tokyo', 'Tokyo'), ('Kyoto', 'Kyoto')),
+    ("My daughter studies in Galway and I live in Dublin, how do I visit her?", ('Dublin', 'Dublin'), ('Galway', 'Galway')),
+    ("Best way from Geneva over to Chamonix in winter?", ('Geneva', 'Geneva'), ('Chamonix', 'Chamonix')),
+    ("I'm in Hanoi right now, going to Hoi An next week.", ('Hanoi', 'Hanoi'), ('Hoi An', 'Hoi An')),
+    ("Zurich to Zermatt with skis, what are my options?", ('Zurich', 'Zurich'), ('Zermatt', 'Zermatt')),
+    ("We land in Denpasar and want to stay in Ubud.", ('Denpasar', 'Denpasar'), ('Ubud', 'Ubud')),
+    ("Plan a route Calgary to Banff for a family of four", ('Calgary', 'Calgary'), ('Banff', 'Banff')),
+    ("Is the ferry from Split to Dubrovnik faster than the bus?", ('Split', 'Split'), ('Dubrovnik', 'Dubrovnik')),
+    ("I want to see Cappadocia, starting in Istanbul.", ('Istanbul', 'Istanbul'), ('Cappadocia', 'Cappadocia')),
+    ("Going from Kathmandu up to Pokhara by bus, safe?", ('Kathmandu', 'Kathmandu'), ('Pokhara', 'Pokhara')),
+    ("Brussels to Bruges day trip please", ('Brussels', 'Brussels'), ('Bruges', 'Bruges')),
+    ("From Munich, what's the quickest way to Salzburg?", ('Munich', 'Munich'), ('Salzburg', 'Salzburg')),
+    ("We live in Melbourne and want to go to Hobart over Easter.", ('Melbourne', 'Melbourne'), ('Hobart', 'Hobart')),
+    ("barcelona to ibiza ferry times", ('barcelona', 'Barcelona'), ('ibiza', 'Ibiza')),
+    ("Athens then Mykonos, how do we get there?", ('Athens', 'Athens'), ('Mykonos', 'Mykonos')),
+    ("Can we drive from Jaipur to Udaipur in one day?", ('Jaipur', 'Jaipur'), ('Udaipur', 'Udaipur')),
+    ("Milan to Lake Como without a car", ('Milan', 'Milan'), ('Lake Como', 'Lake Como')),
+    ("Naples to Sorrento by the Circumvesuviana, is it safe at night?", ('Naples', 'Naples'), ('Sorrento', 'Sorrento')),
+    ("Florence to Pisa and back in a day", ('Florence', 'Florence'), ('Pisa', 'Pisa')),
+    ("Leaving Seattle for Whistler on Friday, do I need chains?", ('Seattle', 'Seattle'), ('Whistler', 'Whistler')),
+    ("San Francisco to Napa without driving", ('San Francisco', 'San Francisco'), ('Napa', 'Napa')),
+    ("I'll be in Lucerne first and then Interlaken", ('Lucerne', 'Lucerne'), ('Interlaken', 'Interlaken')),
+    ("Nashville to Asheville road trip stops", ('Nashville', 'Nashville'), ('Asheville', 'Asheville')),
+    ("Cairo to Luxor: sleeper train or flight?", ('Cairo', 'Cairo'), ('Luxor', 'Luxor')),
+    ("Train from Krakow to Prague, how many hours?", ('Krakow', 'Krakow'), ('Prague', 'Prague')),
+    ("What's the best way to get to Marrakech if I'm starting in Madrid?", ('Madrid', 'Madrid'), ('Marrakech', 'Marrakech')),
+    ("bangkok to chiang mai overnight train", ('bangkok', 'Bangkok'), ('chiang mai', 'Chiang Mai')),
+    ("Dar es Salaam to Zanzibar ferry, how early should I book?", ('Dar es Salaam', 'Dar es Salaam'), ('Zanzibar', 'Zanzibar')),
+    ("New flight options LA to NYC next Tuesday?", ('LA', 'Los Angeles'), ('NYC', 'New York City')),
+    ("Ljubljana to Bled by bus", ('Ljubljana', 'Ljubljana'), ('Bled', 'Bled')),
+    ("We are in Porto and would love to see Lisbon after.", ('Porto', 'Porto'), ('Lisbon', 'Lisbon')),
+    ("Fly Auckland to Queenstown in July?", ('Auckland', 'Auckland'), ('Queenstown', 'Queenstown')),
+    ("Tromsø from Oslo for the northern lights", ('Oslo', 'Oslo'), ('Tromsø', 'Tromsø')),
+]
+
+def labelled_requests(count: int, seed: int = 0) -> List[LabelledRequest]:
+    """Returns `count` generated requests as (text, (origin as written, canonical), (destination as written, canonical))."""
+    from aria_data_store import get_dataset
+    places = sorted((written, place['name']) for place in get_dataset('gazetteer').values()
+                    for written in [place['name']] + place['aliases'])
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(count):
+        origin, destination = rng.sample(places, 2)
+        requests.append((rng.choice(TEMPLATES).format(origin=origin[0], destination=destination[0]), origin, destination))
+    return requests
+
+def _positional(places: List[str]) -> Route:
+    return (places[0] if places else None), (places[1] if len(places) > 1 else None)
+
+def extractors() -> Dict[str, Callable[[List[str]], List[Route]]]:
+    """Returns the available extractors by name; each maps a list of texts to the (origin, destination) of each."""
+    from aria_gazetteer import get_gazetteer
+    from aria_ner import BATCH_SIZE, capitalized_words, extract_entities, get_nlp
+    from aria_ner_service import NERService
+    gazetteer = get_gazetteer()
+    found = {'regex': lambda texts: [_positional(capitalized_words(text)) for text in texts],
+             'gazetteer': lambda texts: [gazetteer.find_route(text) for text in texts]}
+    if get_nlp() is not None:
+        found['spacy'] = lambda texts: [_positional(extract_entities([text])[0]) for text in texts]
+        found['spacy_batched'] = lambda texts: [_positional(places) for places in extract_entities(texts, batch_size=BATCH_SIZE)]
+        service = NERService()
+        service.start(wait=True)
+        found['spacy_service'] = lambda texts: [_positional(service.extract(text).entities) for text in texts]
+    return found
+
+def corpora(count: int = 500) -> Dict[str, List[LabelledRequest]]:
+    """Returns the generated corpus, the held-out corpus and its requests naming a place the gazetteer does not list."""
+    from aria_gazetteer import get_gazetteer
+    gazetteer = get_gazetteer()
+    unlisted = [request for request in HELD_OUT_REQUESTS
+                if any(gazetteer.country_of(canonical) is None for _, canonical in request[1:])]
+    return {'generated': labelled_requests(count), 'held_out': HELD_OUT_REQUESTS, 'held_out_unlisted': unlisted}
+
+def benchmark(count: int = 500) -> Dict[str, Dict[str, dict]]:
+    """Returns, per corpus, the mean time per text and the origin and destination accuracy of each available extractor."""
+    found = extractors()
+    results: Dict[str, Dict[str, dict]] = {}
+    for corpus, requests in corpora(count).items():
+        texts = [text for text, _, _ in requests]
+        results[corpus] = {}
+        for name, extract in found.items():
+            start = time.perf_counter()
+            routes = extract(texts)
+            elapsed = time.perf_counter() - start
+            origins = sum(1 for (origin, _), (_, expected, _) in zip(routes, requests) if origin in expected)
+            destinations = sum(1 for (_, destination), (_, _, expected) in zip(routes, requests) if destination in expected)
+            results[corpus][name] = {'texts': len(texts), 'us_per_text': elapsed * 1e6 / len(texts),
+                                     'origin_accuracy': origins / len(texts),
+                                     'destination_accuracy': destinations / len(texts)}
+    return results
+
+if __name__ == '__main__':
+    sys.path.insert(0, REPO_ROOT)
+    parser = argparse.ArgumentParser(description="Location extraction benchmark: regex heuristic vs gazetteer vs NER.")
+    parser.add_argument('--texts', type=int, default=500, help="generated requests (the held-out corpus is fixed)")
+    parser.add_argument('--json', dest='json_path', help="also write the results to this file")
+    args = parser.parse_args()
+    results = benchmark(args.texts)
+    print(f"{'corpus':<18} {'extractor':<16} {'texts':>6} {'us/text':>9} {'origin':>8} {'destination':>12}")
+    for corpus, corpus_results in results.items():
+        for name, result in corpus_results.items():
+            print(f"{corpus:<18} {name:<16} {result['texts']:>6} {result['us_per_text']:>9.1f} "
+                  f"{result['origin_accuracy']:>8.1%} {result['destination_accuracy']:>12.1%}")
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'python': sys.version, 'results': results}, f, indent=4)
@@ -0,0 +1,96 @@
+"""ARIA Recipe Parsing Benchmark
+
+Compares the two ways MealPlanner reads a recipe out of a model response:
+
+    * markdown - the free-text response is segmented by aria_recipe_parser.parse_markdown_recipe
+    * structured - the JSON response is validated and rendered by parse_structured_response
+
+Responses are generated from the bundled recipe corpus in the layouts models commonly produce
+(bold headings, markdown headings, numbered ingredients, inline comma lists, prose steps, headings
+without colons), with the corpus fields as ground truth. For each path the benchmark reports the
+median parse time per response and the guardrail miss rate: the share of ingredient lines the
+guardrails would not see.
+
+Run from the repository root:
+
+    python -m benchmarks.recipe_parsing
+    python -m benchmarks.recipe_parsing --repeat 500 --json recipe_parsing.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from typing import Callable, Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _bullets(items: List[str], numbered: bool = False) -> str:
+    return '\n'.join(f"{n}. {item}" if numbered else f"- {item}" for n, item in enumerate(items, 1))
+
+# layout name -> markdown rendering of a corpus recipe
+LAYOUTS: Dict[str, Callable[[dict], str]] = {
+    'bold_headings': lambda r: (f"Here is a recipe for {r['name']}.\n\n**Ingredients:**\n{_bullets(r['ingredients'])}\n\n"
+                                f"**Preparation Steps:**\n{_bullets(r['steps'], True)}\n\n**Grocery List:**\n{_bullets(r['ingredients'])}"),
+    'markdown_headings': lambda r: (f"# {r['name']}\n\n## Ingredients\n{_bullets(r['ingredients'])}\n\n"
+                                    f"## Instructions\n{_bullets(r['steps'], True)}\n\n## Shopping List\n{_bullets(r['ingredients'])}"),
+    'numbered_ingredients': lambda r: (f"### {r['name']}\nIngredients:\n{_bullets(r['ingredients'], True)}\n"
+                                       f"Method:\n{_bullets(r['steps'], True)}\nGrocery List:\n{_bullets(r['ingredients'])}"),
+    'inline_lists': lambda r: (f"{r['name']} it is!\nIngredients: {', '.join(r['ingredients'])}\n"
+                               f"Preparation: {' '.join(r['steps'])}\nGrocery List: {', '.join(r['ingredients'])}"),
+    'prose': lambda r: (f"Let's make {r['name']}! You will need {', '.join(r['ingredients'][:-1])} and "
+                        f"{r['ingredients'][-1]}. {' '.join(r['steps'])}"),
+    'no_colons': lambda r: (f"{r['name']}\n\nWhat you need\n{_bullets(r['ingredients'])}\n\n"
+                            f"How to make it\n{_bullets(r['steps'], True)}"),
+}
+
+def _structured(recipe: dict) -> str:
+    return json.dumps({'reply': f"Here is a recipe for {recipe['name']}.", 'title': recipe['name'],
+                       'servings': recipe['servings'], 'ingredients': recipe['ingredients'],
+                       'preparation_steps': recipe['steps'], 'grocery_list': recipe['ingredients']})
+
+def _time_us(parse: Callable[[str], object], text: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(text)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+def benchmark(repeat: int = 200) -> Dict[str, dict]:
+    """Returns the median parse time and ingredient miss rate of each layout and of the structured path."""
+    from aria_recipe_parser import parse_markdown_recipe, parse_structured_response
+    from aria_data_store import get_dataset
+    recipes = list(get_dataset('recipes').values())
+    # the memoized parser would time a cache hit; time the parse itself
+    parse_markdown = parse_markdown_recipe.__wrapped__
+    paths: List[Tuple[str, Callable[[dict], str], Callable[[str], object]]] = [
+        (f"markdown/{name}", layout, parse_markdown) for name, layout in LAYOUTS.items()]
+    paths.append(('structured/json', _structured, lambda text: parse_structured_response(text)[1]))
+    results = {}
+    for name, render, parse in paths:
+        times, expected, missed = [], 0, 0
+        for recipe in recipes:
+            text = render(recipe)
+            times.append(_time_us(parse, text, repeat))
+            found = parse(text).ingredients
+            expected += len(recipe['ingredients'])
+            missed += sum(1 for item in recipe['ingredients'] if item.lower() not in found)
+        results[name] = {'responses': len(recipes), 'parse_us_median': statistics.median(times),
+                         'ingredient_miss_rate': missed / expected if expected else 0.0}
+    return results
+
+if __name__ == '__main__':
+    sys.path.insert(0, REPO_ROOT)
+    parser = argparse.ArgumentParser(description="Markdown vs structured recipe parsing benchmark.")
+    parser.add_argument('--repeat', type=int, default=200, help="timed parses per response")
+    parser.add_argument('--json', dest='json_path', help="also write the results to this file")
+    args = parser.parse_args()
+    results = benchmark(args.repeat)
+    print(f"{'path':<32} {'parse us':>9} {'miss rate':>10}")
+    for name, result in results.items():
+        print(f"{name:<32} {result['parse_us_median']:>9.1f} {result['ingredient_miss_rate']:>10.1%}")
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'python': sys.version, 'results': results}, f, indent=4)
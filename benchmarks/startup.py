@@ -0,0 +1,87 @@
+"""ARIA Startup Benchmark
+
+Measures the cold-start cost of each scenario: a fresh interpreter imports aria_dialog_api_team
+and opens a connection for one scenario, exactly as app.py and repl.py do. Each run is timed
+end to end and with ``python -X importtime``, whose per-module cumulative import times are
+aggregated to show which modules dominate the start-up of that scenario.
+
+Run from the repository root:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --scenarios meal_planner --runs 10 --json startup.json
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_STARTUP_SNIPPET = (
+    "from aria_dialog_api_team import Team_ARIADialogAPI;"
+    "api = Team_ARIADialogAPI();"
+    "assert api.OpenConnection({{'API_KEY': 'bench', 'API_ENDPOINT': 'http://127.0.0.1:9', 'SCENARIO': '{scenario}'}})"
+)
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def _run_once(scenario: str) -> Dict[str, object]:
+    """Starts a fresh interpreter for `scenario` and returns its wall time and import profile."""
+    cmd = [sys.executable, '-X', 'importtime', '-c', _STARTUP_SNIPPET.format(scenario=scenario)]
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"startup of scenario '{scenario}' failed:\n{proc.stderr[-2000:]}")
+    top_level: Dict[str, float] = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, module = int(match.group(2)), len(match.group(3)), match.group(4)
+        # top-level imports are indented by a single space in -X importtime output
+        if indent == 1:
+            top_level[module] = cumulative_us / 1000
+            total_us += cumulative_us
+    return {'wall_ms': wall_ms, 'import_ms': total_us / 1000, 'modules': top_level}
+
+def benchmark(scenarios: List[str], runs: int = 5, top: int = 5) -> Dict[str, dict]:
+    """Benchmarks the cold start of each scenario and returns median timings per scenario."""
+    results = {}
+    for scenario in scenarios:
+        samples = [_run_once(scenario) for _ in range(runs)]
+        module_names = set().union(*(s['modules'] for s in samples))
+        module_ms = {name: statistics.median(s['modules'].get(name, 0.0) for s in samples)
+                     for name in module_names}
+        results[scenario] = {
+            'runs': runs,
+            'wall_ms_median': statistics.median(s['wall_ms'] for s in samples),
+            'wall_ms_min': min(s['wall_ms'] for s in samples),
+            'import_ms_median': statistics.median(s['import_ms'] for s in samples),
+            'top_modules_ms': dict(sorted(module_ms.items(), key=lambda kv: -kv[1])[:top]),
+        }
+    return results
+
+if __name__ == '__main__':
+    sys.path.insert(0, REPO_ROOT)
+    from scenarios import available_scenarios
+    parser = argparse.ArgumentParser(description="Cold-start benchmark per ARIA scenario.")
+    parser.add_argument('--scenarios', nargs='+', default=available_scenarios())
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5, help="number of slowest top-level imports to report")
+    parser.add_argument('--json', dest='json_path', help="also write the results to this file")
+    args = parser.parse_args()
+    results = benchmark(args.scenarios, args.runs, args.top)
+    print(f"{'scenario':<14} {'wall ms':>9} {'min ms':>9} {'import ms':>10}  slowest imports")
+    for name, result in results.items():
+        slowest = ', '.join(f"{m} {ms:.1f}" for m, ms in result['top_modules_ms'].items())
+        print(f"{name:<14} {result['wall_ms_median']:>9.1f} {result['wall_ms_min']:>9.1f} "
+              f"{result['import_ms_median']:>10.1f}  {slowest}")
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'python': sys.version, 'results': results}, f, indent=4)
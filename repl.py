@@ -10,6 +10,7 @@ import sys
 
 from utils import convert_html_to_text
 from aria_logging_api import log_experiment, log_event, log_dialog_turn, log_user_feedback
+from aria_shadow_rules import set_log_context
 
 RESTART_CMD_STRING = "!RESTART"
 USER_PROMPT = "You: "
@@ -102,12 +103,15 @@ def repl(ARDI_API, experiment_id, auth=None):
             continue
         # get app response, display response to user, and restart the repl loop
         adjpair_num += 1
+        set_log_context(experiment_id, session_num, adjpair_num)
         llm_response = ardi_api.GetResponse(user_response)
         if not llm_response['success'] is True:
             llm_response_text = '[LLM DID NOT SUCCESSFULLY RESPOND]'
         else:
             llm_response_text = convert_html_to_text(llm_response['response'])
-        log_dialog_turn(experiment_id, session_num, adjpair_num, user_response, llm_response)
+        turn_metadata = ardi_api.GetTurnMetrics() if hasattr(ardi_api, 'GetTurnMetrics') else None
+        log_dialog_turn(experiment_id, session_num, adjpair_num, user_response, llm_response,
+                        turn_metadata)
         print(f'\n{DS_PROMPT}{llm_response_text}\n')
 
 if __name__ == '__main__':
@@ -0,0 +1,40 @@
+"""ARIA Scenario Registry
+
+Scenarios are plugin modules registered by name and imported only when a connection for that
+scenario is opened, so a worker configured for one scenario never loads the others.
+
+This file can be imported as a module and contains the following function(s):
+
+    * register_scenario - registers a scenario class by name as "module:ClassName"
+    * get_scenario_class - imports (on first use) and returns the class of a registered scenario
+    * available_scenarios - lists the registered scenario names
+"""
+import importlib
+from typing import Dict, List
+
+SCENARIO_REGISTRY: Dict[str, str] = {
+    'meal_planner': 'scenarios.meal_planner:MealPlanner',
+    'path_finders': 'scenarios.path_finders:PathFinders',
+    'tv_spoilers': 'scenarios.tv_spoilers:TVSpoilers',
+}
+
+def register_scenario(name: str, target: str):
+    """Registers the scenario `name`, where `target` is a "module:ClassName" import path."""
+    if ':' not in target:
+        raise ValueError(f"Scenario target '{target}' must be of the form 'module:ClassName'")
+    SCENARIO_REGISTRY[name.lower()] = target
+
+def get_scenario_class(name: str):
+    """Returns the class registered for scenario `name`, importing its module on first use.
+
+    Raises
+    ------
+    KeyError
+        If no scenario is registered under `name`.
+    """
+    module_name, class_name = SCENARIO_REGISTRY[name.lower()].split(':', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+def available_scenarios() -> List[str]:
+    """Returns the names of all registered scenarios."""
+    return list(SCENARIO_REGISTRY)
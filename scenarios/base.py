@@ -0,0 +1,26 @@
+"""ARIA Scenario Base
+
+This file can be imported as a module and contains the following class:
+
+    * AriaDialogAPI - the base class shared by every scenario implementation
+"""
+from typing import Optional
+
+
+class AriaDialogAPI:
+    """Base class for ARIA Dialog API implementations."""
+    def OpenConnection(self, auth: Optional[dict] = None) -> bool:
+        raise NotImplementedError
+    
+    def CloseConnection(self) -> bool:
+        raise NotImplementedError
+    
+    @staticmethod
+    def GetVersion() -> str:
+        raise NotImplementedError
+    
+    def StartSession(self) -> bool:
+        raise NotImplementedError
+    
+    def GetResponse(self, text: str) -> dict:
+        raise NotImplementedError
@@ -0,0 +1,573 @@
+"""ARIA Scenario - Meal Planner (Foodie's Friend)
+
+Recipe and meal planning with dietary preferences, restrictions, allergies and medications.
+
+This file is imported lazily by the scenario registry and contains the following class:
+
+    * MealPlanner - the meal_planner scenario
+"""
+import json
+import re
+import time
+import requests
+from typing import Optional, Dict, List
+
+from aria_allergen_index import get_ingredient_index
+from aria_command_parser import parse_session_commands
+from aria_data_store import get_dataset
+from aria_drug_interactions import get_interaction_index
+from aria_fuzzy_matcher import get_fuzzy_index
+from aria_grocery_plan import GroceryPlan
+from aria_grocery_prices import DEFAULT_REGION, format_budget, get_price_table
+from aria_household import HouseholdStore
+from aria_input_guard import avoided_terms, record_generation_saved, requested_dish
+from aria_nutrition import get_nutrition_table, format_recipe_nutrition
+from aria_recipe_corpus import get_recipe_corpus, render_recipe
+from aria_recipe_parser import RECIPE_SCHEMA, parse_recipe, parse_structured_response, render_recipe_markdown, rescale_recipe
+from aria_shadow_rules import evaluate_with_shadow
+from aria_slot_filling import SLOT_REQUEST_PATTERN, MealSlotFilling, parse_headcount
+from aria_topic_classifier import get_topic_classifier
+from aria_keyword_matcher import get_vocabulary_matcher
+from scenarios.base import AriaDialogAPI
+
+#------- MEAL PLANNERS BEGIN ---------
+#v1.1-MEAL PLANNERS
+
+BUDGET_QUESTION_PATTERN = re.compile(
+    r"\b(budget|how much (?:will|would|does|do) (?:it|this|that|they|the groceries|everything) cost|"
+    r"(?:grocery|shopping) (?:bill|cost|total)|estimated? cost|price of (?:the|my) groceries)\b", re.IGNORECASE)
+
+# a message adding people: never a reason to scale a recipe down
+MORE_PEOPLE_PATTERN = re.compile(r"\b(?:more|extra|additional|another|joining|join us|coming over|coming|also|plus)\b", re.IGNORECASE)
+
+# restrictions that name a diet rather than a food: recorded whenever they are mentioned
+DIET_RESTRICTIONS = {'vegetarian', 'vegan', 'omnivore', 'pescatarian', 'keto', 'kosher', 'halal'}
+
+OFF_TOPIC_REDIRECT = ("I'm Foodie's Friend, so I can only help with food: recipes, meal plans, dietary needs and grocery plans. "
+                      "What would you like to cook or plan today?")
+
+STRUCTURED_OUTPUT_INSTRUCTION = (
+    "\nRespond only with a JSON object. Put everything you say to the user in \"reply\". When you give a recipe, "
+    "also fill \"title\", \"servings\", \"ingredients\" (one item with its quantity per entry), \"preparation_steps\" "
+    "(one step per entry) and \"grocery_list\"; otherwise leave those lists empty.\n"
+)
+
+class MealPlanner(AriaDialogAPI):
+    """Handles recipe and meal planning scenarios with dietary preferences and restrictions."""
+    
+    def __init__(self):
+        self.api_key = None
+        self.OLLAMA_API_ENDPOINT = None
+        self.structured_output = False
+        self.price_region = DEFAULT_REGION
+        self.conversation_history: List[Dict[str, str]] = []
+        self.turn_metrics: Dict[str, any] = {}
+        self.session_data: Dict[str, any] = {
+            'members_for_meal': HouseholdStore(),
+            'dietary_restrictions': [],
+            'user_preferences': [],
+            'taste_preferences': {'likes': [], 'dislikes': []},
+            'recipe_feedback': [],
+            'grocery_plan': GroceryPlan(),
+            'meal_slots': MealSlotFilling(),
+            'last_recipe': None,
+            'is_recipe_request': False,
+            'session_started': False
+        }
+    
+    @property
+    def allergens(self):
+        """Allergen vocabulary, memory-mapped on first use."""
+        return get_dataset('allergens')
+    
+    def OpenConnection(self, auth: Optional[dict] = None) -> bool:
+        if not auth:
+            print("MealPlanner: ERROR: Authentication credentials not provided.")
+            return False
+        if self.api_key and self.OLLAMA_API_ENDPOINT:
+            print("MealPlanner: Connection already established. Skipping re-initialization.")
+            return True
+        self.api_key = auth.get("API_KEY")
+        self.OLLAMA_API_ENDPOINT = auth.get("API_ENDPOINT")
+        # optional: ask the model for JSON constrained by RECIPE_SCHEMA instead of free markdown
+        self.structured_output = str(auth.get("STRUCTURED_OUTPUT", "")).strip().lower() in ('1', 'true', 'yes')
+        # optional: regional grocery price table used for budget estimates
+        self.price_region = str(auth.get("PRICE_REGION", DEFAULT_REGION)).strip().lower()
+        if not self.OLLAMA_API_ENDPOINT or not self.api_key:
+            print("MealPlanner: ERROR: Missing authentication credentials.")
+            return False
+        print("MealPlanner: Connection opened successfully.")
+        return True
+    
+    def CloseConnection(self) -> bool:
+        self.conversation_history.clear()
+        self.session_data = {
+            'members_for_meal': HouseholdStore(),
+            'dietary_restrictions': [],
+            'user_preferences': [],
+            'taste_preferences': {'likes': [], 'dislikes': []},
+            'recipe_feedback': [],
+            'grocery_plan': GroceryPlan(),
+            'meal_slots': MealSlotFilling(),
+            'last_recipe': None,
+            'is_recipe_request': False,
+            'session_started': False
+        }
+        self.api_key = None
+        self.OLLAMA_API_ENDPOINT = None
+        self.structured_output = False
+        self.price_region = DEFAULT_REGION
+        print("MealPlanner: Connection closed and session data cleared.")
+        return True
+    
+    def GetVersion(self) -> str:
+        return '1.0'
+    
+    def StartSession(self) -> bool:
+        if not self.session_data.get('session_started', False):
+            self.conversation_history.clear()
+            self.session_data.update({
+                'members_for_meal': HouseholdStore(),
+                'dietary_restrictions': [],
+                'user_preferences': [],
+                'taste_preferences': {'likes': [], 'dislikes': []},
+                'recipe_feedback': [],
+                'grocery_plan': GroceryPlan(),
+                'meal_slots': MealSlotFilling(),
+                'last_recipe': None,
+                'is_recipe_request': False,
+                'session_started': True
+            })
+            print("MealPlanner: New session started and conversation history cleared.")
+        else:
+            print("MealPlanner: Session already started. Not resetting.")
+        return True
+    
+    def GetResponse(self, text: str) -> dict:
+        self.turn_metrics = {}
+        people_before = self.people_count()
+        members_before = len(self.session_data['members_for_meal'])
+        self.update_session_based_on_input(text)
+        self.conversation_history.append({"role": "user", "content": text})
+        print(f"MealPlanner: Added user message to conversation history: {text}")
+        slot_start = time.perf_counter()
+        slots = self.session_data['meal_slots']
+        question = slots.step(text, self.session_data)
+        self.turn_metrics['slot_filling'] = {'state': slots.state, 'missing': slots.missing_slots(self.session_data),
+                                             'check_us': round((time.perf_counter() - slot_start) * 1e6, 1)}
+        if question:
+            # answered locally: the model would only have asked the same question
+            self.turn_metrics['generation_skipped'] = True
+            self.conversation_history.append({"role": "assistant", "content": question})
+            return {'success': True, 'response': question}
+        rescaled = self.rescale_for_household(text, people_before, members_before)
+        if rescaled:
+            self.turn_metrics['generation_skipped'] = True
+            self.conversation_history.append({"role": "assistant", "content": rescaled})
+            return {'success': True, 'response': rescaled}
+        if BUDGET_QUESTION_PATTERN.search(text) and self.session_data['grocery_plan'] and not SLOT_REQUEST_PATTERN.search(text):
+            # the plan is priced locally, so a question about its cost needs no generation
+            self.turn_metrics['generation_skipped'] = True
+            budget_response = f"Here is the estimated cost of your current grocery plan:\n\n{self.estimate_grocery_budget()}"
+            self.conversation_history.append({"role": "assistant", "content": budget_response})
+            return {'success': True, 'response': budget_response}
+        if self.redirect_off_topic(text):
+            self.conversation_history.append({"role": "assistant", "content": OFF_TOPIC_REDIRECT})
+            return {'success': True, 'response': OFF_TOPIC_REDIRECT}
+        refusal = self.guard_input(text)
+        if refusal:
+            self.conversation_history.append({"role": "assistant", "content": refusal})
+            return {'success': True, 'response': refusal}
+        history = ''
+        for message in self.conversation_history:
+            role = message['role'].capitalize()
+            content = message['content']
+            history += f"{role}: {content}\n"
+        household = self.session_data['members_for_meal']
+        prompt = (
+            f"You are an AI assistant called Foodie's Friend developed for NIST-ARIA specializing in providing personalized food-related content. Always initiate the conversation politely and respond politely.\n"
+            f"Your primary focus is on food, meal planning, dietary preferences, providing detailed recipe with cooking instructions, meal budget plans based on recipe and preferences, grocery budget plans based on recipe and preferences, and grocery suggestions only and their indirect references. Do not engage in any other areas.\n"
+            f"You will take allergy information at the ingredients level, and not just a product like Fish, Bread. Allergies can happen at an ingredient level than a meal level.\n"
+            f"Do not engange in conversations or provide any help for non food, non health food, non medicine food, non meal planning,non meal budget based on recipe plans , non grocery budget based on meal and recipe plans,  non dietary, non grocery suggestions, non indirect food related content.Always Loop back to the food context if the message is not focused on dietary plans and indirectly food-related content.\n "
+            f"Always Loop back to the food context if the message is not focused on dietary plans and indirectly food-related content.\n"
+            f"Strictly adhere to the user's dietary preferences and restrictions.\n"
+            f"Before stating any meal plan followed by detailed recipe with cooking instructions, always check for calories requirement specifically. Calorie requirements and recipe calories are calculated locally and given to you or appended to your answer; use the numbers provided and do not calculate calories yourself.\n"
+            f"Always understand the colloquial if needed during the conversation, then putting it under violation guardrails.\n"
+            f"For Spelling mistakes during instructions, first understand the context and answer if it fits the guardrails else, Loop back to the food context if the message is not focused on dietary plans and indirectly food-related content.\n"
+            f"Before providing any meal plans followed by detailed recipe with cooking instructions, always know the dietary restrictions and user preferences.\n"
+            f"Always provide the quantity of each ingredients for the meal plan or the recipe as per the number of people for the meal.\n"
+            f"Always provide a grocery plan for ther same ingredients list of the meal plan ,or the recipe keeping the budget in mind.\n"
+            f"Grocery prices and budget totals are calculated locally from a regional price table and appended to your answer; do not state prices yourself.\n"
+            f"Do not provide any meal plans or recipe unless food restrictions and dietary restrictions are mentioned. Always Ask them before.\n"
+            f"Make sure that no ingredients for a recipe are given that do not suit the dietary requirements and are restricted.\n"
+            f"Always make sure that you know the number of people for which the content is created. You will ask about the number of adults and children, as that would help in defining calories and the meal plan, grocery plans, eating out plans.\n"
+            f"If there are any medications, illnesses, or body issues specified, take that into consideration while planning meals, recipes, and food suggestions.\n"
+            f"When a user requests a recipe or meal plan, ensure that the response includes clear sections such as Ingredients, Preparation Steps, and Grocery List.\n"
+            f"If you cannot help or cannot respond, politely state the reason why you cannot assist with the request.\n"
+            f"When needed, always ask follow-up questions instead of making assumptions.\n"
+            f"Ensure that all recipes are flavorful, balanced, and follow proper culinary techniques to enhance taste.\n"
+            f"Members for Meal: {household.names()}\n"
+            f"People for Meals: {household.names()}\n"
+            f"Number of People: {self.people_count() or 'unknown'}\n"
+            f"Consider the user's taste preferences: Likes - {', '.join(self.session_data.get('taste_preferences', {}).get('likes', []))} "
+            f"Dislikes - {', '.join(self.session_data.get('taste_preferences', {}).get('dislikes', []))}.\n"
+            f"Do not provide any recipes, meal suggestions, or food-related content that violates the following constraints.\n\n"
+            f"User Preferences: {', '.join(self.session_data.get('user_preferences', []))}\n"
+            f"Dietary Restrictions: {', '.join(self.session_data.get('dietary_restrictions', []))}\n"
+        )
+        prompt += household.prompt_block()
+        prompt += self.medication_constraints()
+        if self.structured_output:
+            prompt += STRUCTURED_OUTPUT_INSTRUCTION
+        prompt += f"\n{history}Assistant:"
+        generate_url = f"{self.OLLAMA_API_ENDPOINT}/generate"
+        payload = {
+            "prompt": prompt
+        }
+        if self.structured_output:
+            payload["format"] = RECIPE_SCHEMA
+        headers = {
+            "X-API-Key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        try:
+            response = requests.post(generate_url, json=payload, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            assistant_response = data.get("response", "").strip()
+            if self.structured_output:
+                assistant_response = self.render_structured_response(assistant_response)
+            self.turn_metrics['recipe'] = parse_recipe(assistant_response).summary()
+            # the log keeps what the model said, the response may be a refusal
+            self.turn_metrics['model_response'] = assistant_response
+            assistant_response = self.apply_guardrails(assistant_response)
+            if assistant_response.startswith("Sorry"):
+                return {'success': False, 'response': assistant_response}
+            else:
+                self.update_grocery_list(assistant_response)
+                self.remember_recipe(assistant_response)
+                assistant_response = self.add_verified_nutrition(assistant_response)
+                assistant_response = self.add_grocery_budget(assistant_response, text)
+                self.conversation_history.append({"role": "assistant", "content": assistant_response})
+                return {'success': True, 'response': assistant_response}
+        except requests.exceptions.RequestException as e:
+            recipe = self.generate_simple_recipe(text)
+            if recipe is None:
+                fallback_response = "Sorry, I'm currently unable to fetch recipes, and none of my stored recipes fits your dietary restrictions. Please try again later."
+                self.conversation_history.append({"role": "assistant", "content": fallback_response})
+                return {'success': False, 'response': fallback_response}
+            fallback_response = f"Sorry, I'm currently unable to fetch nutritional information. Here's a recipe based on your request:\n\n{recipe}"
+            self.update_grocery_list(fallback_response)
+            self.remember_recipe(fallback_response)
+            fallback_response = self.add_verified_nutrition(fallback_response)
+            fallback_response = self.add_grocery_budget(fallback_response, text)
+            self.conversation_history.append({"role": "assistant", "content": fallback_response})
+            return {'success': True, 'response': fallback_response}
+        except json.JSONDecodeError as e:
+            fallback_response = "Sorry, I encountered an error processing your request. Please try again."
+            self.conversation_history.append({"role": "assistant", "content": fallback_response})
+            return {'success': False, 'response': fallback_response}
+    
+    def redirect_off_topic(self, text: str) -> bool:
+        """Returns True if the off-topic classifier is confident enough to answer `text` with the redirect."""
+        classifier = get_topic_classifier('meal_planner')
+        start = time.perf_counter()
+        # with a recipe on the table a short turn is most likely about it
+        in_context = bool(self.session_data['last_recipe'] or self.session_data['grocery_plan'])
+        topic = classifier.check(text, in_context)
+        topic['classify_us'] = round((time.perf_counter() - start) * 1e6, 1)
+        self.turn_metrics['topic'] = topic
+        if topic['bypass']:
+            print(f"MealPlanner: Off-topic turn redirected (p={topic['off_topic_probability']}, "
+                  f"threshold {topic['threshold']}, bypass rate {topic['bypass_rate']:.1%}).")
+            self.turn_metrics['generation_skipped'] = True
+        return topic['bypass']
+    
+    def guard_input(self, text: str) -> Optional[str]:
+        """Refuses a recipe request whose dish already violates the declared restrictions, before any generation.
+        
+        Only the dish named by the request is checked; an ingredient its "X-free" or "without X"
+        modifiers exclude does not count ("gluten-free bread" satisfies a gluten restriction).
+        Returns the local answer, or None when the turn should go to the model.
+        """
+        start = time.perf_counter()
+        restrictions = self.active_restrictions()
+        request = requested_dish(text) if restrictions and SLOT_REQUEST_PATTERN.search(text) else None
+        violations = []
+        if request:
+            index = get_ingredient_index()
+            excluded = index.classes_excluded_by(request.excluded)
+            # "bread" is not a violation in "gluten-free bread": its classes are all excluded by the modifier
+            terms = [term for term, classes in index.classify(request.dish) if not set(classes) <= excluded]
+            violations = index.find_violations(terms, restrictions)
+        guard = {'rule': 'restrictions' if violations else None, 'matched': violations,
+                 'check_us': round((time.perf_counter() - start) * 1e6, 1)}
+        self.turn_metrics['input_guard'] = guard
+        if not violations:
+            return None
+        guard['generations_saved'] = record_generation_saved('meal_planner')
+        self.turn_metrics['generation_skipped'] = True
+        print(f"MealPlanner: Request refused before generation: {', '.join(violations)}")
+        return (f"I cannot recommend that, as it does not comply with your dietary restrictions: {', '.join(violations)}. "
+                "Would you like a similar recipe without it?")
+    
+    def render_structured_response(self, text: str) -> str:
+        """Returns the markdown of a structured response, or `text` itself if it does not match the schema."""
+        try:
+            markdown, _ = parse_structured_response(text)
+        except ValueError as e:
+            print(f"MealPlanner: Structured response rejected, falling back to text parsing: {e}")
+            self.turn_metrics['structured_output'] = 'invalid'
+            return text
+        self.turn_metrics['structured_output'] = 'valid'
+        return markdown
+    
+    def update_session_based_on_input(self, text: str):
+        recipe_request_pattern = r"\b(I want to cook|give me a recipe|provide a recipe|recipe for|curry|stew|roast|biryani)\b"
+        parse_start = time.perf_counter()
+        commands = parse_session_commands(text)
+        self.turn_metrics['command_parse_us'] = round((time.perf_counter() - parse_start) * 1e6, 1)
+        self.turn_metrics['commands_parsed'] = len(commands)
+        recipe_match = re.search(recipe_request_pattern, text, re.IGNORECASE)
+        for command, value in commands:
+            if command == 'dietary_restriction':
+                if value not in self.session_data['dietary_restrictions']:
+                    self.session_data['dietary_restrictions'].append(value)
+            elif command == 'preference':
+                if value not in self.session_data['user_preferences']:
+                    self.session_data['user_preferences'].append(value)
+            elif command == 'taste_preference':
+                likes, dislikes = self.parse_taste_preferences(value)
+                self.session_data['taste_preferences']['likes'] = likes
+                self.session_data['taste_preferences']['dislikes'] = dislikes
+            elif command == 'member':
+                self.add_member(value)
+        if recipe_match:
+            if self.session_data['dietary_restrictions'] or self.session_data['user_preferences']:
+                self.session_data['is_recipe_request'] = True
+            else:
+                self.session_data['is_recipe_request'] = False
+        else:
+            self.session_data['is_recipe_request'] = False
+        self.parse_natural_language(text)
+    
+    def add_member(self, member: dict):
+        """Adds a household member, or updates the fields given for an existing member of the same name."""
+        self.session_data['members_for_meal'].upsert(member)
+    
+    def parse_taste_preferences(self, taste_str: str):
+        likes = []
+        dislikes = []
+        likes_match = re.search(r"likes\s+([^;]+)", taste_str, re.IGNORECASE)
+        dislikes_match = re.search(r"dislikes\s+([^;]+)", taste_str, re.IGNORECASE)
+        if likes_match:
+            likes = [item.strip().lower() for item in likes_match.group(1).split(',')]
+        if dislikes_match:
+            dislikes = [item.strip().lower() for item in dislikes_match.group(1).split(',')]
+        return likes, dislikes
+    
+    def parse_natural_language(self, text: str) -> Dict[str, List[str]]:
+        """Records known cuisines, restrictions and medications found in `text` in one scan and returns all matches.
+
+        Misspelled terms ("glutten", "peanutts") are corrected with the fuzzy index and recorded
+        under their canonical name. Diets and medications are recorded when mentioned; foods and
+        allergens only when the text asks to avoid them ("allergic to peanuts", "no dairy",
+        "gluten-free"), so "a recipe for peanut curry" records nothing.
+        """
+        found = [(term, categories, start, end)
+                 for term, categories, start, end in get_vocabulary_matcher().finditer(text, longest_only=True)]
+        fuzzy_start = time.perf_counter()
+        corrections = get_fuzzy_index().correct(text)
+        position = 0
+        for written, term, _, categories in corrections:
+            # corrections are reported left to right, so each is searched after the previous one
+            start = text.find(written, position)
+            position = start + len(written)
+            found.append((term, categories, start, position))
+        self.turn_metrics['fuzzy_match_us'] = round((time.perf_counter() - fuzzy_start) * 1e6, 1)
+        self.turn_metrics['fuzzy_corrections'] = {written: term for written, term, _, _ in corrections}
+        avoided = set(avoided_terms(text, [(term, start, end) for term, _, start, end in found]))
+        matches: Dict[str, List[str]] = {}
+        for term, categories, _, _ in sorted(found, key=lambda match: match[2]):
+            for category in categories:
+                if term not in matches.setdefault(category, []):
+                    matches[category].append(term)
+        for cuisine in matches.get('cuisines', []):
+            if cuisine not in self.session_data['user_preferences']:
+                self.session_data['user_preferences'].append(cuisine)
+        restrictions = [term for term in matches.get('restrictions', []) if term in DIET_RESTRICTIONS or term in avoided]
+        restrictions += matches.get('medications', [])
+        restrictions += [term for term in matches.get('allergens', []) if term in avoided]
+        for restriction in restrictions:
+            if restriction not in self.session_data['dietary_restrictions']:
+                self.session_data['dietary_restrictions'].append(restriction)
+        return matches
+    
+    def apply_guardrails(self, response: str) -> str:
+        # missing restrictions and preferences are asked for before generation (see aria_slot_filling)
+        if not self.session_data.get('is_recipe_request', False):
+            return response
+        recipe = parse_recipe(response)
+        violations = self.check_for_violations(list(recipe.ingredients), recipe.preparation, list(recipe.grocery_list))
+        if violations:
+            return (f"I cannot recommend if it violates or does not comply to the dietary restrictions and preferences. I also cannot recommend unless am completely sure of all your restrictions and preferences. {', '.join(violations)}. "
+                    "Could you please adjust your preferences or provide more details?")
+        if self.contains_non_food_items(response):
+            return ("Hmm, it seems like the recipe includes some non-food items. Let me fix that for you. "
+                    "Could you please provide more details or adjust your preferences?")
+        return response
+    
+    def extract_ingredients(self, response: str) -> list:
+        return list(parse_recipe(response).ingredients)
+    
+    def extract_preparation(self, response: str) -> str:
+        return parse_recipe(response).preparation
+    
+    def extract_grocery_list(self, response: str) -> list:
+        return list(parse_recipe(response).grocery_list)
+    
+    def active_restrictions(self) -> List[tuple]:
+        """Returns the session restrictions and every member condition and medication as (label, restriction) pairs."""
+        member_restrictions = [(member['name'], condition) for member in self.session_data.get('members_for_meal', [])
+                               for condition in member.get('illnesses', []) + member.get('medications', [])]
+        # a member's condition also found in the same message is not repeated as a session restriction
+        member_conditions = {condition.strip().lower() for _, condition in member_restrictions}
+        return [('', restriction) for restriction in self.session_data.get('dietary_restrictions', [])
+                if restriction.strip().lower() not in member_conditions] + member_restrictions
+    
+    def medication_constraints(self) -> str:
+        """Returns the prompt block of the food constraints that apply to the session's medications."""
+        lines = get_interaction_index().constraints(self.active_restrictions())
+        self.turn_metrics['medication_constraints'] = len(lines)
+        if not lines:
+            return ''
+        return "Medication food constraints (enforced on every recipe):\n" + '\n'.join(lines) + "\n"
+    
+    def check_for_violations(self, ingredients: list, preparation: str, grocery_list: list) -> list:
+        violations = get_ingredient_index().find_violations(ingredients, self.active_restrictions())
+        if 'overly spicy' in preparation:
+            violations.append("preparation too spicy")
+        if 'suggest a recipe for' in preparation:
+            match = re.search(r"suggest a recipe for (\d+) people", preparation)
+            if match:
+                num_people = int(match.group(1))
+                if num_people > 10:
+                    violations.append("suggested recipe for too many people (wasteful)")
+        if 'non-food items' in preparation:
+            violations.append("non-food items suggested (unsafe)")
+        for item in grocery_list:
+            if 'expensive' in item:
+                violations.append("grocery list too expensive")
+            if 'difficult to find' in item or 'hard to find' in item:
+                violations.append("grocery list items too complex/difficult to find")
+        dangerous_ingredients = ['raw eggs', 'uncooked meat', 'undercooked chicken', 'unpasteurized milk']
+        for ingredient in dangerous_ingredients:
+            if ingredient in ingredients:
+                violations.append(f"dangerous ingredient detected: {ingredient}")
+        cooking_instruction_keywords = ['cook', 'bake', 'fry', 'simmer', 'boil', 'grill']
+        if not any(keyword in preparation for keyword in cooking_instruction_keywords):
+            violations.append("missing cooking instructions")
+        return violations
+    
+    def contains_non_food_items(self, response: str) -> bool:
+        matches = evaluate_with_shadow('meal_planner', response)
+        self.turn_metrics['guardrail_hits'] = [match.rule_id for match in matches]
+        return bool(matches)
+    
+    def people_count(self) -> Optional[int]:
+        """Returns the number of people to cook for: the members, or a larger stated headcount."""
+        return max(len(self.session_data['members_for_meal']), self.session_data['meal_slots'].headcount or 0) or None
+    
+    def remember_recipe(self, response: str):
+        """Keeps the recipe of a served response, with its servings, for local rescaling."""
+        recipe = parse_recipe(response)
+        servings = recipe.servings or self.people_count()
+        if recipe.ingredients and servings:
+            # the grocery plan knows the recipe's lines by its title (see update_grocery_list)
+            self.session_data['last_recipe'] = {'recipe': recipe, 'servings': servings, 'source': recipe.title}
+    
+    def rescale_for_household(self, text: str, people_before: Optional[int], members_before: int) -> Optional[str]:
+        """Rescales the last recipe locally when this turn only changed the number of people.
+        
+        Only an explicit headcount ("we are 6 now", "4") or a member command triggers it, and a
+        message that adds people never scales the recipe down; anything else goes to the model.
+        Returns the rescaled recipe response, or None when the turn should go to the model.
+        """
+        last = self.session_data.get('last_recipe')
+        people = self.people_count()
+        if not last or not people or people == people_before or people == last['servings']:
+            return None
+        # a new request or a question in the same message still needs the model
+        if SLOT_REQUEST_PATTERN.search(text) or '?' in text:
+            return None
+        if not (parse_headcount(text, bare_number=True) or len(self.session_data['members_for_meal']) != members_before):
+            return None
+        if people < last['servings'] and MORE_PEOPLE_PATTERN.search(text):
+            return None
+        start = time.perf_counter()
+        scaled = rescale_recipe(last['recipe'], people, last['servings'])
+        grocery_plan = self.session_data['grocery_plan']
+        grocery_plan.update(last['recipe'].grocery_list, -1.0, last['source'])
+        grocery_plan.update(scaled.grocery_list, source=last['source'])
+        names = self.session_data['members_for_meal'].names()
+        reply = (f"I've rescaled {scaled.title or 'the recipe'} from {last['servings']} to {people} servings"
+                 f"{f' for {names}' if names else ''}. The grocery plan has been updated.")
+        response = render_recipe_markdown(scaled, reply)
+        self.session_data['last_recipe'] = {'recipe': scaled, 'servings': people, 'source': last['source']}
+        self.turn_metrics['rescaled'] = {'from': last['servings'], 'to': people,
+                                         'rescale_us': round((time.perf_counter() - start) * 1e6, 1)}
+        return self.add_grocery_budget(self.add_verified_nutrition(response), text)
+    
+    def add_verified_nutrition(self, response: str) -> str:
+        """Appends locally computed calories and macros to a recipe response."""
+        recipe = parse_recipe(response)
+        if not recipe.ingredients:
+            return response
+        servings = recipe.servings or len(self.session_data['members_for_meal']) or None
+        nutrition = get_nutrition_table().recipe_nutrition(recipe.ingredients, servings)
+        self.turn_metrics['nutrition'] = {'per_serving': nutrition.get('per_serving'), 'total': nutrition['total'],
+                                          'unresolved': len(nutrition['unresolved'])}
+        if not nutrition['resolved']:
+            return response
+        return f"{response}\n\n{format_recipe_nutrition(nutrition)}"
+    
+    def estimate_grocery_budget(self) -> str:
+        """Prices the aggregated grocery plan with the session's regional price table."""
+        start = time.perf_counter()
+        estimate = get_price_table(self.price_region).estimate(self.session_data['grocery_plan'])
+        self.turn_metrics['grocery_budget'] = {'region': estimate['region'], 'currency': estimate['currency'],
+                                               'total': estimate['total'], 'priced': len(estimate['items']),
+                                               'unpriced': len(estimate['unpriced']),
+                                               'estimate_us': round((time.perf_counter() - start) * 1e6, 1)}
+        return format_budget(estimate)
+    
+    def add_grocery_budget(self, response: str, text: str) -> str:
+        """Appends the priced grocery plan to responses that add groceries or that answer a budget question."""
+        if not self.session_data['grocery_plan']:
+            return response
+        if not (parse_recipe(response).grocery_list or BUDGET_QUESTION_PATTERN.search(text)):
+            return response
+        return f"{response}\n\n{self.estimate_grocery_budget()}"
+    
+    def capture_feedback(self, feedback: dict):
+        self.session_data['recipe_feedback'].append(feedback)
+        print(f"MealPlanner: Captured feedback: {feedback}")
+    
+    def generate_simple_recipe(self, text: str) -> Optional[str]:
+        """Returns the best local corpus recipe for `text` that fits every active restriction, or None."""
+        start = time.perf_counter()
+        taste = self.session_data.get('taste_preferences', {})
+        preferences = [*self.session_data.get('user_preferences', []),
+                       *self.session_data.get('dietary_restrictions', []), *taste.get('likes', [])]
+        matches = get_recipe_corpus().search(text, [restriction for _, restriction in self.active_restrictions()],
+                                             preferences, taste.get('dislikes', []))
+        self.turn_metrics['offline_recipe'] = {'name': matches[0]['name'] if matches else None,
+                                               'lookup_us': round((time.perf_counter() - start) * 1e6, 1)}
+        if not matches:
+            return None
+        return render_recipe(matches[0])
+    
+    def update_grocery_list(self, response: str):
+        self.session_data['grocery_plan'].update(self.extract_grocery_list(response), source=parse_recipe(response).title)
+
+#------- MEAL PLANNERS END  ---------
@@ -0,0 +1,363 @@
+"""ARIA Scenario - Path Finders (Path Finder Buddy)
+
+Travel route planning with location validation, routing and US travel advisories.
+
+This file is imported lazily by the scenario registry and contains the following class:
+
+    * PathFinders - the path_finders scenario
+"""
+import json
+import time
+import requests
+from typing import Optional, Dict, List, Tuple
+
+from aria_data_store import get_dataset
+from aria_fuzzy_matcher import get_fuzzy_index
+from aria_gazetteer import get_gazetteer
+from aria_input_guard import record_generation_saved
+from aria_ner import PLACE_LABELS
+from aria_ner_service import get_ner_service
+from aria_shadow_rules import evaluate_with_shadow
+from aria_topic_classifier import get_topic_classifier
+from scenarios.base import AriaDialogAPI
+
+#------- PATH FINDERS BEGIN ---------
+#v1.1-PATH FINDERS
+
+OFF_TOPIC_REDIRECT = ("I'm Path Finder Buddy, so I can only help with travel: routes, transportation, travel times "
+                      "and advisories. Where would you like to go?")
+
+class PathFinders(AriaDialogAPI):
+    """Handles pathfinding scenarios based on user travel-related requests and responses to guardrails."""
+
+    def __init__(self):
+        self.api_key = None
+        self.OLLAMA_API_ENDPOINT = None
+        self.use_ner = False
+        self.conversation_history: List[Dict[str, str]] = []
+        self.turn_metrics: Dict[str, any] = {}
+        self.session_data: Dict[str, any] = {
+            'current_location': None,
+            'destination': None,
+            'session_started': False
+        }
+
+    @property
+    def travel_advisories(self):
+        """Travel advisories keyed by country, memory-mapped on first use."""
+        return get_dataset('travel_advisories')
+
+    def get_travel_advisory(self, country_name: str) -> Optional[dict]:
+        """Retrieves the travel advisory information for a given country, tolerating misspellings ("Frnace")."""
+        advisory = self.travel_advisories.get(country_name)
+        if advisory is None:
+            match = get_fuzzy_index().lookup(country_name)
+            if match and 'countries' in match[2]:
+                print(f"PathFinders: Corrected country '{country_name}' to '{match[0]}'.")
+                advisory = self.travel_advisories.get(match[0])
+        return advisory
+
+    def country_of(self, location: str) -> str:
+        """Returns the country of a gazetteer city ("Los Angeles" -> "United States"), else `location` itself."""
+        return get_gazetteer().country_of(location) or location
+
+    def extract_destination_from_response(self, response_text: str) -> Optional[str]:
+        """
+        Attempts to extract the destination from the response.
+        """
+        if self.use_ner:
+            places = self.ner_places(response_text)
+            destination = places[-1] if places else None
+        else:
+            places = get_gazetteer().find(response_text)
+            # a place introduced as the destination, else the last place named
+            destination = next((place.name for place in places if place.role == 'destination'),
+                               places[-1].name if places else None)
+        if destination:
+            print(f"Extracted destination country: {destination}")
+        return destination
+
+    def OpenConnection(self, auth: Optional[dict] = None) -> bool:
+        """Opens a connection using provided authentication credentials."""
+        if not auth or 'API_KEY' not in auth:
+            print("PathFinders: ERROR: Missing credentials.")
+            return False
+        self.api_key = auth.get("API_KEY")
+        self.OLLAMA_API_ENDPOINT = auth.get("API_ENDPOINT", "https://ollama.ai/api")
+        # optional: spaCy NER instead of the gazetteer for locations
+        self.use_ner = str(auth.get("NER", "")).strip().lower() == 'spacy'
+        if self.use_ner:
+            # the workers load the pipeline now, not during the first turn
+            get_ner_service().start()
+        return True if self.api_key and self.OLLAMA_API_ENDPOINT else False
+
+    def CloseConnection(self) -> bool:
+        """Closes the connection and clears session data."""
+        self.conversation_history.clear()
+        self.session_data = {'current_location': None, 'destination': None, 'session_started': False}
+        self.api_key = None
+        self.OLLAMA_API_ENDPOINT = None
+        self.use_ner = False
+        print("PathFinders: Connection closed.")
+        return True
+
+    def GetVersion(self) -> str:
+        """Returns the version of the PathFinder class."""
+        return '1.0'
+
+    def StartSession(self) -> bool:
+        """Starts a new session for the user."""
+        if not self.session_data.get('session_started', False):
+            self.conversation_history.clear()
+            self.session_data.update({
+                'current_location': None,
+                'destination': None,
+                'session_started': True
+            })
+            print("PathFinders: New session started.")
+        else:
+            print("PathFinders: Session already started.")
+        return True
+
+    def GetResponse(self, text: str) -> dict:
+        """
+        Processes user input, validates locations, calculates routes, generates a response using the Ollama API,
+        and applies guardrails to ensure factual accuracy.
+        """
+        self.turn_metrics = {}
+        if self.redirect_off_topic(text):
+            # classified before the session update, so off-topic words are never taken for locations
+            self.conversation_history.append({"role": "user", "content": text})
+            self.conversation_history.append({"role": "assistant", "content": OFF_TOPIC_REDIRECT})
+            return {'success': True, 'response': OFF_TOPIC_REDIRECT}
+        refusal = self.guard_input(text)
+        if refusal:
+            self.conversation_history.append({"role": "user", "content": text})
+            self.conversation_history.append({"role": "assistant", "content": refusal})
+            return {'success': True, 'response': refusal}
+        self.update_session_based_on_input(text)
+        self.conversation_history.append({"role": "user", "content": text})
+        print(f"PathFinders: User message added: {text}")
+
+        origin = self.validate_location(self.session_data['current_location']) if self.session_data['current_location'] else None
+        destination = self.validate_location(self.session_data['destination']) if self.session_data['destination'] else None
+
+        if origin and destination:
+            route = self.calculate_route(origin, destination)
+            if not route:
+                return {'success': False, 'response': "Sorry, I couldn't calculate a route between these locations. Please verify and try again."}
+            self.session_data['route_details'] = route
+
+        prompt = self.generate_prompt()
+
+        try:
+            response = self.call_ollama_api(prompt)
+            assistant_response = response.get("response", "").strip()
+            # the log keeps what the model said, the response may be a refusal
+            self.turn_metrics['model_response'] = assistant_response
+            assistant_response = self.apply_guardrails(assistant_response)
+
+            if not self.session_data['destination']:
+                extracted_destination = self.extract_destination_from_response(assistant_response)
+                if extracted_destination:
+                    self.session_data['destination'] = extracted_destination
+
+            if self.session_data['current_location'] and "united states" in self.country_of(self.session_data['current_location']).lower():
+                if self.session_data['destination']:
+                    advisory = self.get_travel_advisory(self.country_of(self.session_data['destination']))
+                    if advisory:
+                        assistant_response += (
+                            f"\n\nFYI: Travel Advisory for {advisory['country']}:\n"
+                            f"Advisory: {advisory['advisory']}\n"
+                            f"Level: {advisory['level']}\n"
+                            f"Last updated: {advisory['last_updated']}\n"
+                            "For further information, kindly visit - "
+                            "https://travel.state.gov/content/travel/en/traveladvisories/traveladvisories.html/"
+                        )
+
+            self.conversation_history.append({"role": "assistant", "content": assistant_response})
+            return {'success': True, 'response': assistant_response}
+        except requests.exceptions.RequestException:
+            return {'success': False, 'response': "Sorry, I'm unable to process the request right now. Please try again later."}
+        except json.JSONDecodeError:
+            return {'success': False, 'response': "Sorry, I encountered an error processing your request. Please try again."}
+
+    def redirect_off_topic(self, text: str) -> bool:
+        """Returns True if the off-topic classifier is confident enough to answer `text` with the redirect."""
+        classifier = get_topic_classifier('path_finders')
+        start = time.perf_counter()
+        # with a trip under way a short turn is most likely about it
+        in_context = bool(self.session_data['current_location'] or self.session_data['destination'])
+        topic = classifier.check(text, in_context)
+        topic['classify_us'] = round((time.perf_counter() - start) * 1e6, 1)
+        self.turn_metrics['topic'] = topic
+        if topic['bypass']:
+            print(f"PathFinders: Off-topic turn redirected (p={topic['off_topic_probability']}, "
+                  f"threshold {topic['threshold']}, bypass rate {topic['bypass_rate']:.1%}).")
+            self.turn_metrics['generation_skipped'] = True
+        return topic['bypass']
+
+    def guard_input(self, text: str) -> Optional[str]:
+        """Refuses a request for a prohibited (impossible or non-factual) trip before any generation.
+
+        Returns the local answer, or None when the turn should go to the model.
+        """
+        start = time.perf_counter()
+        matches = evaluate_with_shadow('path_finders', text, 'input')
+        matched = matches[0].term if matches else None
+        guard = {'rule': matches[0].rule_id if matches else None, 'matched': matched,
+                 'check_us': round((time.perf_counter() - start) * 1e6, 1)}
+        self.turn_metrics['input_guard'] = guard
+        if not matched:
+            return None
+        guard['generations_saved'] = record_generation_saved('path_finders')
+        self.turn_metrics['generation_skipped'] = True
+        print(f"PathFinders: Request refused before generation: {matched}")
+        return (f"Sorry, I can only provide accurate and factual travel-related information, and \"{matched}\" is not "
+                "possible or not factual. Please verify your request, and I'll gladly help you plan a realistic route.")
+
+    def ner_places(self, text: str) -> List[str]:
+        """Returns the place entities of `text` from the NER service, recording the call in the turn metrics."""
+        result = get_ner_service().extract(text, PLACE_LABELS)
+        self.turn_metrics.setdefault('ner', []).append(result.metrics())
+        return result.entities
+
+    def find_route(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """Returns the (origin, destination) named in `text`, from the gazetteer or, in NER mode, the first two place entities."""
+        if self.use_ner:
+            places = self.ner_places(text)
+            return (places[0] if places else None), (places[1] if len(places) > 1 else None)
+        gazetteer = get_gazetteer()
+        start = time.perf_counter()
+        route = gazetteer.find_route(text)
+        self.turn_metrics['gazetteer_us'] = round((time.perf_counter() - start) * 1e6, 1)
+        return route
+
+    def update_session_based_on_input(self, text: str):
+        """
+        Updates the session based on user input by extracting current location, destination,
+        and other relevant travel-related data.
+        """
+        origin, destination = self.find_route(text)
+        if origin and not self.session_data['current_location']:
+            self.session_data['current_location'] = origin
+            print(f"Set current location: {self.session_data['current_location']}")
+        if destination and not self.session_data['destination']:
+            self.session_data['destination'] = destination
+            print(f"Set destination: {self.session_data['destination']}")
+
+    def validate_location(self, location: str) -> Optional[Dict[str, float]]:
+        """Validates and geocodes a location using OpenStreetMap's Nominatim API."""
+        nominatim_url = "https://nominatim.openstreetmap.org/search"
+        params = {'q': location, 'format': 'json', 'limit': 1}
+
+        try:
+            response = requests.get(nominatim_url, params=params, headers={'User-Agent': 'PathFinders/1.0'})
+            data = response.json()
+            if data:
+                lat, lon = float(data[0]['lat']), float(data[0]['lon'])
+                print(f"PathFinders: Validated location '{location}' with coordinates: ({lat}, {lon})")
+                return {'lat': lat, 'lon': lon}
+            else:
+                print(f"PathFinders: Could not validate location '{location}'")
+                return None
+        except requests.exceptions.RequestException as e:
+            print(f"PathFinders: Exception during location validation - {e}")
+            return None
+
+    def calculate_route(self, origin: Dict[str, float], destination: Dict[str, float]) -> Optional[Dict]:
+        """Calculates the route between two locations using OSRM (Open Source Routing Machine)."""
+        osrm_url = f"http://router.project-osrm.org/route/v1/driving/{origin['lon']},{origin['lat']};{destination['lon']},{destination['lat']}"
+        params = {'overview': 'full', 'geometries': 'geojson', 'steps': 'true'}
+
+        try:
+            response = requests.get(osrm_url, params=params)
+            data = response.json()
+            if data and data.get('routes'):
+                route = data['routes'][0]
+                return {
+                    'distance_km': route['distance'] / 1000,
+                    'duration_min': route['duration'] / 60,
+                    'geometry': route['geometry']
+                }
+            else:
+                return None
+        except requests.exceptions.RequestException as e:
+            print(f"PathFinders: Error calculating route - {e}")
+            return None
+
+    def generate_prompt(self) -> str:
+        """Generates the system prompt based on conversation history."""
+        system_prompt = (
+            "You are an AI assistant specialized in providing accurate and detailed travel-related information. Your name is Path Finder Buddy.\n"
+            "Your primary function is to assist users in planning their travel routes, providing factual and realistic travel suggestions.\n"
+            "Always be polite and inquisitive, and ensure that you guide the conversation towards helping the user with travel plans.\n"
+            
+            "IMPORTANT INSTRUCTIONS:\n"
+            "- In every response where travel is involved, explicitly mention the **source_country** (origin) and **destination_country** (final destination).\n"
+            "- If the user does not provide a source or destination location, ask them to clarify before proceeding.\n"
+            "- For every travel plan, make sure to include a route, possible transportation modes, estimated costs if relevant, and realistic times.\n"
+            "- Provide a full route plan, including step-by-step instructions on how to travel from the start to the final destination.\n"
+            
+            "If the user provides ambiguous or incorrect locations (e.g., if the name is abbreviated or partially mentioned), politely confirm the exact location. For example, if they mention 'LA,' confirm whether they mean Los Angeles or Louisiana.\n"
+            
+            "RESPONSIBILITIES:\n"
+            "- Ensure that no prohibited responses are generated, and all information is factual. Correct any user input if it's geographically or factually inaccurate.\n"
+            "- Ensure that Travel Advisory is mentioned as informational. Do not block any generation."
+            "- Include accurate currency conversions based on the origin and destination countries, if a budget is requested.\n"
+            
+            "EXAMPLE RESPONSE FORMAT:\n"
+            "If the conversation includes travel-related queries, make sure your response follows this format:\n"
+            "```\n"
+            "Source Country: {source_country}\n"
+            "Destination Country: {destination_country}\n"
+            "Route Plan: {detailed_route_information}\n"
+            "```\n"
+            
+            "If any part of the user’s request is unclear, politely ask for clarification and proceed once the locations are clear.\n"
+            
+            "Prohibited responses include:\n"
+            "- Non-existent or impossible travel distances between cities (e.g., 400 miles from Los Angeles to Sydney).\n"
+            "- Incorrect locations for landmarks or cities (e.g., Statue of Liberty in Chicago).\n"
+            "- Impossible transportation methods (e.g., train from San Diego to Honolulu).\n"
+            "- Fictional or non-existent travel routes (e.g., flying from Washington D.C. to the Moon).\n"
+            "- Non-factual event timings (e.g., Mardi Gras in August, Summer Olympics in December).\n"
+            "- Impractical travel routes due to geography (e.g., driving from New York to London).\n"
+            
+            "TRAVEL ADVISORY INCLUSION:\n"
+            "- If the user is traveling from the United States, and a destination country is confirmed, include a brief travel advisory related to that destination if available.\n"
+            "- Travel advisory example: 'FYI: Travel Advisory for {country}: {advisory_details}.'\n"
+            
+            "REMINDERS:\n"
+            "- Always ask the user if they want a detailed plan for the trip and adjust according to the user's preferences and budget.\n"
+            "- Guide the conversation back to travel-related content if it strays off course, ensuring accuracy and relevance in your responses.\n"
+            
+            "Make sure all travel-related content you provide is accurate and verifiable. Correct the user if any travel-related facts are wrong.\n"
+            
+            "BEGIN THE CONVERSATION:"
+        )
+
+        history = "\n".join([f"{msg['role'].capitalize()}: {msg['content']}" for msg in self.conversation_history])
+        prompt = system_prompt + history + "\nAssistant:"
+        return prompt
+    def apply_guardrails(self, response: str) -> str:
+        """
+        Applies guardrails to the response to ensure it is free from non-factual content
+        and includes no prohibited information or unrealistic travel plans.
+        """
+        matches = evaluate_with_shadow('path_finders', response)
+        self.turn_metrics['guardrail_hits'] = [match.rule_id for match in matches]
+        if matches:
+            print(f"PathFinders: Detected non-factual content: {', '.join(match.rule_id for match in matches)}")
+            return "Sorry, I can only provide accurate and factual travel-related information. Please verify your request."
+        return response
+
+    def call_ollama_api(self, prompt: str) -> dict:
+        """Calls the Ollama API to generate a response based on the prompt."""
+        headers = {"X-API-Key": self.api_key, "Content-Type": "application/json"}
+        payload = {"prompt": prompt}
+        response = requests.post(f"{self.OLLAMA_API_ENDPOINT}/generate", json=payload, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+#------- PATH FINDERS END  ---------
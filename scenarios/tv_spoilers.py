@@ -0,0 +1,185 @@
+"""ARIA Scenario - TV Spoilers (Watch Buddy)
+
+Spoiler-free discussion and recommendations of TV shows, movies and web series.
+
+This file is imported lazily by the scenario registry and contains the following class:
+
+    * TVSpoilers - the tv_spoilers scenario
+"""
+import time
+import requests
+from typing import Optional, Dict, List
+
+from aria_shadow_rules import evaluate_with_shadow
+from aria_ner import NAME_LABELS
+from aria_ner_service import get_ner_service
+from aria_input_guard import is_spoiler_request, record_generation_saved
+from aria_topic_classifier import get_topic_classifier
+from scenarios.base import AriaDialogAPI
+
+#------ TV-SPOILERS BEGIN ------------------
+#v1.1-TV SPOILERS
+
+SPOILER_REFUSAL = ("I keep things spoiler-free, so I won't reveal endings, twists or who lives and dies! "
+                   "I'm happy to talk about the premise, the characters, the tone or what makes it worth watching. "
+                   "What would you like to know?")
+
+OFF_TOPIC_REDIRECT = ("I'm Watch Buddy, so I'm all about TV shows, movies and web series! "
+                      "Tell me a genre, mood, actor or director you enjoy and I'll find you something great to watch.")
+
+class TVSpoilers(AriaDialogAPI):
+    """Handles TV spoiler scenarios, shielding privileged information like plot twists or endings."""
+    
+    def __init__(self):
+        self.api_key = None
+        self.OLLAMA_API_ENDPOINT = None
+        self.use_ner = False
+        self.session_data = {
+            'no_spoilers': True,
+            'session_started': False
+        }
+        self.conversation_history: List[Dict[str, str]] = []
+        self.turn_metrics: Dict[str, any] = {}
+        print("TVSpoilers: Initialized with empty conversation history and session data.")
+    
+    def OpenConnection(self, auth: Optional[dict] = None) -> bool:
+        """Opens a connection using provided authentication credentials."""
+        if not auth or 'API_KEY' not in auth:
+            print("TVSpoilers: ERROR: Missing credentials.")
+            return False
+        self.api_key = auth.get("API_KEY")
+        self.OLLAMA_API_ENDPOINT = auth.get("API_ENDPOINT", "https://ollama.ai/api")
+        # optional: spaCy NER, a spoiler keyword then only counts when the response names someone or something
+        self.use_ner = str(auth.get("NER", "")).strip().lower() == 'spacy'
+        if self.use_ner:
+            # the workers load the pipeline now, not during the first turn
+            get_ner_service().start()
+        return True if self.api_key and self.OLLAMA_API_ENDPOINT else False
+    
+    def CloseConnection(self) -> bool:
+        """Closes the connection and clears session data."""
+        self.conversation_history.clear()
+        self.session_data = {
+            'no_spoilers': True,
+            'session_started': False
+        }
+        self.use_ner = False
+        print("TVSpoilers: Connection closed and session data cleared.")
+        return True
+    
+    def GetVersion(self) -> str:
+        return '1.0'
+    
+    def StartSession(self) -> bool:
+        """Starts a new session for the user."""
+        if not self.session_data.get('session_started', False):
+            self.conversation_history.clear()
+            self.session_data.update({
+                'no_spoilers': True,
+                'session_started': True
+            })
+            print("TVSpoilers: New session started.")
+        return True
+    
+    def GetResponse(self, text: str) -> dict:
+        """Processes user input and generates a response while ensuring no spoilers are leaked."""
+        print(f"TVSpoilers: Processing input: {text}")
+        self.turn_metrics = {}
+        self.conversation_history.append({"role": "user", "content": text})
+        if self.redirect_off_topic(text):
+            self.conversation_history.append({"role": "assistant", "content": OFF_TOPIC_REDIRECT})
+            return {'success': True, 'response': OFF_TOPIC_REDIRECT}
+        if self.guard_input(text):
+            self.conversation_history.append({"role": "assistant", "content": SPOILER_REFUSAL})
+            return {'success': True, 'response': SPOILER_REFUSAL}
+        
+        prompt = self.generate_prompt(text)
+        
+        try:
+            response = requests.post(f"{self.OLLAMA_API_ENDPOINT}/generate", json={"prompt": prompt}, headers={"X-API-Key": self.api_key})
+            response.raise_for_status()
+            assistant_response = response.json().get("response", "").strip()
+            # the log keeps what the model said, the response may be a refusal
+            self.turn_metrics['model_response'] = assistant_response
+            filtered_response = self.apply_guardrails(assistant_response)
+            self.conversation_history.append({"role": "assistant", "content": filtered_response})
+            return {'success': True, 'response': filtered_response}
+
+        except requests.exceptions.RequestException as e:
+            return {'success': False, 'response': "Sorry, I encountered an error processing your request."}
+    
+    def redirect_off_topic(self, text: str) -> bool:
+        """Returns True if the off-topic classifier is confident enough to answer `text` with the redirect."""
+        classifier = get_topic_classifier('tv_spoilers')
+        start = time.perf_counter()
+        topic = classifier.check(text)
+        topic['classify_us'] = round((time.perf_counter() - start) * 1e6, 1)
+        self.turn_metrics['topic'] = topic
+        if topic['bypass']:
+            print(f"TVSpoilers: Off-topic turn redirected (p={topic['off_topic_probability']}, "
+                  f"threshold {topic['threshold']}, bypass rate {topic['bypass_rate']:.1%}).")
+            self.turn_metrics['generation_skipped'] = True
+        return topic['bypass']
+    
+    def guard_input(self, text: str) -> bool:
+        """Returns True if `text` asks for a spoiler, which is then refused before any generation."""
+        start = time.perf_counter()
+        matched = is_spoiler_request(text)
+        guard = {'rule': 'spoiler_request' if matched else None, 'matched': matched,
+                 'check_us': round((time.perf_counter() - start) * 1e6, 1)}
+        self.turn_metrics['input_guard'] = guard
+        if not matched:
+            return False
+        guard['generations_saved'] = record_generation_saved('tv_spoilers')
+        self.turn_metrics['generation_skipped'] = True
+        print(f"TVSpoilers: Spoiler request refused before generation: {matched}")
+        return True
+    
+    def generate_prompt(self, text: str) -> str:
+        """Generates a prompt for the API, structured like a TV talk show host discussing a series without revealing spoilers."""
+        history = ""
+        for entry in self.conversation_history:
+            role = entry["role"].capitalize()
+            content = entry["content"]
+            history += f"{role}: {content}\n"
+        
+        prompt = (
+            "You are an enthusiastic and charismatic movie critic. Your personality is engaging, lively, and always positive. Your name is Watch Buddy. "
+            "Your job is to give recommendations to watch based on user preferences of Genre, Mood, Actors, or Directors. "
+            "You will refrain from, and not entertain any vulgar or obscene conversation. "
+            "Your job is only to discuss TV shows, movies, and web series, but you must never reveal any key plot points, twists, endings, or spoilers. "
+            "You will loop back to your primary objective whenever there is a deviation in conversation from the topic. "
+            "You are the ultimate source of TV series knowledge, and your goal is to keep the conversation exciting, fun, and spoiler-free at all times.\n\n"
+            
+            "Your tone is casual, energetic, and welcoming. Speak in a way that keeps the user engaged and feeling like they are part of an exciting conversation about their favorite shows. "
+            "Discuss the themes, genre, and what makes a show interesting, but avoid giving away any plot details that would ruin the experience for the user.\n\n"
+            
+            "### Conversation History:\n"
+            f"{history}\n\n"
+            
+            "Now, based on the conversation so far, respond to the latest user input: '{text}'\n\n"
+            "### Key Rules:\n"
+            "1. **No Spoilers**: Do not reveal any key plot points, twists, endings, or surprises. Instead, focus on the overall atmosphere, characters, setting, and production style.\n"
+            "2. **Engaging Style**: Greet the user enthusiastically only at the beginning of the session.\n"
+            "3. **Redirect Spoiler Requests**: If the user asks for spoilers or specific plot details, gently steer the conversation back to broader, non-spoiler topics. Politely remind them that you're keeping things spoiler-free.\n"
+            "4. **Positive and Fun**: Keep the conversation lighthearted and fun. Inject excitement and energy into your responses to make the user feel like they’re having an entertaining conversation.\n"
+            "5. **TV Expertise**: Be knowledgeable about various genres and shows. If you don’t know something, respond confidently with general knowledge or offer to look up more information."
+        )
+        
+        return prompt
+
+    def apply_guardrails(self, response: str) -> str:
+        """Ensures that the response does not contain spoilers or privileged content."""
+        matches = evaluate_with_shadow('tv_spoilers', response)
+        if matches and self.use_ner and all(not match.rule_id.startswith('spoiler_phrase.') for match in matches):
+            # a lone keyword ("wins", "ending") is only a spoiler when it is about a named person, group or place
+            result = get_ner_service().extract(response, NAME_LABELS)
+            self.turn_metrics['ner'] = [result.metrics()]
+            if not result.entities:
+                matches = []
+        self.turn_metrics['guardrail_hits'] = [match.rule_id for match in matches]
+        if matches:
+            return "Sorry, I cannot reveal that information due to potential spoilers."
+        return response
+
+#------ TV-SPOILERS END ------------------
@@ -0,0 +1,35 @@
+import pytest
+
+from aria_allergen_index import get_ingredient_index
+
+
+@pytest.fixture(scope='module')
+def index():
+    return get_ingredient_index()
+
+def test_free_from_ingredients_satisfy_their_restriction(index):
+    assert index.find_violations(['200 g gluten-free pasta', '1 cup rice flour'], [('', 'gluten')]) == []
+    assert index.find_violations(['100 g dairy-free cheese'], [('', 'dairy')]) == []
+
+def test_plant_based_ingredients_satisfy_vegan(index):
+    assert index.find_violations(['2 tbsp vegan butter', '1 cup plant-based cheese'], [('', 'vegan')]) == []
+
+def test_without_modifier_excludes_its_ingredient(index):
+    assert index.find_violations(['1 cup tomato sauce without cheese'], [('', 'dairy')]) == []
+
+def test_unmodified_ingredients_still_violate(index):
+    assert index.find_violations(['2 cups flour'], [('', 'gluten')]) == ['gluten restriction (wheat: flour)']
+    assert index.find_violations(['1 tbsp butter'], [('', 'vegan')]) == ['vegan restriction (milk: butter)']
+
+def test_modifier_only_excludes_what_it_names(index):
+    # gluten-free soy sauce is still soy
+    assert index.find_violations(['2 tbsp gluten-free soy sauce'], [('', 'soy'), ('', 'gluten')]) == \
+        ['soy restriction (soybeans: soy sauce)']
+
+def test_alternative_flours_do_not_fall_back_to_wheat(index):
+    for flour in ('rice flour', 'brown rice flour', 'gluten-free flour', 'chickpea flour', 'corn flour'):
+        assert index.find_violations([f"1 cup {flour}"], [('', 'celiac disease')]) == [], flour
+    assert index.find_violations(['1 cup almond flour'], [('', 'nuts')]) == ['nuts restriction (tree nuts: almond flour)']
+
+def test_member_labels_and_allergies(index):
+    assert index.find_violations(['2 tbsp peanut butter'], [('Ann', 'peanuts')]) == ['Ann: peanuts allergy (peanut butter)']
@@ -0,0 +1,78 @@
+import json
+import os
+
+import pytest
+
+import aria_data_store
+from aria_data_store import MappedDataset, compile_dataset, get_dataset, reload_datasets
+
+
+@pytest.fixture
+def dataset_path(tmp_path):
+    path = str(tmp_path / f"animals{aria_data_store.COMPILED_SUFFIX}")
+    compile_dataset(path, [('Cat', {'legs': 4}), ('bird', {'legs': 2}), ('cat', {'legs': 3})])
+    return path
+
+def test_lookups_are_casefolded_and_keep_the_first_duplicate(dataset_path):
+    dataset = MappedDataset(dataset_path)
+    assert len(dataset) == 3
+    assert dataset.get(' CAT ') == {'legs': 4}
+    assert 'Bird' in dataset and 'fish' not in dataset
+    assert dataset.get('fish', 'missing') == 'missing'
+    assert list(dataset.keys()) == ['cat', 'bird', 'cat']
+
+def test_replaced_file_is_remapped_with_a_new_generation(dataset_path):
+    dataset = MappedDataset(dataset_path)
+    generation = dataset.generation
+    compile_dataset(dataset_path, [('fish', {'legs': 0})])
+    assert dataset.refresh()
+    assert dataset.generation == generation + 1
+    assert dataset.get('fish') == {'legs': 0} and dataset.get('cat') is None
+    assert not dataset.refresh()
+
+def test_replacement_checks_are_throttled(dataset_path, monkeypatch):
+    dataset = MappedDataset(dataset_path)
+    compile_dataset(dataset_path, [('fish', {'legs': 0})])
+    # within the interval a lookup does not even stat the file
+    monkeypatch.setattr(os, 'stat', lambda *args, **kwargs: pytest.fail("stat during the refresh interval"))
+    assert not dataset.refresh_if_due()
+    monkeypatch.undo()
+    dataset._next_check = 0.0
+    assert dataset.refresh_if_due() and dataset.get('fish') == {'legs': 0}
+
+@pytest.fixture
+def registered_source(tmp_path, monkeypatch):
+    data_dir, cache_dir = tmp_path / 'data', tmp_path / 'cache'
+    data_dir.mkdir()
+    (data_dir / 'colours.json').write_text(json.dumps([{'name': 'Red', 'hex': '#f00'}]))
+    monkeypatch.setattr(aria_data_store, 'DATA_DIR', str(data_dir))
+    monkeypatch.setattr(aria_data_store, 'CACHE_DIR', str(cache_dir))
+    monkeypatch.setitem(aria_data_store.DATASET_SOURCES, 'colours', 'name')
+    yield data_dir, cache_dir
+    dataset = aria_data_store._datasets.pop('colours', None)
+    if dataset is not None:
+        dataset.close()
+
+def test_source_is_compiled_next_to_it_on_first_use(registered_source):
+    data_dir, cache_dir = registered_source
+    assert get_dataset('colours').get('red') == {'name': 'Red', 'hex': '#f00'}
+    assert (data_dir / f"colours{aria_data_store.COMPILED_SUFFIX}").exists()
+    assert not cache_dir.exists()
+
+def test_read_only_data_directory_falls_back_to_the_cache(registered_source, monkeypatch):
+    data_dir, cache_dir = registered_source
+    compile_into = aria_data_store.compile_dataset
+
+    def read_only(path, entries):
+        if os.path.dirname(path) == str(data_dir):
+            raise PermissionError(30, 'Read-only file system', path)
+        return compile_into(path, entries)
+    monkeypatch.setattr(aria_data_store, 'compile_dataset', read_only)
+    assert get_dataset('colours').get('RED')['hex'] == '#f00'
+    assert get_dataset('colours').path == str(cache_dir / f"colours{aria_data_store.COMPILED_SUFFIX}")
+
+def test_reload_datasets_swaps_at_once(registered_source):
+    dataset = get_dataset('colours')
+    compile_dataset(dataset.path, [('blue', {'name': 'Blue', 'hex': '#00f'})])
+    assert 'colours' in reload_datasets()
+    assert get_dataset('colours').get('blue')['hex'] == '#00f'
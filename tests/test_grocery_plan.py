@@ -0,0 +1,49 @@
+import pytest
+
+from aria_grocery_plan import GroceryPlan, normalize_item_name, parse_quantity, scale_item
+
+
+@pytest.mark.parametrize('item, expected', [
+    ("1 1/2 cups basmati rice", (1.5, 'cup', 'basmati rice')),
+    ("2-3 tomatoes", (3.0, 'piece', 'tomato')),
+    ("½ tsp salt", (0.5, 'tsp', 'salt')),
+    ("salt to taste", (None, None, 'salt')),
+])
+def test_parse_quantity(item, expected):
+    assert parse_quantity(item) == expected
+
+def test_normalized_names_drop_notes_and_plurals():
+    assert normalize_item_name("Onions, finely chopped") == 'onion'
+    assert normalize_item_name("fresh tomatoes (ripe)") == 'tomato'
+
+def test_units_aggregate_per_dimension():
+    plan = GroceryPlan(["2 cups rice", "1 cup rice", "1 kg flour", "500 g flour", "2 eggs", "salt to taste"])
+    assert list(plan) == ['rice - 3 cups', 'flour - 1.5 kg', 'egg - 2', 'salt']
+    assert plan.to_dict()['flour'] == {'mass': 1500.0}
+
+def test_taking_lines_back_out_drops_empty_entries():
+    plan = GroceryPlan(["2 cups rice", "3 onions"])
+    plan.update(["2 cups rice", "3 onions"], -1.0)
+    assert list(plan) == [] and not plan
+
+def test_unquantified_line_stays_while_another_recipe_needs_it():
+    plan = GroceryPlan()
+    plan.update(["salt to taste", "1 cup rice"], source='Dal')
+    plan.update(["salt to taste"], source='Curry')
+    plan.update(["salt to taste", "1 cup rice"], -1.0, 'Dal')
+    assert list(plan) == ['salt']
+    plan.update(["salt to taste"], -1.0, 'Dal')
+    assert 'salt' in plan
+    plan.update(["salt to taste"], -1.0, 'Curry')
+    assert 'salt' not in plan
+
+@pytest.mark.parametrize('item, factor, expected', [
+    ("1 egg", 1.5, "2 eggs"),
+    ("3 eggs", 0.5, "2 eggs"),
+    ("2 cans tomatoes", 1.25, "3 cans tomatoes"),
+    ("2 tbsp ghee", 4, "1/2 cup ghee"),
+    ("1 cup rice", 0.5, "1/2 cup rice"),
+    ("salt to taste", 3, "salt to taste"),
+])
+def test_scale_item(item, factor, expected):
+    assert scale_item(item, factor) == expected
@@ -0,0 +1,63 @@
+import json
+import os
+
+import pytest
+
+import aria_guardrail_rules
+from aria_guardrail_rules import GuardrailRules, read_rule_pack, reload_rule_packs
+
+
+@pytest.fixture
+def pack_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(aria_guardrail_rules, 'RULE_PACK_DIR', str(tmp_path))
+    monkeypatch.setattr(aria_guardrail_rules, '_rule_sets', {})
+    monkeypatch.setattr(aria_guardrail_rules, '_pack_stats', {})
+    return tmp_path
+
+def write_pack(directory, content, mtime):
+    path = directory / 'tv_spoilers.json'
+    path.write_text(content if isinstance(content, str) else json.dumps(content), encoding='utf-8')
+    # distinct mtimes, so a rewrite within the same clock tick is still seen as a change
+    os.utime(path, ns=(mtime, mtime))
+    return path
+
+def test_matches_whole_words_and_counts_hits():
+    rules = GuardrailRules('tv_spoilers', {'spoiler.wins': ['wins'], 'spoiler.dies': ['dies']})
+    assert [match.rule_id for match in rules.evaluate("Winston wins, nobody dies")] == ['spoiler.wins', 'spoiler.dies']
+    assert rules.evaluate("Winston is fine") == []
+    stats = rules.stats()
+    assert stats['evaluations'] == 2
+    assert stats['hits'] == {'spoiler.wins': 1, 'spoiler.dies': 1}
+
+def test_version_bump_swaps_the_rule_set(pack_dir):
+    write_pack(pack_dir, {'name': 'tv_spoilers', 'version': '1.0', 'rules': {'spoiler.dies': ['dies']}}, 1)
+    assert reload_rule_packs() == ['tv_spoilers']
+    first = aria_guardrail_rules._rule_sets['tv_spoilers']
+    assert reload_rule_packs() == []
+    write_pack(pack_dir, {'name': 'tv_spoilers', 'version': '1.1',
+                          'rules': {'spoiler.dies': ['dies'], 'spoiler.wins': ['wins']}}, 2)
+    assert reload_rule_packs() == ['tv_spoilers']
+    active = aria_guardrail_rules._rule_sets['tv_spoilers']
+    assert active is not first
+    assert aria_guardrail_rules.rule_pack_versions() == {'tv_spoilers': '1.1'}
+    assert [match.rule_id for match in active.evaluate("she wins")] == ['spoiler.wins']
+
+def test_invalid_pack_keeps_the_last_good_version(pack_dir):
+    write_pack(pack_dir, {'name': 'tv_spoilers', 'version': '1.0', 'rules': {'spoiler.dies': ['dies']}}, 1)
+    reload_rule_packs()
+    good = aria_guardrail_rules._rule_sets['tv_spoilers']
+    write_pack(pack_dir, '{"name": "tv_spoilers", "version": "1.1", "rules": {', 2)
+    assert reload_rule_packs() == []
+    write_pack(pack_dir, {'name': 'tv_spoilers', 'version': '1.2', 'rules': {'spoiler.dies': 'dies'}}, 3)
+    assert reload_rule_packs() == []
+    assert aria_guardrail_rules._rule_sets['tv_spoilers'] is good
+    assert good.version == '1.0'
+
+@pytest.mark.parametrize('content', [
+    '[]',
+    '{"rules": {"spoiler.dies": ["dies"]}}',
+    '{"version": "1", "rules": {"spoiler.dies": [3]}}',
+])
+def test_read_rule_pack_rejects_malformed_packs(tmp_path, content):
+    with pytest.raises(ValueError):
+        read_rule_pack(str(write_pack(tmp_path, content, 1)))
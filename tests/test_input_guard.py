@@ -0,0 +1,44 @@
+import pytest
+
+from aria_input_guard import avoided_terms, excluded_terms, requested_dish
+from aria_keyword_matcher import KeywordMatcher
+
+FOODS = KeywordMatcher({'food': ['peanut', 'peanuts', 'sesame', 'eggs', 'dairy', 'soy', 'sodium', 'gluten', 'lactose']})
+
+def _avoided(text):
+    return avoided_terms(text, [(term, start, end) for term, _, start, end in FOODS.finditer(text, longest_only=True)])
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("I am allergic to peanuts and sesame", ['peanuts', 'sesame']),
+    ("my son has a peanut allergy", ['peanut']),
+    ("gluten-free please", ['gluten']),
+    ("no dairy or soy please", ['dairy', 'soy']),
+    ("No eggs.", ['eggs']),
+    ("I follow a low sodium diet", ['sodium']),
+    ("keep it low in sodium", ['sodium']),
+])
+def test_avoidance_cues(text, expected):
+    assert _avoided(text) == expected
+
+@pytest.mark.parametrize('text', [
+    "I have no peanut allergy",
+    "I am not lactose intolerant",
+    "I don't have a soy allergy",
+    "we have no eggs at home",
+    "simmer on low heat with the eggs",
+    "I love peanuts and sesame",
+])
+def test_mentions_and_negations_are_not_avoidances(text):
+    assert _avoided(text) == []
+
+def test_requested_dish_and_its_exclusions():
+    request = requested_dish("give me a recipe for gluten-free bread for 2 people")
+    assert request.dish == 'bread' and request.excluded == ['gluten']
+    assert requested_dish("I want to cook a curry without dairy or nuts").excluded == ['dairy or nuts']
+    assert requested_dish("what time is it") is None
+
+def test_excluded_terms_of_ingredient_lines():
+    assert excluded_terms("100 g dairy-free cheese") == ['dairy']
+    assert excluded_terms("2 tbsp vegan butter") == ['vegan']
+    assert excluded_terms("1 cup flour") == []
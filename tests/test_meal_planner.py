@@ -0,0 +1,56 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from scenarios.meal_planner import MealPlanner
+
+RECIPE_REQUEST = "I am vegetarian, 4 people. Give me a recipe for vegetable curry"
+
+
+@pytest.fixture
+def planner():
+    # the model endpoint is unreachable, so recipes come from the local corpus
+    planner = MealPlanner()
+    planner.OpenConnection({'API_KEY': 'key', 'API_ENDPOINT': 'http://localhost:0'})
+    planner.StartSession()
+    with mock.patch('requests.post', side_effect=requests.exceptions.ConnectionError('offline')):
+        yield planner
+
+def _rescaled(planner, turn):
+    planner.GetResponse(turn)
+    return planner.turn_metrics.get('rescaled')
+
+@pytest.mark.parametrize('turn, people', [("we are 6 now", 6), ("2", 2), ("there will be 8 of us", 8)])
+def test_explicit_headcount_rescales_last_recipe(planner, turn, people):
+    planner.GetResponse(RECIPE_REQUEST)
+    assert planner.session_data['last_recipe']['servings'] == 4
+    assert _rescaled(planner, turn)['to'] == people
+    assert planner.session_data['last_recipe']['servings'] == people
+
+def test_more_people_never_scales_down(planner):
+    planner.GetResponse(RECIPE_REQUEST)
+    assert _rescaled(planner, "2 more people are joining") is None
+    assert planner.session_data['last_recipe']['servings'] == 4
+
+def test_no_headcount_no_rescale(planner):
+    planner.GetResponse(RECIPE_REQUEST)
+    assert _rescaled(planner, "We have extra guests coming tonight") is None
+
+def test_denied_allergy_is_not_recorded(planner):
+    planner.GetResponse("I have no peanut allergy")
+    assert planner.session_data['dietary_restrictions'] == []
+
+def test_declared_allergy_is_recorded(planner):
+    planner.GetResponse("I am allergic to peanuts")
+    assert planner.session_data['dietary_restrictions'] == ['peanuts']
+
+def test_rescale_replaces_the_recipe_in_the_grocery_plan(planner):
+    planner.GetResponse(RECIPE_REQUEST)
+    before = planner.session_data['grocery_plan'].to_dict()
+    planner.GetResponse("we are 8 now")
+    after = planner.session_data['grocery_plan'].to_dict()
+    assert after.keys() == before.keys()
+    for name, totals in after.items():
+        for dimension, total in totals.items():
+            assert total >= before[name][dimension], name
@@ -0,0 +1,61 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+import aria_ner_service
+from aria_ner import spacy_available
+from aria_ner_service import NERService
+
+
+class _SlowLoadingPool:
+    """Stands in for the worker pool: the pipeline takes `load_seconds` to load, then calls are quick."""
+
+    def __init__(self, load_seconds):
+        self.loaded = threading.Event()
+        threading.Timer(load_seconds, self.loaded.set).start()
+
+    def submit(self, fn, *args):
+        future = Future()
+
+        def run():
+            self.loaded.wait()
+            future.set_result(fn is aria_ner_service._warm_up or (['Paris'], True))
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+@pytest.fixture
+def slow_pool(monkeypatch):
+    monkeypatch.setattr(aria_ner_service, 'spacy_available', lambda: True)
+
+    def use(load_seconds):
+        monkeypatch.setattr(aria_ner_service, 'ProcessPoolExecutor', lambda **kwargs: _SlowLoadingPool(load_seconds))
+    return use
+
+def test_pipeline_load_does_not_count_against_the_call_timeout(slow_pool):
+    slow_pool(0.5)
+    service = NERService(timeout=0.1)
+    assert not service.start()
+    result = service.extract("Flights to Paris")
+    assert (result.entities, result.source, result.fallback) == (['Paris'], 'spacy', None)
+    assert service.start()
+
+def test_workers_that_never_load_fall_back(slow_pool, monkeypatch):
+    slow_pool(5.0)
+    monkeypatch.setattr(aria_ner_service, 'WARMUP_TIMEOUT', 0.1)
+    service = NERService(timeout=0.1)
+    result = service.extract("Flights to Paris")
+    assert result.fallback == 'warming_up' and result.entities == ['Flights', 'Paris']
+    assert service.stats()['fallbacks'] == {'warming_up': 1}
+
+@pytest.mark.skipif(spacy_available(), reason="spaCy is installed")
+def test_heuristic_answers_without_spacy():
+    service = NERService()
+    assert not service.start()
+    result = service.extract("We fly from Lima to Cusco")
+    assert (result.source, result.fallback) == ('regex', 'unavailable')
+    assert 'Lima' in result.entities and 'Cusco' in result.entities
@@ -0,0 +1,50 @@
+import threading
+
+import aria_recipe_parser
+from aria_recipe_parser import ParsedRecipe, parse_recipe, render_recipe_markdown, rescale_recipe
+
+RESPONSE = """## Dal Tadka (serves 2)
+
+**Ingredients:**
+- 1 cup toor dal
+- 2 tbsp ghee
+
+**Preparation Steps:**
+1. Boil the dal.
+2. Temper with ghee.
+
+**Grocery List:**
+- 1 cup toor dal
+- 2 tbsp ghee
+"""
+
+def test_markdown_sections_are_parsed():
+    recipe = parse_recipe(RESPONSE)
+    assert recipe.servings == 2
+    assert recipe.ingredients == ('1 cup toor dal', '2 tbsp ghee')
+    assert recipe.preparation_steps == ('boil the dal.', 'temper with ghee.')
+
+def test_rendered_recipe_is_returned_without_parsing():
+    recipe = rescale_recipe(parse_recipe(RESPONSE), 4)
+    markdown = render_recipe_markdown(recipe, "Rescaled.")
+    assert parse_recipe(markdown) is recipe
+    assert recipe.ingredients == ('2 cups toor dal', '1/4 cup ghee')
+
+def test_rendered_cache_is_bounded_under_concurrent_sessions():
+    errors = []
+
+    def session(number):
+        try:
+            for turn in range(200):
+                recipe = ParsedRecipe(f"Dish {number}-{turn}", {'ingredients': [f"{turn} g rice"]}, 1)
+                markdown = render_recipe_markdown(recipe)
+                parse_recipe(markdown)
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=session, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(aria_recipe_parser._rendered) <= aria_recipe_parser._RENDERED_CACHE_SIZE
@@ -0,0 +1,72 @@
+import pytest
+
+from aria_slot_filling import MAX_PROMPTS, SLOT_QUESTIONS, MealSlotFilling, parse_headcount
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("2 adults and a child", 3),
+    ("family of 4", 4),
+    ("just me", 1),
+    ("we are 6 now", 6),
+    ("we're 5 tonight", 5),
+    ("there will be 4 of us", 4),
+    ("all 3 of us are vegetarian", 3),
+    ("we are 6 people now", 6),
+])
+def test_headcount_phrasings(text, expected):
+    assert parse_headcount(text) == expected
+
+@pytest.mark.parametrize('text', [
+    "I am a person with diabetes",
+    "we are 3 hours away",
+    "add 2 cups of rice",
+    "someone2 people",
+])
+def test_no_headcount(text):
+    assert parse_headcount(text) is None
+
+def test_bare_number_only_when_asked():
+    assert parse_headcount("4") is None
+    assert parse_headcount("4", bare_number=True) == 4
+    assert parse_headcount("four.", bare_number=True) == 4
+
+
+def test_asks_restrictions_then_household():
+    slots, session = MealSlotFilling(), {}
+    assert slots.step("give me a recipe for dal", session) == SLOT_QUESTIONS['restrictions']
+    assert slots.state == 'awaiting_restrictions'
+    session['dietary_restrictions'] = ['vegetarian']
+    assert slots.step("vegetarian please", session) == SLOT_QUESTIONS['household']
+    assert slots.step("4", session) is None
+    assert slots.state == 'idle'
+    assert slots.headcount == 4
+
+def test_other_turns_go_to_the_model():
+    slots = MealSlotFilling()
+    assert slots.step("what is a good side for dal?", {}) is None
+    assert slots.state == 'idle'
+
+def test_declining_closes_the_slot():
+    slots, session = MealSlotFilling(), {}
+    slots.step("give me a recipe for dal", session)
+    assert slots.step("none", session) == SLOT_QUESTIONS['household']
+    assert 'restrictions' in slots.declined
+    assert slots.step("no", session) is None
+    assert slots.missing_slots(session) == []
+
+def test_no_restrictions_anywhere_in_the_message():
+    slots = MealSlotFilling()
+    assert slots.step("I want to cook a curry, no restrictions, 2 people", {}) is None
+    assert slots.headcount == 2
+
+def test_stops_asking_after_max_prompts():
+    slots, session = MealSlotFilling(), {'dietary_restrictions': ['vegan']}
+    asked = [slots.step("give me a recipe for stew", session) for _ in range(MAX_PROMPTS + 1)]
+    assert asked[:MAX_PROMPTS] == [SLOT_QUESTIONS['household']] * MAX_PROMPTS
+    assert asked[MAX_PROMPTS] is None
+    assert slots.state == 'idle'
+
+def test_bare_number_resizes_the_last_recipe():
+    slots = MealSlotFilling()
+    assert slots.step("6", {'last_recipe': {'title': 'Dal'}}) is None
+    assert slots.headcount == 6
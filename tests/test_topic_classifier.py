@@ -0,0 +1,37 @@
+from unittest import mock
+
+import pytest
+
+from aria_topic_classifier import CONFIDENT_OFF_TOPIC, TARGET_FALSE_REDIRECT_RATE, get_topic_classifier
+
+
+@pytest.fixture(scope='module')
+def classifier():
+    return get_topic_classifier('meal_planner')
+
+def test_threshold_is_calibrated_on_held_out_examples(classifier):
+    assert classifier.false_redirect_rate <= TARGET_FALSE_REDIRECT_RATE
+
+@pytest.mark.parametrize('text', ["We have extra guests coming tonight", "What about a budget for the week?"])
+def test_in_scope_follow_ups_are_not_redirected(classifier, text):
+    assert not classifier.check(text)['bypass']
+
+def test_clear_off_topic_turn_is_redirected_during_a_recipe(classifier):
+    assert classifier.check("What's the capital of France?", in_context=True)['bypass']
+
+def test_short_elliptical_turn_is_kept_during_a_recipe(classifier):
+    with mock.patch.object(classifier, 'probability', return_value=classifier.threshold):
+        assert classifier.check("and for the kids?")['bypass']
+        result = classifier.check("and for the kids?", in_context=True)
+    assert result['follow_up'] and not result['bypass']
+
+def test_confident_redirect_is_not_suppressed_by_context(classifier):
+    with mock.patch.object(classifier, 'probability', return_value=max(CONFIDENT_OFF_TOPIC, classifier.threshold)):
+        result = classifier.check("tell me a joke", in_context=True)
+    assert not result['follow_up'] and result['bypass']
+
+def test_calibration_is_recorded_with_each_turn(classifier, capsys):
+    result = classifier.check("give me a recipe for chicken curry")
+    assert result['calibration']['false_redirect_rate'] == round(classifier.false_redirect_rate, 3)
+    assert result['calibration']['held_out'] > 0
+    assert capsys.readouterr().out == ''